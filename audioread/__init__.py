@@ -14,9 +14,12 @@
 
 """Multi-library, cross-platform audio decoding."""
 
-from . import ffdec
+import importlib
+import threading
+
 from .exceptions import DecodeError, NoBackendError
-from .base import AudioFile  # noqa
+from .base import AudioFile, is_fileobj  # noqa
+from .scheduler import BATCH, get_scheduler
 
 
 def _gst_available():
@@ -60,9 +63,16 @@ def _mad_available():
         return True
 
 
-# A cache for the available backends.
+# A cache for the available backends. A list, once published here, is
+# never changed: flushing the cache builds a new one and rebinds the
+# name, so callers iterating an earlier result are not disturbed.
 BACKENDS = []
 
+# Guards the detection of backends and updates to `BACKENDS`, so that
+# concurrent first calls detect the backends only once (and don't rely
+# on the GIL to avoid interleaving).
+_backends_lock = threading.Lock()
+
 
 def available_backends(flush_cache=False):
     """Returns a list of backends that are available on this system.
@@ -71,10 +81,15 @@ def available_backends(flush_cache=False):
     If the parameter `flush_cache` is set to `True`, then the cache
     will be flushed and the backend list will be reconstructed.
     """
+    with _backends_lock:
+        if BACKENDS and not flush_cache:
+            return BACKENDS
+        return _detect_backends()
 
-    if BACKENDS and not flush_cache:
-        return BACKENDS
 
+def _detect_backends():
+    """Fill the `BACKENDS` cache. Call with `_backends_lock` held."""
+    global BACKENDS
     # Standard-library WAV and AIFF readers.
     from . import rawread
     result = [rawread.RawAudioFile]
@@ -95,19 +110,62 @@ def available_backends(flush_cache=False):
         result.append(maddec.MadAudioFile)
 
     # FFmpeg.
+    from . import ffdec
     if ffdec.available():
         result.append(ffdec.FFmpegAudioFile)
 
     # Cache the backends we found
-    BACKENDS[:] = result
+    BACKENDS = result
+
+    return result
+
+
+def _close_when_done(future):
+    """Close the file produced by a future, if it produces one."""
+    def callback(future):
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+    future.add_done_callback(callback)
+
 
-    return BACKENDS
+def _race(path, backends, open_backend):
+    """Try all the backends on `path` at once, each in its own thread,
+    and return the file from the first backend in the list that
+    succeeds. The other files are closed as soon as they are opened.
+    """
+    import concurrent.futures
+    pool = concurrent.futures.ThreadPoolExecutor(len(backends))
+    futures = [pool.submit(open_backend, b, path) for b in backends]
+    pool.shutdown(wait=False)
+
+    try:
+        for i, future in enumerate(futures):
+            try:
+                audio_file = future.result()
+            except DecodeError:
+                continue
+            # Keep this one and discard the less-preferred ones.
+            for other in futures[i + 1:]:
+                _close_when_done(other)
+            return audio_file
+    except BaseException:
+        for other in futures:
+            _close_when_done(other)
+        raise
+
+    raise NoBackendError()
 
 
-def audio_open(path, backends=None):
+def audio_open(path, backends=None, priority=BATCH, race=False):
     """Open an audio file using a library that is available on this
     system.
 
+    `path` may be a filesystem path, a binary file object, or a
+    bytes-like object holding the contents of an audio file. A
+    seekable file object is rewound before each backend is tried;
+    unseekable streams can only be handed to a single backend, so pass
+    an explicit `backends` list for those.
+
     The optional `backends` parameter can be a list of audio file
     classes to try opening the file with. If it is not provided,
     `audio_open` tries all available backends. If you call this function
@@ -115,17 +173,63 @@ def audio_open(path, backends=None):
     backends every time by calling `available_backends` once and passing
     the result to each `audio_open` call.
 
+    If a `Scheduler` has been installed with
+    `audioread.scheduler.set_scheduler`, each backend is only tried once
+    the scheduler grants it a slot, in order of `priority`.
+
+    With `race=True`, the backends are tried concurrently instead of
+    one after another, so a slow failure doesn't delay the next backend.
+    The result is the same file that trying them in order would give:
+    the first backend in the list that can read the file wins, and the
+    files opened by the others are closed. File objects can't be shared
+    between backends, so they are always tried in order.
+
     If all backends fail to read the file, a NoBackendError exception is
     raised.
     """
     if backends is None:
         backends = available_backends()
 
+    start = None
+    if is_fileobj(path) and path.seekable():
+        start = path.tell()
+
+    scheduler = get_scheduler()
+
+    def open_backend(BackendClass, path):
+        if scheduler is None:
+            return BackendClass(path)
+        else:
+            return scheduler.open(BackendClass, path, priority)
+
+    if race and len(backends) > 1 and not is_fileobj(path):
+        return _race(path, backends, open_backend)
+
     for BackendClass in backends:
+        if start is not None:
+            path.seek(start)
         try:
-            return BackendClass(path)
+            return open_backend(BackendClass, path)
         except DecodeError:
             pass
 
     # All backends failed!
     raise NoBackendError()
+
+
+# Backend modules and helpers that are imported on first use, so that
+# importing the package itself stays cheap and free of side effects.
+_LAZY_MODULES = ('ffdec', 'gstdec', 'macca', 'maddec', 'rawread',
+                 'synth')
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name == 'open_sequence':
+        from .prefetch import open_sequence
+        globals()['open_sequence'] = open_sequence
+        return open_sequence
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name)
+    )
@@ -12,7 +12,175 @@
 # The above copyright notice and this permission notice shall be
 # included in all copies or substantial portions of the Software.
 
+import collections
+import functools
+import io
+import time
+
+# The period, in seconds, over which the current decoding speed is
+# measured.
+SPEED_WINDOW = 2.0
+
+Progress = collections.namedtuple(
+    'Progress',
+    ['frames', 'seconds', 'fraction', 'speed', 'average_speed', 'eta'],
+)
+Progress.__doc__ = """A snapshot of how far decoding has come.
+
+`frames` and `seconds` measure the audio delivered so far; `fraction`
+is the part of the file's duration that covers. `speed` (over the
+last few seconds) and `average_speed` (since the file was opened) are
+in seconds of audio per second of wall-clock time, so 1.0 is realtime.
+`eta` is the estimated number of seconds until the end. `fraction` and
+`eta` are None when they can't be estimated.
+"""
+
+
+class _Meter:
+    """Counts the bytes of PCM delivered by an audio file over time."""
+    def __init__(self):
+        self.start = time.monotonic()
+        self.nbytes = 0
+        # Recent (time, bytes) marks, for the current speed.
+        self.marks = collections.deque([(self.start, 0)])
+
+    def add(self, nbytes):
+        self.nbytes += nbytes
+        now = time.monotonic()
+        if now - self.marks[-1][0] >= SPEED_WINDOW / 16:
+            self.marks.append((now, self.nbytes))
+            while now - self.marks[0][0] > SPEED_WINDOW and \
+                    len(self.marks) > 2:
+                self.marks.popleft()
+
+
+def _releasing_slot(close):
+    """Wrap a `close` method so that it also gives back the scheduler
+    slot held by the file, if any (see `scheduler.Slot.attach`).
+    """
+    @functools.wraps(close)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return close(self, *args, **kwargs)
+        finally:
+            slot = getattr(self, '__dict__', {}).pop('_slot', None)
+            if slot is not None:
+                slot.release()
+    return wrapper
+
 
 class AudioFile:
     """The base class for all audio file types.
+
+    Backends report each block they deliver to `_advance`, which keeps
+    the `progress` statistics. Their `close` methods are wrapped to
+    release the file's scheduler slot.
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'close' in cls.__dict__:
+            cls.close = _releasing_slot(cls.__dict__['close'])
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        self._meter = _Meter()
+        return self
+
+    def _advance(self, nbytes):
+        """Record that `nbytes` bytes of PCM have been delivered."""
+        self._meter.add(nbytes)
+
+    @property
+    def progress(self):
+        """A `Progress` snapshot for the audio read so far. It may be
+        read from any thread.
+        """
+        meter = self._meter
+        now = time.monotonic()
+        nbytes = meter.nbytes
+        bytes_per_second = 2.0 * self.channels * self.samplerate
+        seconds = nbytes / bytes_per_second
+
+        elapsed = now - meter.start
+        average = seconds / elapsed if elapsed > 0 else 0.0
+        mark_time, mark_bytes = meter.marks[0]
+        if now > mark_time:
+            speed = (nbytes - mark_bytes) / bytes_per_second / \
+                (now - mark_time)
+        else:
+            speed = average
+
+        duration = self.duration
+        fraction = eta = None
+        if duration:
+            fraction = min(seconds / duration, 1.0)
+            if average > 0:
+                eta = max(duration - seconds, 0.0) / average
+        return Progress(nbytes // (2 * self.channels), seconds, fraction,
+                        speed, average, eta)
+
+    @property
+    def nframes(self):
+        """The number of frames (samples per channel) in the file.
+
+        Backends override this with an exact count where they can get
+        one without decoding; this fallback derives it from the
+        duration.
+        """
+        return int(round(self.duration * self.samplerate))
+
+    def read_planar(self):
+        """Generate blocks of audio in planar layout: a tuple holding,
+        for each channel, a contiguous `bytes` object of that channel's
+        16-bit little-endian samples.
+
+        Each block is split with one strided copy per channel (done by
+        `memoryview` in C, without decoding the samples). A frame that
+        straddles two blocks from the backend is carried over to the
+        next block.
+        """
+        channels = self.channels
+        frame_size = 2 * channels
+        leftover = b''
+        for block in self:
+            if leftover:
+                block = leftover + block
+            usable = len(block) - len(block) % frame_size
+            leftover = block[usable:]
+            if not usable:
+                continue
+            samples = memoryview(block)[:usable].cast('h')
+            yield tuple(samples[c::channels].tobytes()
+                        for c in range(channels))
+
+
+def is_buffer(source):
+    """Determine whether `source` is an in-memory buffer of encoded
+    audio (a bytes-like object) rather than a path or a file object.
+    """
+    return isinstance(source, (bytes, bytearray, memoryview))
+
+
+def is_fileobj(source):
+    """Determine whether `source` is a readable file-like object."""
+    return hasattr(source, 'read')
+
+
+def is_path(source):
+    """Determine whether `source` names a file on the filesystem."""
+    return not is_buffer(source) and not is_fileobj(source)
+
+
+def open_source(source):
+    """Get a binary file object for a path, a file-like object, or a
+    buffer.
+
+    Returns a ``(fh, owned)`` pair; `owned` indicates that the file
+    object was created here and should be closed by the caller.
     """
+    if is_buffer(source):
+        return io.BytesIO(source), True
+    elif is_fileobj(source):
+        return source, False
+    else:
+        return open(source, 'rb'), True
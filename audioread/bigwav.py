@@ -0,0 +1,170 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Read PCM from WAV files larger than 4 GiB: RF64, BW64 (EBU Tech
+3306 and ITU-R BS.2088, which store 64-bit sizes in a ``ds64`` chunk),
+and Sony Wave64 (which uses GUIDs and 64-bit sizes for every chunk).
+
+The reader streams the data chunk from a seekable binary file and has
+the same interface as the standard library's ``wave`` module readers,
+so `RawAudioFile` can use it in their place.
+"""
+import struct
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# A 32-bit size field that defers to the ds64 chunk.
+DS64_SIZE = 0xFFFFFFFF
+
+# Wave64 GUIDs, in their on-disk byte order.
+_W64_SUFFIX = b'\xf3\xac\xd3\x11\x8c\xd1\x00\xc0\x4f\x8e\xdb\x8a'
+W64_RIFF = b'riff\x2e\x91\xcf\x11\xa5\xd6\x28\xdb\x04\xc1\x00\x00'
+W64_WAVE = b'wave' + _W64_SUFFIX
+W64_FMT = b'fmt ' + _W64_SUFFIX
+W64_DATA = b'data' + _W64_SUFFIX
+
+
+class Error(Exception):
+    """The file is not a readable RF64, BW64, or Wave64 file."""
+
+
+def _read(fh, size):
+    data = fh.read(size)
+    if len(data) < size:
+        raise EOFError()
+    return data
+
+
+def _rf64_chunks(fh):
+    """Find the ``fmt `` chunk's contents and the data chunk's offset
+    and size in an RF64 or BW64 file, positioned after the header.
+    """
+    chunk_id, size = struct.unpack('<4sI', _read(fh, 8))
+    if chunk_id != b'ds64' or size < 24:
+        raise Error('missing ds64 chunk')
+    ds64 = _read(fh, size + (size & 1))
+    _, data_size = struct.unpack('<QQ', ds64[:16])
+
+    fmt = None
+    while True:
+        header = fh.read(8)
+        if len(header) < 8:
+            raise Error('no data chunk')
+        chunk_id, size = struct.unpack('<4sI', header)
+        if chunk_id == b'fmt ':
+            fmt = _read(fh, size + (size & 1))[:size]
+        elif chunk_id == b'data':
+            if size == DS64_SIZE:
+                size = data_size
+            return fmt, fh.tell(), size
+        else:
+            fh.seek(size + (size & 1), 1)
+
+
+def _w64_chunks(fh):
+    """Find the ``fmt `` chunk's contents and the data chunk's offset
+    and size in a Wave64 file, positioned after the header.
+    """
+    fmt = None
+    while True:
+        header = fh.read(24)
+        if len(header) < 24:
+            raise Error('no data chunk')
+        guid, size = header[:16], struct.unpack('<Q', header[16:])[0]
+        if size < 24:
+            raise Error('bad chunk size')
+        # Sizes include the chunk header; chunks are 8-byte aligned.
+        body = size - 24
+        if guid == W64_FMT:
+            fmt = _read(fh, body)
+            fh.seek(-body % 8, 1)
+        elif guid == W64_DATA:
+            return fmt, fh.tell(), body
+        else:
+            fh.seek(body + (-body % 8), 1)
+
+
+class Wave64Reader:
+    """Read integer PCM from an RF64, BW64, or Wave64 file."""
+    def __init__(self, fh):
+        self._fh = fh
+        magic = _read(fh, 12)
+        if magic[:4] in (b'RF64', b'BW64') and magic[8:] == b'WAVE':
+            fmt, offset, size = _rf64_chunks(fh)
+        elif magic == W64_RIFF[:12]:
+            # The rest of the GUID, the file size, and the WAVE GUID.
+            rest = _read(fh, 28)
+            if rest[:4] != W64_RIFF[12:] or rest[12:] != W64_WAVE:
+                raise Error('not a Wave64 file')
+            fmt, offset, size = _w64_chunks(fh)
+        else:
+            raise Error('not an RF64, BW64, or Wave64 file')
+
+        if fmt is None or len(fmt) < 16:
+            raise Error('missing fmt chunk')
+        tag, self._channels, self._framerate, _, self._align, bits = \
+            struct.unpack('<HHIIHH', fmt[:16])
+        if tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+            tag, = struct.unpack('<H', fmt[24:26])
+        if tag != WAVE_FORMAT_PCM:
+            raise Error('unsupported format {:#x}'.format(tag))
+        if not self._channels or self._align % self._channels:
+            raise Error('bad block alignment')
+        self._sampwidth = self._align // self._channels
+        if not bits or self._sampwidth != (bits + 7) // 8:
+            raise Error('bad sample size')
+
+        self._offset = offset
+        self._nframes = size // self._align
+        self._pos = 0
+
+    def getnchannels(self):
+        return self._channels
+
+    def getsampwidth(self):
+        return self._sampwidth
+
+    def getframerate(self):
+        return self._framerate
+
+    def getnframes(self):
+        return self._nframes
+
+    def getcomptype(self):
+        return 'NONE'
+
+    def readframes(self, nframes):
+        """Read up to `nframes` frames of little-endian PCM."""
+        nframes = min(nframes, self._nframes - self._pos)
+        if nframes <= 0:
+            return b''
+        self._fh.seek(self._offset + self._pos * self._align)
+        data = self._fh.read(nframes * self._align)
+        # Drop a partial frame at the end of a truncated file.
+        data = data[:len(data) - len(data) % self._align]
+        self._pos += len(data) // self._align
+        if not data:
+            # The file is shorter than its header says.
+            self._nframes = self._pos
+        return data
+
+    def close(self):
+        # The file handle belongs to the caller.
+        self._fh = None
+
+
+def open(fh):
+    """Open a seekable binary file object for reading."""
+    return Wave64Reader(fh)
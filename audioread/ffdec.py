@@ -16,24 +16,68 @@
 output.
 """
 
+import concurrent.futures
+import itertools
+import os
 import queue
 import re
+import shutil
 import subprocess
 import sys
 import threading
 import time
-from io import DEFAULT_BUFFER_SIZE
+from io import DEFAULT_BUFFER_SIZE, BytesIO
 
+from . import mpeg
 from .exceptions import DecodeError
-from .base import AudioFile
+from .base import AudioFile, is_buffer, is_path
 
 COMMANDS = ('ffmpeg', 'avconv')
+PROBE_COMMANDS = ('ffprobe',)
+
+# Bounds on the automatic segment length, in seconds, for
+# SegmentedFFmpegAudioFile.
+MIN_SEGMENT_DURATION = 30.0
+MAX_SEGMENT_DURATION = 300.0
+
+# Seconds of audio each segment after the first decodes, and discards,
+# before its boundary. Compressed formats like MP3 need this to rebuild
+# the decoder state (such as the bit reservoir) that a seek throws away.
+SEGMENT_PREROLL = 1.0
+
+# Seconds at the end of each segment that are compared with the next
+# segment's pre-roll, to check that its seek was exact.
+SEGMENT_CHECK = 0.1
+
+# Seconds each segment's process decodes past the segment's end, so
+# that rounding in FFmpeg's duration limit never cuts it short.
+SEGMENT_MARGIN = 0.1
+
+# Decoded blocks the first segment's process may buffer ahead of the
+# consumer. Its length isn't known when it is started.
+FIRST_SEGMENT_BLOCKS = 64
 
 if sys.platform == "win32":
     PROC_FLAGS = 0x08000000
 else:
     PROC_FLAGS = 0
 
+# Extra arguments for `subprocess.Popen` when launching a command by its
+# absolute path. Python 3.10+ already spawns with vfork on Linux. Before
+# that, leaving file descriptors open is what lets Python use
+# `posix_spawn` instead of a full fork+exec; this only affects
+# descriptors deliberately made inheritable, since those created by
+# Python are non-inheritable by default (PEP 446).
+if os.name == 'posix' and sys.version_info < (3, 10):
+    SPAWN_ARGS = {'close_fds': False}
+else:
+    SPAWN_ARGS = {}
+
+# Absolute paths found by `find_command`, keyed by the tuple of
+# candidate command names.
+_command_paths = {}
+_command_lock = threading.Lock()
+
 
 class FFmpegError(DecodeError):
     pass
@@ -57,15 +101,16 @@ class ReadTimeoutError(FFmpegError):
 
 class QueueReaderThread(threading.Thread):
     """A thread that consumes data from a filehandle and sends the data
-    over a Queue.
+    over a Queue. If `max_blocks` is nonzero, the thread stops reading
+    while that many blocks are waiting in the queue.
     """
-    def __init__(self, fh, blocksize=1024, discard=False):
+    def __init__(self, fh, blocksize=1024, discard=False, max_blocks=0):
         super().__init__()
         self.fh = fh
         self.blocksize = blocksize
         self.daemon = True
         self.discard = discard
-        self.queue = None if discard else queue.Queue()
+        self.queue = None if discard else queue.Queue(max_blocks)
 
     def run(self):
         while True:
@@ -76,6 +121,86 @@ class QueueReaderThread(threading.Thread):
                 # Stream closed (EOF).
                 break
 
+    def drain(self):
+        """Discard the queued data, making room for the thread to put
+        more.
+        """
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+
+class WriterThread(threading.Thread):
+    """A thread that copies data from a file-like object or a buffer
+    into a filehandle and closes the filehandle when the data is
+    exhausted.
+    """
+    def __init__(self, fh, source, blocksize=DEFAULT_BUFFER_SIZE * 8):
+        super().__init__()
+        self.fh = fh
+        self.source = source
+        self.blocksize = blocksize
+        self.daemon = True
+        # An exception raised while reading the source, if any.
+        self.exc = None
+        # Held while reading a file object, so that its position can
+        # be borrowed (see `FFmpegAudioFile._piped_mpeg_info`).
+        self.lock = threading.Lock()
+
+    def _blocks(self):
+        if is_buffer(self.source):
+            view = memoryview(self.source)
+            for i in range(0, len(view), self.blocksize):
+                yield view[i:i + self.blocksize]
+        else:
+            while True:
+                with self.lock:
+                    data = self.source.read(self.blocksize)
+                if not data:
+                    break
+                yield data
+
+    def run(self):
+        try:
+            for data in self._blocks():
+                self.fh.write(data)
+        except (BrokenPipeError, ValueError):
+            # The process exited (or the pipe was closed) before
+            # consuming all of its input.
+            pass
+        except Exception as exc:
+            self.exc = exc
+        finally:
+            try:
+                self.fh.close()
+            except OSError:
+                pass
+
+
+def find_command(commands, flush=False):
+    """Return the absolute path of the first of `commands` that can be
+    found on the PATH, or None if there is none.
+
+    A successful search is cached, so the PATH is only searched once
+    per set of commands; pass `flush` to search again.
+    """
+    key = tuple(commands)
+    with _command_lock:
+        if flush:
+            _command_paths.pop(key, None)
+        elif key in _command_paths:
+            return _command_paths[key]
+
+        for command in commands:
+            path = shutil.which(command)
+            if path:
+                path = os.path.abspath(path)
+                _command_paths[key] = path
+                return path
+        return None
+
 
 def popen_multiple(commands, command_args, *args, **kwargs):
     """Like `subprocess.Popen`, but can try multiple commands in case
@@ -85,7 +210,20 @@ def popen_multiple(commands, command_args, *args, **kwargs):
     the rest of the arguments that, when appended to the command name,
     make up the full first argument to `subprocess.Popen`. The
     other positional and keyword arguments are passed through.
+
+    The command is launched by the absolute path cached by
+    `find_command` (with `SPAWN_ARGS`, unless overridden) when it can be
+    found, and otherwise each name is tried in turn.
     """
+    path = find_command(commands)
+    if path is not None:
+        try:
+            return subprocess.Popen([path] + command_args, *args,
+                                    **dict(SPAWN_ARGS, **kwargs))
+        except OSError:
+            # The binary has gone away since it was found.
+            find_command(commands, flush=True)
+
     for i, command in enumerate(commands):
         cmd = [command] + command_args
         try:
@@ -114,14 +252,84 @@ def available():
         return proc.returncode == 0
 
 
+def probe_nframes(path):
+    """Use ffprobe to read the exact length, in frames, of the first
+    audio stream in a file from its container metadata. Return None if
+    ffprobe is unavailable or the length is unknown.
+    """
+    try:
+        proc = popen_multiple(
+            PROBE_COMMANDS,
+            ['-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'stream=sample_rate,time_base,duration_ts',
+             '-of', 'default=noprint_wrappers=1', path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            creationflags=PROC_FLAGS,
+        )
+    except OSError:
+        return None
+    out, _ = proc.communicate()
+    if proc.returncode != 0:
+        return None
+
+    fields = dict(
+        line.split('=', 1)
+        for line in out.decode('utf8', 'ignore').splitlines()
+        if '=' in line
+    )
+    try:
+        samplerate = int(fields['sample_rate'])
+        num, den = map(int, fields['time_base'].split('/'))
+        duration_ts = int(fields['duration_ts'])
+    except (KeyError, ValueError):
+        # Missing or "N/A".
+        return None
+    return (duration_ts * num * samplerate + den // 2) // den
+
+
+# The decoder delay, in samples, that FFmpeg skips at the start of an MP3
+# stream in addition to the encoder delay from the LAME tag.
+MP3_DECODER_DELAY = 529
+
+
 # For Windows error switch management, we need a lock to keep the mode
 # adjustment atomic.
 windows_error_mode_lock = threading.Lock()
 
 
 class FFmpegAudioFile(AudioFile):
-    """An audio file decoded by the ffmpeg command-line utility."""
-    def __init__(self, filename, block_size=DEFAULT_BUFFER_SIZE):
+    """An audio file decoded by the ffmpeg command-line utility.
+
+    `filename` may be a path, a binary file object, or a bytes-like
+    object holding the contents of the file. File objects and buffers
+    are fed to ffmpeg through its standard input, so formats that
+    require seeking (such as MP4 files with the index at the end)
+    can only be read from a path. FFmpeg also can't trim the encoder
+    padding from the end of an MP3 read from a pipe, so the audio is a
+    little longer than when the same file is read from a path (355004
+    rather than 352800 bytes for a 2-second stereo file, for example);
+    ``nframes`` accounts for this.
+
+    If `start` is given, decoding begins that many seconds into the
+    file. FFmpeg seeks in the input and then discards decoded audio up
+    to the exact position. If `end` is given, decoding stops (roughly)
+    that many seconds into the file.
+
+    Decoded blocks are queued until they are read. A nonzero
+    `max_blocks` bounds the queue; FFmpeg then waits for the consumer
+    whenever it is full.
+
+    With `lazy=True`, the constructor returns as soon as the process
+    has been spawned, without waiting for FFmpeg to report the stream
+    parameters; decoding proceeds in the background. ``channels``,
+    ``samplerate``, and ``duration`` then block until they are known,
+    and raise the usual `DecodeError` if the file can't be read. The
+    ``ready`` future resolves (to None) at the same moment.
+    """
+    def __init__(self, filename, block_size=DEFAULT_BUFFER_SIZE, start=None,
+                 lazy=False, end=None, max_blocks=0):
         # On Windows, we need to disable the subprocess's crash dialog
         # in case it dies. Passing SEM_NOGPFAULTERRORBOX to SetErrorMode
         # disables this behavior.
@@ -138,13 +346,42 @@ class FFmpegAudioFile(AudioFile):
                 previous_error_mode | SEM_NOGPFAULTERRORBOX
             )
 
+        self._path = None
+        self._format = None
+        self._nframes = None
+        self._source_start = None
+        if is_path(filename):
+            self._path = filename
+            source = None
+            stdin = subprocess.DEVNULL
+        else:
+            # Read the input from a pipe.
+            source, filename = filename, 'pipe:0'
+            stdin = subprocess.PIPE
+            if not is_buffer(source):
+                # Remember where the data starts, so the MPEG headers
+                # can be read for `nframes`.
+                try:
+                    if source.seekable():
+                        self._source_start = source.tell()
+                except (AttributeError, OSError, ValueError):
+                    pass
+        self._source = source
+
+        args = ['-i', filename]
+        if end is not None:
+            args += ['-t', '{:.6f}'.format(end - (start or 0))]
+        args += ['-f', 's16le', '-']
+        if start:
+            args = ['-ss', '{:.6f}'.format(start)] + args
+
         try:
             self.proc = popen_multiple(
                 COMMANDS,
-                ['-i', filename, '-f', 's16le', '-'],
+                args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                stdin=subprocess.DEVNULL,
+                stdin=stdin,
                 creationflags=PROC_FLAGS,
             )
 
@@ -162,22 +399,75 @@ class FFmpegAudioFile(AudioFile):
                 finally:
                     windows_error_mode_lock.release()
 
+        # Feed the input to the process from another thread.
+        if source is not None:
+            self.stdin_writer = WriterThread(self.proc.stdin, source)
+            self.stdin_writer.start()
+
         # Start another thread to consume the standard output of the
         # process, which contains raw audio data.
-        self.stdout_reader = QueueReaderThread(self.proc.stdout, block_size)
+        self.stdout_reader = QueueReaderThread(self.proc.stdout, block_size,
+                                               max_blocks=max_blocks)
         self.stdout_reader.start()
 
-        # Read relevant information from stderr.
-        self._get_info()
+        # Read relevant information from stderr, either now or in
+        # the background.
+        self.ready = concurrent.futures.Future()
+        if lazy:
+            self._info_thread = threading.Thread(target=self._read_info)
+            self._info_thread.daemon = True
+            self._info_thread.start()
+        else:
+            self._read_info()
+            try:
+                self.ready.result()
+            except BaseException:
+                self.close()
+                raise
+
+    def _read_info(self):
+        """Parse the stream information from stderr and resolve the
+        `ready` future.
+        """
+        try:
+            self._get_info()
+        except BaseException as exc:
+            self.ready.set_exception(exc)
+            return
 
         # Start a separate thread to read the rest of the data from
         # stderr. This (a) avoids filling up the OS buffer and (b)
         # collects the error output for diagnosis.
         self.stderr_reader = QueueReaderThread(self.proc.stderr)
         self.stderr_reader.start()
+        # The result is not the file itself, which would make a
+        # reference cycle and keep abandoned files (and their
+        # processes) alive until the garbage collector runs.
+        self.ready.set_result(None)
+
+    @property
+    def channels(self):
+        """Number of audio channels."""
+        self.ready.result()
+        return self._channels
+
+    @property
+    def samplerate(self):
+        """Sample rate in Hz."""
+        self.ready.result()
+        return self._samplerate
+
+    @property
+    def duration(self):
+        """Length of the audio in seconds (a float)."""
+        self.ready.result()
+        return self._duration
 
     def read_data(self, timeout=10.0):
         """Read blocks of raw PCM data from the file."""
+        # Make sure the stream opened successfully.
+        self.ready.result()
+
         # Read from stdout in a separate thread and consume data from
         # the queue.
         start_time = time.time()
@@ -187,9 +477,16 @@ class FFmpegAudioFile(AudioFile):
             try:
                 data = self.stdout_reader.queue.get(timeout=timeout)
                 if data:
+                    self._advance(len(data))
                     yield data
                 else:
-                    # End of file.
+                    # End of file. Give the writer a chance to finish
+                    # before looking at its error.
+                    writer = getattr(self, 'stdin_writer', None)
+                    if writer is not None:
+                        writer.join(timeout)
+                        if writer.exc is not None:
+                            raise writer.exc
                     break
             except queue.Empty:
                 # Queue read timed out.
@@ -227,6 +524,11 @@ class FFmpegAudioFile(AudioFile):
                 raise OSError('file not found')
             elif 'invalid data found' in line:
                 raise UnsupportedError()
+            elif line.startswith('input #'):
+                # The container format, like "input #0, mp3, from ...".
+                match = re.match(r'input #\d+, ([^,]+),', line)
+                if match:
+                    self._format = match.group(1)
             elif 'duration:' in line:
                 out_parts.append(line)
             elif 'audio:' in line:
@@ -241,41 +543,104 @@ class FFmpegAudioFile(AudioFile):
         # Sample rate.
         match = re.search(r'(\d+) hz', s)
         if match:
-            self.samplerate = int(match.group(1))
+            self._samplerate = int(match.group(1))
         else:
-            self.samplerate = 0
+            self._samplerate = 0
 
         # Channel count.
         match = re.search(r'hz, ([^,]+),', s)
         if match:
             mode = match.group(1)
             if mode == 'stereo':
-                self.channels = 2
+                self._channels = 2
             else:
                 cmatch = re.match(r'(\d+)\.?(\d)?', mode)
                 if cmatch:
-                    self.channels = sum(map(int, cmatch.group().split('.')))
+                    self._channels = sum(map(int, cmatch.group().split('.')))
                 else:
-                    self.channels = 1
+                    self._channels = 1
         else:
-            self.channels = 0
+            self._channels = 0
 
         # Duration.
         match = re.search(
-            r'duration: (\d+):(\d+):(\d+).(\d)', s
+            r'duration: (\d+):(\d+):(\d+(?:\.\d+)?)', s
         )
         if match:
-            durparts = list(map(int, match.groups()))
-            duration = (
-                durparts[0] * 60 * 60 +
-                durparts[1] * 60 +
-                durparts[2] +
-                float(durparts[3]) / 10
+            hours, minutes, seconds = match.groups()
+            self._duration = (
+                int(hours) * 60 * 60 +
+                int(minutes) * 60 +
+                float(seconds)
             )
-            self.duration = duration
         else:
-            # No duration found.
-            self.duration = 0
+            # No duration found (as when reading from a pipe).
+            self._duration = 0
+        self._has_duration = match is not None
+
+    @property
+    def nframes(self):
+        """The exact number of frames in the stream.
+
+        For MP3 files this is computed from the Xing and LAME tags (or
+        the frame headers) and accounts for the encoder delay and
+        padding that FFmpeg trims. Other formats are measured with
+        ``ffprobe``. When neither works, the value is estimated from
+        the duration. For a stream read from a pipe, which has no
+        duration, the MP3 headers are read from a buffer or a seekable
+        file object; otherwise the length is unknown and this is None.
+        """
+        if self._nframes is None:
+            # The container format is only known once the stream info
+            # has been read.
+            self.ready.result()
+            self._nframes = self._probe_nframes()
+        return self._nframes
+
+    def _probe_nframes(self):
+        if self._path is not None:
+            if self._format == 'mp3':
+                try:
+                    return mpeg.read_info_path(self._path).nframes
+                except (DecodeError, OSError):
+                    pass
+            nframes = probe_nframes(self._path)
+            if nframes is not None:
+                return nframes
+        elif self._format == 'mp3':
+            info = self._piped_mpeg_info()
+            if info is not None:
+                # FFmpeg trims the delays at the start of a piped MP3
+                # but can't find the end of the stream to trim the
+                # padding there.
+                return info.nframes + max(
+                    info.encoder_padding - MP3_DECODER_DELAY, 0
+                )
+        if not self._has_duration:
+            return None
+        return super().nframes
+
+    def _piped_mpeg_info(self):
+        """Read the MPEG headers of a buffer or seekable file object
+        that is being fed to FFmpeg. Return None if that isn't possible.
+        """
+        source = self._source
+        try:
+            if is_buffer(source):
+                return mpeg.read_info(BytesIO(source))
+            if self._source_start is None:
+                return None
+            # Borrow the file object from the writer thread and put it
+            # back where it was.
+            with self.stdin_writer.lock:
+                position = source.tell()
+                try:
+                    source.seek(self._source_start)
+                    return mpeg.read_info(source)
+                finally:
+                    source.seek(position)
+        except (DecodeError, OSError, ValueError):
+            return None
 
     def close(self):
         """Close the ffmpeg process used to perform the decoding."""
@@ -293,10 +658,20 @@ class FFmpegAudioFile(AudioFile):
 
             # Wait for the stream-reading threads to exit. (They need to
             # stop reading before we can close the streams.)
+            if hasattr(self, '_info_thread') and \
+                    self._info_thread is not threading.current_thread():
+                # This thread may start the stderr reader. (The file
+                # can be collected, and closed, in this very thread.)
+                self._info_thread.join()
             if hasattr(self, 'stderr_reader'):
                 self.stderr_reader.join()
             if hasattr(self, 'stdout_reader'):
-                self.stdout_reader.join()
+                # The reader may be waiting for room in a full queue.
+                while self.stdout_reader.is_alive():
+                    self.stdout_reader.drain()
+                    self.stdout_reader.join(0.01)
+            if hasattr(self, 'stdin_writer'):
+                self.stdin_writer.join()
 
             # Close the stdout and stderr streams that were opened by Popen,
             # which should occur regardless of if the process terminated
@@ -318,3 +693,197 @@ class FFmpegAudioFile(AudioFile):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
         return False
+
+
+class SegmentedFFmpegAudioFile(AudioFile):
+    """Decode one long file with several concurrent ffmpeg processes.
+
+    The file is split into consecutive time segments that are decoded
+    in parallel, up to `jobs` at a time (by default, one per CPU), and
+    the PCM is stitched back together in order, so iterating the
+    object yields one ordered stream of blocks just like
+    `FFmpegAudioFile`.
+
+    Segment boundaries fall on exact frame positions. Each process
+    after the first seeks to `SEGMENT_PREROLL` seconds before its
+    boundary and discards the audio up to it, which gives decoders
+    that carry state from one packet to the next (like MP3's) time to
+    produce the same output as a decode from the start. Each process
+    but the last is told to stop `SEGMENT_MARGIN` seconds after its
+    segment ends, and the output is cut at the exact frame. The end of
+    each pre-roll is checked against the end of the segment before it.
+    If they differ (because a seek in the file was not exact), or if a
+    process stops short, the rest of the file is decoded by a single
+    process from the start instead, so the output always matches
+    `FFmpegAudioFile`.
+
+    Segments that are decoded ahead of the consumer are buffered in
+    memory, and each one's queue is bounded by its length, so memory
+    use grows with `jobs` times `segment_duration` (plus the pre-roll).
+    The first process, which is started before the length of the file
+    is known, buffers at most `FIRST_SEGMENT_BLOCKS` blocks ahead.
+
+    Only files on the filesystem can be split. When FFmpeg does not
+    report the length of the file, it is decoded by one process.
+    """
+    def __init__(self, filename, jobs=None, segment_duration=None,
+                 block_size=DEFAULT_BUFFER_SIZE):
+        if not is_path(filename):
+            raise UnsupportedError('only files on disk can be split')
+        self._filename = filename
+        self._block_size = block_size
+        self._fallback = None
+        self.jobs = jobs or os.cpu_count() or 1
+
+        # The first segment's process also reports the stream info.
+        first = FFmpegAudioFile(filename, block_size,
+                                max_blocks=FIRST_SEGMENT_BLOCKS)
+        self.channels = first.channels
+        self.samplerate = first.samplerate
+        self.duration = first.duration
+        self._nframes = first.nframes
+
+        if self._nframes is None:
+            # Without a length, there is nothing to split.
+            self._segments = [[0, None, first, 0]]
+            return
+
+        if segment_duration is None:
+            segment_duration = max(
+                MIN_SEGMENT_DURATION,
+                min(MAX_SEGMENT_DURATION, self.duration / self.jobs),
+            )
+        segment_frames = max(int(segment_duration * self.samplerate), 1)
+        preroll = int(round(SEGMENT_PREROLL * self.samplerate))
+
+        # A list of [start frame, frame count or None, decoder or None,
+        # frame where decoding starts].
+        starts = list(range(0, max(self._nframes, 1), segment_frames))
+        self._segments = [
+            [start, segment_frames, None, max(start - preroll, 0)]
+            for start in starts
+        ]
+        self._segments[-1][1] = None
+        self._segments[0][2] = first
+
+    @property
+    def nframes(self):
+        return self._nframes
+
+    def _start_segment(self, index):
+        segment = self._segments[index]
+        if segment[2] is None:
+            start, length, _, decode_start = segment
+            end = max_blocks = None
+            if length is not None:
+                # Stop the process shortly after the segment, and hold
+                # no more than that in its queue.
+                end = (start + length) / self.samplerate + SEGMENT_MARGIN
+                frames = start + length - decode_start + \
+                    int(SEGMENT_MARGIN * self.samplerate)
+                max_blocks = -(-frames * 2 * self.channels //
+                               self._block_size) + 1
+            # Start the process without waiting for it to report the
+            # stream info, so the start-up of several segments overlaps.
+            segment[2] = FFmpegAudioFile(
+                self._filename, self._block_size,
+                start=decode_start / self.samplerate, lazy=True,
+                end=end, max_blocks=max_blocks or 0,
+            )
+        return segment[2]
+
+    def _read_from_start(self, start, timeout):
+        """Decode the file from the beginning in one process and
+        generate the PCM from frame `start` on.
+        """
+        self._fallback = FFmpegAudioFile(self._filename, self._block_size)
+        skip = start * 2 * self.channels
+        for data in self._fallback.read_data(timeout):
+            if skip:
+                cut = min(skip, len(data))
+                data = data[cut:]
+                skip -= cut
+                if not data:
+                    continue
+            self._advance(len(data))
+            yield data
+        self._fallback.close()
+
+    def read_data(self, timeout=10.0):
+        """Read blocks of raw PCM data from the file."""
+        frame_size = 2 * self.channels
+        check = int(SEGMENT_CHECK * self.samplerate) * frame_size
+        tail = b''
+        for index, (start, length, _, decode_start) in \
+                enumerate(self._segments):
+            # Keep `jobs` processes running, starting with this one.
+            for ahead in range(index, min(index + self.jobs,
+                                          len(self._segments))):
+                self._start_segment(ahead)
+
+            decoder = self._segments[index][2]
+            blocks = decoder.read_data(timeout)
+
+            # Drop the pre-roll, checking that its end matches the end
+            # of the previous segment.
+            preroll = (start - decode_start) * frame_size
+            head = bytearray()
+            for data in blocks:
+                head += data
+                if len(head) >= preroll:
+                    break
+            overlap = min(len(tail), preroll)
+            if len(head) < preroll or (overlap and
+                                       head[preroll - overlap:preroll] !=
+                                       tail[len(tail) - overlap:]):
+                # The seek was not exact.
+                self.close()
+                yield from self._read_from_start(start, timeout)
+                return
+            blocks = itertools.chain([bytes(head[preroll:])], blocks)
+
+            remaining = None if length is None else length * frame_size
+            tail = b''
+            for data in blocks:
+                if remaining is not None:
+                    if len(data) >= remaining:
+                        data = data[:remaining]
+                    remaining -= len(data)
+                if data:
+                    tail = (tail + data)[-check:]
+                    self._advance(len(data))
+                    yield data
+                if remaining == 0:
+                    break
+            if remaining:
+                # The process stopped before the end of its segment.
+                self.close()
+                yield from self._read_from_start(
+                    start + length - remaining // frame_size, timeout,
+                )
+                return
+
+            decoder.close()
+
+    def close(self):
+        """Close all the ffmpeg processes."""
+        for segment in getattr(self, '_segments', ()):
+            if segment[2] is not None:
+                segment[2].close()
+        if getattr(self, '_fallback', None) is not None:
+            self._fallback.close()
+
+    def __del__(self):
+        self.close()
+
+    # Iteration.
+    def __iter__(self):
+        return self.read_data()
+
+    # Context manager.
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
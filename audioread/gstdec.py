@@ -50,6 +50,7 @@ import gi
 gi.require_version('Gst', '1.0')
 from gi.repository import GLib, Gst
 
+import concurrent.futures
 import sys
 import threading
 import os
@@ -57,10 +58,13 @@ import queue
 from urllib.parse import quote
 
 from .exceptions import DecodeError
-from .base import AudioFile
+from .base import AudioFile, is_buffer, is_path
 
 QUEUE_SIZE = 10
 BUFFER_SIZE = 10
+# The size of the chunks pushed into the pipeline when reading from a
+# file object or buffer.
+PUSH_SIZE = 64 * 1024
 SENTINEL = '__GSTDEC_SENTINEL__'
 
 
@@ -114,7 +118,20 @@ class IncompleteGStreamerError(GStreamerError):
 _shared_loop_thread = None
 _loop_thread_lock = threading.RLock()
 
-Gst.init(None)
+# GStreamer is initialized when the first file is opened rather than on
+# import, so that importing this module has no side effects.
+_gst_initialized = False
+_gst_init_lock = threading.Lock()
+
+
+def init_gst():
+    """Initialize GStreamer if that hasn't been done yet."""
+    global _gst_initialized
+    with _gst_init_lock:
+        if not _gst_initialized:
+            Gst.init(None)
+            _gst_initialized = True
+
 
 def get_loop_thread():
     """Get the shared main-loop thread.
@@ -161,15 +178,32 @@ class GstAudioFile(AudioFile):
     with the object. Otherwise, the program is likely to hang on exit.
     Alternatively, of course, one can just use the file as a context
     manager, as shown above.
+
+    `path` may also be a binary file object or a bytes-like object
+    holding the contents of the file, in which case the data is pushed
+    into the pipeline through an ``appsrc`` element.
+
+    With `lazy=True`, the constructor returns as soon as the pipeline
+    is playing instead of waiting for the stream's caps. The stream
+    information is then resolved on first access (raising the usual
+    errors if the file can't be decoded), and the ``ready`` future
+    resolves (to None) once it is known.
     """
-    def __init__(self, path):
+    def __init__(self, path, lazy=False):
+        init_gst()
         self.running = False
         self.finished = False
 
         # Set up the Gstreamer pipeline.
         self.pipeline = Gst.Pipeline()
 
-        self.dec = Gst.ElementFactory.make("uridecodebin", None)
+        from_path = is_path(path)
+        if from_path:
+            self.src = None
+            self.dec = Gst.ElementFactory.make("uridecodebin", None)
+        else:
+            self.src = Gst.ElementFactory.make("appsrc", None)
+            self.dec = Gst.ElementFactory.make("decodebin", None)
         self.conv = Gst.ElementFactory.make("audioconvert", None)
         self.sink = Gst.ElementFactory.make("appsink", None)
 
@@ -177,6 +211,9 @@ class GstAudioFile(AudioFile):
             # uridecodebin, audioconvert, or appsink is missing. We need
             # gst-plugins-base.
             raise IncompleteGStreamerError()
+        if not from_path and self.src is None:
+            # appsrc is also in gst-plugins-base.
+            raise IncompleteGStreamerError()
 
         # Register for bus signals.
         bus = self.pipeline.get_bus()
@@ -185,8 +222,11 @@ class GstAudioFile(AudioFile):
         bus.connect("message::error", self._message)
 
         # Configure the input.
-        uri = 'file://' + quote(os.path.abspath(path))
-        self.dec.set_property("uri", uri)
+        if self.src is None:
+            uri = 'file://' + quote(os.path.abspath(path))
+            self.dec.set_property("uri", uri)
+        else:
+            self._setup_appsrc(path)
         # The callback to connect the input.
         self.dec.connect("pad-added", self._pad_added)
         self.dec.connect("no-more-pads", self._no_more_pads)
@@ -214,20 +254,26 @@ class GstAudioFile(AudioFile):
         self.sink.connect("new-sample", self._new_sample)
 
         # We'll need to know when the stream becomes ready and we get
-        # its attributes. This semaphore will become available when the
-        # caps are received. That way, when __init__() returns, the file
-        # (and its attributes) will be ready for reading.
-        self.ready_sem = threading.Semaphore(0)
+        # its attributes. This future will be resolved when the caps
+        # are received (or opening fails). That way, when __init__()
+        # returns, the file (and its attributes) will be ready for
+        # reading.
+        self.ready = concurrent.futures.Future()
+        self._ready_lock = threading.Lock()
         self.caps_handler = self.sink.get_static_pad("sink").connect(
             "notify::caps", self._notify_caps
         )
 
         # Link up everything but the decoder (which must be linked only
         # when it becomes ready).
+        if self.src is not None:
+            self.pipeline.add(self.src)
         self.pipeline.add(self.dec)
         self.pipeline.add(self.conv)
         self.pipeline.add(self.sink)
 
+        if self.src is not None:
+            self.src.link(self.dec)
         self.conv.link(self.sink)
 
         # Set up the queue for data and run the main thread.
@@ -241,14 +287,119 @@ class GstAudioFile(AudioFile):
         self.running = True
         self.got_caps = False
         self.pipeline.set_state(Gst.State.PLAYING)
-        self.ready_sem.acquire()
-        if self.read_exc:
-            # An error occurred before the stream became ready.
-            self.close(True)
-            raise self.read_exc
+        if not lazy:
+            try:
+                self.ready.result()
+            except BaseException:
+                # An error occurred before the stream became ready.
+                self.close(True)
+                raise
+
+    def _set_ready(self):
+        """Resolve the `ready` future, with `read_exc` if it is set.
+        Calls after the first have no effect.
+        """
+        with self._ready_lock:
+            if self.ready.done():
+                return
+            if self.read_exc:
+                self.ready.set_exception(self.read_exc)
+            else:
+                # Not the file itself, to avoid a reference cycle.
+                self.ready.set_result(None)
+
+    @property
+    def channels(self):
+        """Number of audio channels."""
+        self.ready.result()
+        return self._channels
+
+    @property
+    def samplerate(self):
+        """Sample rate in Hz."""
+        self.ready.result()
+        return self._samplerate
+
+    @property
+    def duration(self):
+        """Length of the audio in seconds (a float)."""
+        self.ready.result()
+        return self._duration
+
+    _nframes = None
+
+    @property
+    def nframes(self):
+        """The number of frames in the stream, as reported by the
+        decoder (or estimated from the duration when it can't say).
+        """
+        if self._nframes is not None:
+            return self._nframes
+        return super().nframes
+
+    def _setup_appsrc(self, source):
+        """Configure the appsrc element to read from a file object or
+        a buffer.
+        """
+        if is_buffer(source):
+            self._source = memoryview(source)
+            self._source_pos = 0
+            size = len(self._source)
+            seekable = True
+        else:
+            self._source = source
+            seekable = source.seekable()
+            if seekable:
+                self._source_start = source.tell()
+                size = source.seek(0, os.SEEK_END) - self._source_start
+                source.seek(self._source_start)
+            else:
+                size = -1
+
+        self.src.set_property('format', Gst.Format.BYTES)
+        # Knowing the size lets the demuxers estimate the duration.
+        self.src.set_property('size', size)
+        # GST_APP_STREAM_TYPE_SEEKABLE or GST_APP_STREAM_TYPE_STREAM.
+        self.src.set_property('stream-type', 1 if seekable else 0)
+        self.src.connect('need-data', self._need_data)
+        self.src.connect('seek-data', self._seek_data)
+
+    def _read_source(self, length):
+        """Read up to `length` bytes from the file object or buffer."""
+        if isinstance(self._source, memoryview):
+            pos = self._source_pos
+            data = self._source[pos:pos + length].tobytes()
+            self._source_pos += len(data)
+            return data
+        return self._source.read(length)
 
     # Gstreamer callbacks.
 
+    def _need_data(self, src, length):
+        """The callback for appsrc's "need-data" signal.
+        """
+        if not self.running:
+            return
+        try:
+            data = self._read_source(max(length, PUSH_SIZE))
+        except Exception as exc:
+            self.read_exc = FileReadError(str(exc))
+            src.emit('end-of-stream')
+            return
+        if data:
+            src.emit('push-buffer', Gst.Buffer.new_wrapped(data))
+        else:
+            src.emit('end-of-stream')
+
+    def _seek_data(self, src, offset):
+        """The callback for appsrc's "seek-data" signal.
+        """
+        if isinstance(self._source, memoryview):
+            self._source_pos = offset
+        else:
+            self._source.seek(self._source_start + offset)
+        return True
+
     def _notify_caps(self, pad, args):
         """The callback for the sinkpad's "notify::caps" signal.
         """
@@ -259,18 +410,22 @@ class GstAudioFile(AudioFile):
         info = pad.get_current_caps().get_structure(0)
 
         # Stream attributes.
-        self.channels = info.get_int('channels')[1]
-        self.samplerate = info.get_int('rate')[1]
+        self._channels = info.get_int('channels')[1]
+        self._samplerate = info.get_int('rate')[1]
 
         # Query duration.
         success, length = pad.get_peer().query_duration(Gst.Format.TIME)
         if success:
-            self.duration = length / 1000000000
+            self._duration = length / 1000000000
         else:
             self.read_exc = MetadataMissingError('duration not available')
 
+        # For raw audio, the "default" format counts samples.
+        success, length = pad.get_peer().query_duration(Gst.Format.DEFAULT)
+        self._nframes = length if success and length > 0 else None
+
         # Allow constructor to complete.
-        self.ready_sem.release()
+        self._set_ready()
 
     _got_a_pad = False
 
@@ -293,7 +448,7 @@ class GstAudioFile(AudioFile):
         # decodable stream, raise an exception.
         if not self._got_a_pad:
             self.read_exc = NoStreamError()
-            self.ready_sem.release()  # No effect if we've already started.
+            self._set_ready()  # No effect if we've already started.
 
     def _new_sample(self, sink):
         """The callback for appsink's "new-sample" signal.
@@ -335,7 +490,7 @@ class GstAudioFile(AudioFile):
             # Ignore non-audio (e.g., video) decode errors.
             return
         self.read_exc = UnknownTypeError(streaminfo)
-        self.ready_sem.release()
+        self._set_ready()
 
     def _message(self, bus, message):
         """The callback for GstBus's "message" signal (for two kinds of
@@ -349,7 +504,7 @@ class GstAudioFile(AudioFile):
                     # If the stream ends before _notify_caps was called, this
                     # is an invalid file.
                     self.read_exc = NoStreamError()
-                    self.ready_sem.release()
+                    self._set_ready()
 
             elif message.type == Gst.MessageType.ERROR:
                 gerror, debug = message.parse_error()
@@ -359,16 +514,19 @@ class GstAudioFile(AudioFile):
                     self.read_exc = IOError('resource not found')
                 else:
                     self.read_exc = FileReadError(debug)
-                self.ready_sem.release()
+                self._set_ready()
 
     # Iteration.
 
     def __next__(self):
+        # Make sure the stream opened successfully.
+        self.ready.result()
         # Wait for data from the Gstreamer callbacks.
         val = self.queue.get()
         if val == SENTINEL:
             # End of stream.
             raise StopIteration
+        self._advance(len(val))
         return val
 
     def __iter__(self):
@@ -390,7 +548,8 @@ class GstAudioFile(AudioFile):
             self.pipeline.get_bus().remove_signal_watch()
 
             # Stop reading the file.
-            self.dec.set_property("uri", None)
+            if self.src is None:
+                self.dec.set_property("uri", None)
             # Block spurious signals.
             self.sink.get_static_pad("sink").disconnect(self.caps_handler)
 
@@ -0,0 +1,260 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Hash decoded PCM while it is being read.
+
+A `Hasher` is fed the blocks of an audio file on their way to the
+consumer and computes a digest of the whole stream and, optionally, of
+each fixed-length segment, so content can be fingerprinted for
+deduplication without a second pass:
+
+    >>> with audioread.audio_open('something.mp3') as f:
+    >>>     hasher = Hasher.for_file(f, 'blake2b', segment=10.0)
+    >>>     for block in hasher.tap(f):
+    >>>         do_something(block)
+    >>> print(hasher.hexdigest(), hasher.segment_digests())
+
+When only the digest is needed, `hash_file` avoids handing the audio to
+Python code at all where it can.
+
+Any algorithm supported by ``hashlib`` can be used, as can the xxHash
+family (``xxh32``, ``xxh64``, ``xxh3_64``, ``xxh3_128``) when the
+`xxhash` package is installed.
+"""
+import hashlib
+import subprocess
+
+from . import passthrough
+from .exceptions import DecodeError
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# The size of one 16-bit sample in bytes.
+SAMPLE_WIDTH = 2
+
+DEFAULT_ALGORITHM = 'blake2b'
+
+# Algorithms that FFmpeg's ``hash`` muxer can compute, by their hashlib
+# names.
+FFMPEG_HASHES = {
+    'md5': 'md5',
+    'sha1': 'sha160',
+    'sha224': 'sha224',
+    'sha256': 'sha256',
+    'sha384': 'sha384',
+    'sha512': 'sha512',
+}
+
+# The size of the buffer used to hash the data of WAV files.
+READ_SIZE = 1 << 20
+
+
+class HashError(DecodeError):
+    """FFmpeg could not hash the file."""
+
+
+def new_hash(algorithm):
+    """Create a hash object for `algorithm`, a ``hashlib`` name or an
+    xxHash name such as ``'xxh3_64'``.
+    """
+    if algorithm.startswith('xxh'):
+        if xxhash is None:
+            raise ValueError('{} requires the xxhash package'.format(
+                algorithm
+            ))
+        try:
+            return getattr(xxhash, algorithm)()
+        except AttributeError:
+            raise ValueError('unknown algorithm {!r}'.format(algorithm))
+    return hashlib.new(algorithm)
+
+
+class Hasher:
+    """Streaming digests of 16-bit interleaved PCM.
+
+    When `segment` (in seconds) is given, a separate digest is also
+    kept for each run of that many seconds of audio; segment boundaries
+    fall on whole frames.
+    """
+    def __init__(self, channels, samplerate, algorithm=DEFAULT_ALGORITHM,
+                 segment=None):
+        self.channels = channels
+        self.samplerate = samplerate
+        self.algorithm = algorithm
+        self.nbytes = 0
+
+        self._whole = new_hash(algorithm)
+        if segment is None:
+            self._segment_bytes = None
+        else:
+            frames = round(segment * samplerate)
+            if frames <= 0:
+                raise ValueError('segment must be positive')
+            self._segment_bytes = frames * SAMPLE_WIDTH * channels
+        self._segments = []
+        self._current = None
+        self._current_bytes = 0
+
+    @classmethod
+    def for_file(cls, audio_file, algorithm=DEFAULT_ALGORITHM,
+                 segment=None):
+        """Make a hasher for the format of `audio_file`."""
+        return cls(audio_file.channels, audio_file.samplerate, algorithm,
+                   segment)
+
+    @property
+    def frames(self):
+        """The number of whole frames hashed so far."""
+        return self.nbytes // (SAMPLE_WIDTH * self.channels)
+
+    def update(self, block):
+        """Add a block of PCM data to the digests."""
+        self._whole.update(block)
+        self.nbytes += len(block)
+        if self._segment_bytes is None:
+            return
+
+        view = memoryview(block)
+        while view:
+            if self._current is None:
+                self._current = new_hash(self.algorithm)
+                self._current_bytes = 0
+            count = min(self._segment_bytes - self._current_bytes, len(view))
+            self._current.update(view[:count])
+            self._current_bytes += count
+            view = view[count:]
+            if self._current_bytes == self._segment_bytes:
+                self._segments.append(self._current.hexdigest())
+                self._current = None
+
+    def tap(self, blocks):
+        """Pass the blocks from an iterable (such as an audio file)
+        through unchanged, hashing each on the way.
+        """
+        for block in blocks:
+            self.update(block)
+            yield block
+
+    def digest(self):
+        """The digest of all the data so far, as bytes."""
+        return self._whole.digest()
+
+    def hexdigest(self):
+        """The digest of all the data so far, as a hex string."""
+        return self._whole.hexdigest()
+
+    def segment_digests(self):
+        """The hex digest of each segment. A final, partial segment is
+        included.
+        """
+        if self._current is None:
+            return list(self._segments)
+        return self._segments + [self._current.hexdigest()]
+
+
+def _hash_range(path, offset, size, algorithm):
+    """Hash `size` bytes of a file starting at `offset`."""
+    h = new_hash(algorithm)
+    buf = bytearray(READ_SIZE)
+    view = memoryview(buf)
+    with open(path, 'rb', buffering=0) as fh:
+        fh.seek(offset)
+        while size > 0:
+            count = fh.readinto(view[:min(size, READ_SIZE)])
+            if not count:
+                break
+            h.update(view[:count])
+            size -= count
+    return h.hexdigest()
+
+
+def _ffmpeg_hash(path, algorithm):
+    """Use FFmpeg's ``hash`` muxer to hash the decoded audio. Return
+    None if FFmpeg is not available.
+    """
+    from . import ffdec
+    try:
+        proc = ffdec.popen_multiple(
+            ffdec.COMMANDS,
+            ['-v', 'error', '-i', path, '-vn', '-sn', '-dn',
+             '-c:a', 'pcm_s16le', '-f', 'hash',
+             '-hash', FFMPEG_HASHES[algorithm], '-'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            creationflags=ffdec.PROC_FLAGS,
+        )
+    except OSError:
+        return None
+    out, err = proc.communicate()
+    if proc.returncode:
+        raise HashError(err.decode('utf8', 'ignore').strip())
+    # The output looks like "SHA256=0123...".
+    _, _, digest = out.decode('ascii', 'ignore').strip().partition('=')
+    if not digest:
+        raise HashError('no digest in FFmpeg output')
+    return digest.lower()
+
+
+def _hash_decoded(path, algorithm, backends):
+    """Decode the file with `audio_open` and hash its blocks."""
+    from . import audio_open
+    with audio_open(path, backends) as f:
+        hasher = Hasher.for_file(f, algorithm)
+        for block in f:
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def hash_file(path, algorithm=DEFAULT_ALGORITHM, backends=None):
+    """Return the hex digest of the decoded PCM of the file at `path`:
+    the same digest a `Hasher` computes from the blocks of
+    ``audio_open(path, backends)``.
+
+    WAV files that already hold 16-bit PCM are hashed straight from
+    their data chunk, which every backend would decode unchanged.
+    Otherwise the backends are tried in order, as `audio_open` does.
+    When the FFmpeg backend's turn comes and the algorithm is in
+    `FFMPEG_HASHES`, FFmpeg decodes and hashes the file in a single
+    process; everything else is hashed block by block.
+    """
+    new_hash(algorithm)  # Fail early on unknown algorithms.
+
+    layout = passthrough.find_pcm(path)
+    if layout is not None:
+        return _hash_range(path, layout.offset, layout.size, algorithm)
+
+    from . import NoBackendError, available_backends, ffdec
+    if backends is None:
+        backends = available_backends()
+    backends = list(backends)
+
+    for i, backend in enumerate(backends):
+        if backend is ffdec.FFmpegAudioFile and algorithm in FFMPEG_HASHES:
+            # Only once the backends before it have turned the file
+            # down, so the digest is that of FFmpeg's output.
+            try:
+                digest = _ffmpeg_hash(path, algorithm)
+            except HashError:
+                digest = None
+            if digest is not None:
+                return digest
+        try:
+            return _hash_decoded(path, algorithm, [backend])
+        except NoBackendError:
+            continue
+    raise NoBackendError()
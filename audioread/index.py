@@ -0,0 +1,278 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""A persistent index of audio file metadata, stored in SQLite.
+
+Library scans often open the same files again and again just to read
+their stream parameters. A `MetadataIndex` remembers the channel
+count, sample rate, duration, and the backend that succeeded for each
+file, keyed by the file's path, size, modification time, and inode,
+and answers later queries without opening a decoder as long as the
+file has not changed:
+
+    >>> with MetadataIndex('library.db') as index:
+    >>>     info = index.info('something.mp3')
+    >>>     print(info.channels, info.samplerate, info.duration)
+"""
+import collections
+import concurrent.futures
+import os
+import sqlite3
+import threading
+
+from . import audio_open, available_backends
+
+# Bumped when the table changes. An index written with an older schema
+# is discarded (it is only a cache) and rebuilt as files are refreshed.
+SCHEMA_VERSION = 1
+
+# `duration` and `nframes` are NULL when the backend doesn't know them
+# (as for FFmpeg reading a stream without a duration).
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    channels INTEGER NOT NULL,
+    samplerate INTEGER NOT NULL,
+    duration REAL,
+    nframes INTEGER,
+    backend TEXT NOT NULL
+)
+'''
+
+# The number of paths per query in bulk lookups (SQLite limits the
+# number of parameters in a statement).
+LOOKUP_CHUNK = 500
+
+AudioInfo = collections.namedtuple(
+    'AudioInfo',
+    ['path', 'channels', 'samplerate', 'duration', 'nframes', 'backend'],
+)
+AudioInfo.__doc__ = """Stream parameters for an indexed file. `backend` is
+the qualified name of the audio file class that opened it.
+"""
+
+
+def backend_name(cls):
+    """The qualified name used to store a backend class."""
+    return '{}.{}'.format(cls.__module__, cls.__qualname__)
+
+
+def _stat_key(path):
+    """Get the (size, mtime_ns, inode) triple that identifies a version
+    of a file.
+    """
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _probe(path, backends):
+    """Open a file to read its parameters. Return the stat key and an
+    `AudioInfo`.
+
+    Reading ``nframes`` can cost more than opening the file: for
+    formats other than MP3, the FFmpeg backend runs ``ffprobe`` to get
+    the exact count.
+    """
+    key = _stat_key(path)
+    with audio_open(path, backends) as f:
+        info = AudioInfo(path, f.channels, f.samplerate, f.duration,
+                         f.nframes, backend_name(type(f)))
+    return key, info
+
+
+class MetadataIndex:
+    """A SQLite database of audio file metadata.
+
+    `db_path` is the database file (by default, an in-memory database
+    that lasts as long as the object). Paths are made absolute before
+    they are stored or looked up.
+
+    The index may be shared between threads.
+    """
+    def __init__(self, db_path=':memory:'):
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            version, = self._db.execute('PRAGMA user_version').fetchone()
+            if version != SCHEMA_VERSION:
+                self._db.execute('DROP TABLE IF EXISTS files')
+                self._db.execute(
+                    'PRAGMA user_version = {:d}'.format(SCHEMA_VERSION)
+                )
+            self._db.execute(SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    # Queries.
+
+    def lookup(self, path):
+        """Get the stored `AudioInfo` for a file, or None if the file is
+        not indexed or has changed since it was indexed. No decoder is
+        opened.
+        """
+        return self.lookup_many([path])[os.path.abspath(path)]
+
+    def lookup_many(self, paths):
+        """Look up many files at once. Return a dictionary mapping each
+        (absolute) path to its `AudioInfo` or None.
+        """
+        paths = [os.path.abspath(p) for p in paths]
+        rows = {}
+        for i in range(0, len(paths), LOOKUP_CHUNK):
+            chunk = paths[i:i + LOOKUP_CHUNK]
+            query = 'SELECT * FROM files WHERE path IN ({})'.format(
+                ', '.join('?' * len(chunk))
+            )
+            with self._lock:
+                for row in self._db.execute(query, chunk):
+                    rows[row[0]] = row
+
+        out = {}
+        for path in paths:
+            row = rows.get(path)
+            out[path] = None
+            if row is None:
+                continue
+            try:
+                key = _stat_key(path)
+            except OSError:
+                continue
+            if tuple(row[1:4]) == key:
+                out[path] = AudioInfo(path, *row[4:])
+        return out
+
+    def backends_for(self, path, backends=None):
+        """Order the candidate backends (by default, all available
+        ones) so that the backend that last opened `path` is tried
+        first. The stored backend is used even if the file has changed
+        since, since it is still the most likely to succeed.
+        """
+        if backends is None:
+            backends = available_backends()
+        with self._lock:
+            row = self._db.execute(
+                'SELECT backend FROM files WHERE path = ?',
+                (os.path.abspath(path),),
+            ).fetchone()
+        if row is None:
+            return list(backends)
+        preferred = [b for b in backends if backend_name(b) == row[0]]
+        return preferred + [b for b in backends if b not in preferred]
+
+    def open(self, path, backends=None):
+        """Open a file with `audio_open`, trying the backend that last
+        succeeded first.
+        """
+        return audio_open(path, self.backends_for(path, backends))
+
+    # Updates.
+
+    def _store(self, entries):
+        """Write a list of (stat key, `AudioInfo`) pairs. Each row is
+        written on its own, so one that SQLite rejects doesn't lose the
+        others; return a dictionary mapping the paths of the rejected
+        rows to their exceptions.
+        """
+        errors = {}
+        with self._lock, self._db:
+            for key, info in entries:
+                try:
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, '
+                        '?, ?, ?, ?)',
+                        (info.path,) + key + tuple(info[1:]),
+                    )
+                except sqlite3.Error as exc:
+                    errors[info.path] = exc
+        return errors
+
+    def refresh(self, path, backends=None):
+        """Open a file, store its metadata, and return its `AudioInfo`.
+        Raises the usual `audio_open` exceptions on failure.
+        """
+        path = os.path.abspath(path)
+        entry = _probe(path, self.backends_for(path, backends))
+        errors = self._store([entry])
+        if errors:
+            raise errors[path]
+        return entry[1]
+
+    def refresh_many(self, paths, jobs=None, backends=None, force=False):
+        """Index many files in parallel, using up to `jobs` threads.
+
+        Files whose entries are current are skipped unless `force` is
+        set. Return a dictionary mapping each absolute path to its
+        `AudioInfo`, or to the exception raised when opening or storing
+        it. A file that fails doesn't keep the others from being stored.
+        """
+        paths = [os.path.abspath(p) for p in paths]
+        results = {} if force else {
+            path: info for path, info in self.lookup_many(paths).items()
+            if info is not None
+        }
+        todo = [p for p in paths if p not in results]
+
+        if backends is None:
+            backends = available_backends()
+        entries = []
+        with concurrent.futures.ThreadPoolExecutor(jobs) as pool:
+            futures = {
+                pool.submit(_probe, path, self.backends_for(path, backends)):
+                path for path in todo
+            }
+            for future in concurrent.futures.as_completed(futures):
+                path = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as exc:
+                    results[path] = exc
+                else:
+                    entries.append(entry)
+                    results[path] = entry[1]
+
+        results.update(self._store(entries))
+        return results
+
+    def info(self, path, backends=None):
+        """Get the metadata for a file from the index, opening it only
+        if it is not indexed or has changed.
+        """
+        info = self.lookup(path)
+        if info is None:
+            info = self.refresh(path, backends)
+        return info
+
+    def prune(self):
+        """Remove entries for files that no longer exist. Return the
+        number of entries removed.
+        """
+        with self._lock:
+            paths = [r[0] for r in self._db.execute('SELECT path FROM files')]
+        missing = [(p,) for p in paths if not os.path.exists(p)]
+        with self._lock, self._db:
+            self._db.executemany('DELETE FROM files WHERE path = ?', missing)
+        return len(missing)
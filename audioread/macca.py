@@ -20,7 +20,7 @@ import os
 import sys
 
 from .exceptions import DecodeError
-from .base import AudioFile
+from .base import AudioFile, is_path
 
 
 # CoreFoundation and CoreAudio libraries along with their function
@@ -198,6 +198,9 @@ class ExtAudioFile(AudioFile):
 
     """
     def __init__(self, filename):
+        if not is_path(filename):
+            self.closed = True
+            raise DecodeError('Core Audio can only read files by path')
         url = CFURL(filename)
         try:
             self._obj = self._open_url(url)
@@ -323,6 +326,7 @@ class ExtAudioFile(AudioFile):
             data = ctypes.cast(buflist.mBuffers[0].mData,
                                ctypes.POINTER(ctypes.c_char))
             blob = data[:size]
+            self._advance(size)
             yield blob
 
     def close(self):
@@ -16,7 +16,8 @@
 import mad
 
 from . import DecodeError
-from .base import AudioFile
+from . import mpeg
+from .base import AudioFile, open_source
 
 
 class UnsupportedError(DecodeError):
@@ -24,16 +25,55 @@ class UnsupportedError(DecodeError):
 
 
 class MadAudioFile(AudioFile):
-    """MPEG audio file decoder using the MAD library."""
-    def __init__(self, filename):
-        self.fp = open(filename, 'rb')
+    """MPEG audio file decoder using the MAD library.
+
+    `filename` may also be a binary file object or a bytes-like object
+    holding the contents of the file.
+
+    To decode only part of a seekable file, give `start` and `end`
+    positions in frames (samples per channel). Decoding then begins
+    near `start` using a frame index (`mpeg.FrameIndex`), which is
+    built by scanning the file unless one is passed as `index`.
+    Independent ranges can be decoded in parallel; their output joins
+    up into the output of decoding the whole file.
+    """
+    def __init__(self, filename, index=None, start=0, end=None):
+        self.fp, self._owns_fp = open_source(filename)
+        self._start = self.fp.tell() if self.fp.seekable() else None
+        self._info = None
+        self._index = index
+        self._range = None
+        self._skip = 0
+
+        if start or end is not None:
+            if self._start is None:
+                if self._owns_fp:
+                    self.fp.close()
+                raise UnsupportedError('seeking requires a seekable file')
+            try:
+                if self._index is None:
+                    self._index = mpeg.build_index(self.fp)
+            except mpeg.UnsupportedError:
+                if self._owns_fp:
+                    self.fp.close()
+                raise UnsupportedError()
+            if end is None:
+                end = self._index.raw_nframes
+            end = min(end, self._index.raw_nframes)
+            start = min(start, end)
+            self._range = (start, end)
+            # Start MAD at a frame boundary before `start`.
+            frame, self._skip = self._index.seek_point(start)
+            self.fp.seek(self._index.offsets[frame])
+
         self.mf = mad.MadFile(self.fp)
         if not self.mf.total_time():  # Indicates a failed open.
-            self.fp.close()
+            if self._owns_fp:
+                self.fp.close()
             raise UnsupportedError()
 
     def close(self):
-        if hasattr(self, 'fp'):
+        if hasattr(self, 'fp') and self._owns_fp:
             self.fp.close()
         if hasattr(self, 'mf'):
             del self.mf
@@ -41,11 +81,28 @@ class MadAudioFile(AudioFile):
     def read_blocks(self, block_size=4096):
         """Generates buffers containing PCM data for the audio file.
         """
-        while True:
+        frame_size = 2 * self.channels
+        skip = self._skip * frame_size
+        remaining = None
+        if self._range is not None:
+            remaining = (self._range[1] - self._range[0]) * frame_size
+
+        while remaining != 0:
             out = self.mf.read(block_size)
             if not out:
                 break
-            yield bytes(out)
+            out = bytes(out)
+            if skip:
+                # Drop the priming audio before the start position.
+                cut = min(skip, len(out))
+                out = out[cut:]
+                skip -= cut
+            if remaining is not None:
+                out = out[:remaining]
+                remaining -= len(out)
+            if out:
+                self._advance(len(out))
+                yield out
 
     @property
     def samplerate(self):
@@ -54,8 +111,45 @@ class MadAudioFile(AudioFile):
 
     @property
     def duration(self):
-        """Length of the audio in seconds (a float)."""
-        return float(self.mf.total_time()) / 1000
+        """Length of the audio in seconds (a float). This is exact when
+        the frame headers can be read, and otherwise MAD's estimate.
+        """
+        nframes = self._exact_nframes()
+        if nframes is None:
+            return float(self.mf.total_time()) / 1000
+        return float(nframes) / self.samplerate
+
+    @property
+    def nframes(self):
+        """The exact number of frames that MAD produces, computed from
+        the Xing/VBRI tag or the frame headers without decoding.
+        """
+        nframes = self._exact_nframes()
+        if nframes is None:
+            return super().nframes
+        return nframes
+
+    def _exact_nframes(self):
+        if self._range is not None:
+            return self._range[1] - self._range[0]
+        if self._index is not None:
+            return self._index.raw_nframes
+        if self._start is None:
+            # We can't look at the headers of a stream.
+            return None
+        if self._info is None:
+            # Read the headers without disturbing MAD's read position.
+            pos = self.fp.tell()
+            try:
+                self.fp.seek(self._start)
+                self._info = mpeg.read_info(self.fp)
+            except mpeg.UnsupportedError:
+                return None
+            finally:
+                self.fp.seek(pos)
+        # MAD decodes the tag frame (as silence) and does not trim the
+        # encoder delay or padding.
+        return self._info.raw_nframes
 
     @property
     def channels(self):
@@ -0,0 +1,591 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Read the structure of MPEG audio (MP1/MP2/MP3) files without
+decoding them.
+
+The frame headers, and the Xing/Info, LAME, and VBRI tags that
+encoders write into the first frame, are enough to compute an exact
+sample count. When no tag is present, the frame headers are scanned.
+
+A `FrameIndex` records the byte offset of every frame, so a decoder
+can start at any frame without reading the ones before it. It is built
+once by scanning the headers and can be saved as a sidecar file:
+
+    >>> index = load_index('something.mp3')  # Builds or reads a sidecar.
+    >>> frame, skip = index.seek_point(44100 * 60)
+"""
+import itertools
+import os
+import struct
+import sys
+from array import array
+
+from .exceptions import DecodeError
+
+# Bit rates in kbit/s, indexed by [MPEG-1?][layer - 1][index].
+BITRATES = {
+    True: [
+        [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416,
+         448],
+        [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+        [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    ],
+    False: [
+        [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+        [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+        [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    ],
+}
+
+# Sample rates indexed by the version bits and then the rate index.
+SAMPLERATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),   # MPEG-2.5
+}
+
+# Channel mode for a single-channel stream.
+MODE_MONO = 3
+
+# How many consecutive frames must parse to trust a sync word.
+SYNC_FRAMES = 3
+
+
+# The sidecar file header: magic, version, sample rate, channels,
+# layer, whether there is a tag frame, per-frame overhead, samples per
+# frame, encoder delay and padding, number of frames, offset of the
+# first frame, and the size and modification time of the source file.
+INDEX_MAGIC = b'ARMI'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sBIBBBBHHHIQQQ')
+
+# The extension added to a file's name for its index sidecar.
+INDEX_SUFFIX = '.mpidx'
+
+# How much of the file to read at a time when scanning frames.
+SCAN_CHUNK = 256 * 1024
+
+# How many frames are decoded (and discarded) before a seek target, to
+# fill the decoder's overlap and synthesis filter state.
+PRIMING_FRAMES = 2
+
+
+class UnsupportedError(DecodeError):
+    """The file is not an MPEG audio file."""
+
+
+class IndexFormatError(DecodeError):
+    """A frame index sidecar could not be parsed."""
+
+
+class FrameHeader:
+    """The fields of a four-byte MPEG audio frame header."""
+    __slots__ = ('mpeg1', 'layer', 'bitrate', 'samplerate', 'mode',
+                 'length', 'samples')
+
+    def __init__(self, data):
+        if len(data) < 4 or data[0] != 0xFF or (data[1] & 0xE0) != 0xE0:
+            raise ValueError('no frame sync')
+        version = (data[1] >> 3) & 3
+        layer = 4 - ((data[1] >> 1) & 3)
+        rate_index = data[2] >> 4
+        sr_index = (data[2] >> 2) & 3
+        if version == 1 or layer == 4 or rate_index in (0, 15) or \
+                sr_index == 3:
+            # Reserved values (or "free" bit rate, which we don't
+            # support).
+            raise ValueError('invalid frame header')
+
+        self.mpeg1 = version == 3
+        self.layer = layer
+        self.bitrate = BITRATES[self.mpeg1][layer - 1][rate_index] * 1000
+        self.samplerate = SAMPLERATES[version][sr_index]
+        self.mode = data[3] >> 6
+        padding = (data[2] >> 1) & 1
+
+        if layer == 1:
+            self.samples = 384
+            self.length = (12 * self.bitrate // self.samplerate + padding) * 4
+        elif layer == 2 or self.mpeg1:
+            self.samples = 1152
+            self.length = 144 * self.bitrate // self.samplerate + padding
+        else:
+            self.samples = 576
+            self.length = 72 * self.bitrate // self.samplerate + padding
+
+    @property
+    def channels(self):
+        return 1 if self.mode == MODE_MONO else 2
+
+    def side_info_size(self):
+        """The size of the Layer III side information that follows the
+        header (and precedes a Xing tag).
+        """
+        if self.mpeg1:
+            return 17 if self.mode == MODE_MONO else 32
+        return 9 if self.mode == MODE_MONO else 17
+
+    def compatible(self, other):
+        """Check whether two headers can belong to the same stream."""
+        return (self.mpeg1 == other.mpeg1 and self.layer == other.layer and
+                self.samplerate == other.samplerate)
+
+
+def parse_header(data):
+    """Parse a frame header, returning a `FrameHeader` or None if the
+    bytes are not a valid header.
+    """
+    try:
+        return FrameHeader(data)
+    except ValueError:
+        return None
+
+
+def id3v2_size(fh):
+    """Return the size of an ID3v2 tag at the current position (or 0
+    if there is no tag). The file position is left unchanged.
+    """
+    pos = fh.tell()
+    head = fh.read(10)
+    fh.seek(pos)
+    if len(head) < 10 or head[:3] != b'ID3':
+        return 0
+    size = 0
+    for b in head[6:10]:
+        size = (size << 7) | (b & 0x7F)
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _read_at(fh, offset, size):
+    fh.seek(offset)
+    return fh.read(size)
+
+
+def find_first_frame(fh, start=0, limit=64 * 1024):
+    """Find the offset of the first frame at or after `start` that is
+    followed by a run of valid, consistent frame headers. Raise
+    `UnsupportedError` if none is found within `limit` bytes.
+    """
+    window = _read_at(fh, start, limit)
+    pos = window.find(b'\xff')
+    while pos != -1:
+        header = parse_header(window[pos:pos + 4])
+        if header is not None:
+            # Confirm the sync by following the chain of frames.
+            offset = start + pos + header.length
+            for _ in range(SYNC_FRAMES - 1):
+                following = parse_header(_read_at(fh, offset, 4))
+                if following is None or not header.compatible(following):
+                    break
+                offset += following.length
+            else:
+                return start + pos, header
+        pos = window.find(b'\xff', pos + 1)
+    raise UnsupportedError('no MPEG audio frames found')
+
+
+def scan_frames(fh, offset, first=None):
+    """Generate ``(offset, header)`` pairs for the consecutive frames
+    of the stream starting at `offset`. Scanning stops at the first
+    position that does not hold a compatible frame header (such as a
+    trailing ID3v1 or APE tag).
+    """
+    reference = first
+    while True:
+        header = parse_header(_read_at(fh, offset, 4))
+        if header is None:
+            break
+        if reference is None:
+            reference = header
+        elif not reference.compatible(header):
+            break
+        yield offset, header
+        offset += header.length
+
+
+class MPEGInfo:
+    """Stream parameters and exact length of an MPEG audio file.
+
+    ``frames`` counts the audio frames, not including a leading
+    Xing/Info/VBRI tag frame (``tag_frame`` tells whether there is
+    one). ``encoder_delay`` and ``encoder_padding`` come from a LAME
+    tag and are zero when unknown.
+    """
+    def __init__(self, header, offset, frames, tag_frame=False,
+                 encoder_delay=0, encoder_padding=0):
+        self.samplerate = header.samplerate
+        self.channels = header.channels
+        self.layer = header.layer
+        self.samples_per_frame = header.samples
+        self.offset = offset
+        self.frames = frames
+        self.tag_frame = tag_frame
+        self.encoder_delay = encoder_delay
+        self.encoder_padding = encoder_padding
+        # The offset of the first audio (non-tag) frame.
+        self.audio_offset = offset + (header.length if tag_frame else 0)
+
+    @property
+    def nframes(self):
+        """The number of samples per channel after removing the encoder
+        delay and padding, as produced by a gapless decoder such as
+        FFmpeg.
+        """
+        return max(0, self.frames * self.samples_per_frame -
+                   self.encoder_delay - self.encoder_padding)
+
+    @property
+    def raw_nframes(self):
+        """The number of samples per channel produced by a decoder
+        that decodes every frame, including the tag frame, and does
+        not trim the encoder delay or padding (such as MAD).
+        """
+        return (self.frames + int(self.tag_frame)) * self.samples_per_frame
+
+    @property
+    def duration(self):
+        return self.nframes / self.samplerate
+
+
+def _xing_tag(frame, header):
+    """Parse a Xing/Info tag (and a following LAME tag) from the bytes
+    of the first frame. Return ``(frames, delay, padding)`` or None.
+    """
+    pos = 4 + header.side_info_size()
+    if frame[pos:pos + 4] not in (b'Xing', b'Info'):
+        return None
+    flags = int.from_bytes(frame[pos + 4:pos + 8], 'big')
+    pos += 8
+    frames = None
+    if flags & 1:
+        frames = int.from_bytes(frame[pos:pos + 4], 'big')
+        pos += 4
+    if flags & 2:
+        pos += 4   # Byte count.
+    if flags & 4:
+        pos += 100  # Seek table.
+    if flags & 8:
+        pos += 4   # Quality.
+    if frames is None:
+        return None
+
+    # The LAME extension: a nine-byte encoder string followed by
+    # fields including the 12-bit delay and padding values.
+    delay = padding = 0
+    lame = frame[pos:pos + 24]
+    if len(lame) == 24 and lame[:4] in (b'LAME', b'Lavf', b'Lavc', b'L3.9'):
+        b = lame[21:24]
+        delay = (b[0] << 4) | (b[1] >> 4)
+        padding = ((b[1] & 0x0F) << 8) | b[2]
+    return frames, delay, padding
+
+
+def _vbri_tag(frame):
+    """Parse a VBRI tag, returning the frame count or None."""
+    pos = 4 + 32
+    if frame[pos:pos + 4] != b'VBRI':
+        return None
+    return int.from_bytes(frame[pos + 14:pos + 18], 'big')
+
+
+def read_info(fh):
+    """Read the parameters and length of the MPEG audio stream in the
+    binary file object `fh`, which must be seekable. Only headers are
+    read; the audio is not decoded.
+    """
+    start = fh.tell()
+    offset, header = find_first_frame(fh, start + id3v2_size(fh))
+    frame = _read_at(fh, offset, header.length)
+
+    xing = _xing_tag(frame, header) if header.layer == 3 else None
+    if xing is not None:
+        frames, delay, padding = xing
+        info = MPEGInfo(header, offset, frames, True, delay, padding)
+    else:
+        frames = _vbri_tag(frame)
+        if frames is not None:
+            info = MPEGInfo(header, offset, frames, True)
+        else:
+            # No tag: count the frames.
+            frames = sum(1 for _ in scan_frames(fh, offset, header))
+            info = MPEGInfo(header, offset, frames)
+
+    fh.seek(start)
+    return info
+
+
+def read_info_path(path):
+    """Like `read_info`, but for a file on the filesystem."""
+    with open(os.fspath(path), 'rb') as fh:
+        return read_info(fh)
+
+
+def _main_data_begin(data, header):
+    """Read the Layer III ``main_data_begin`` field, the number of
+    bytes of this frame's audio data stored in earlier frames.
+    """
+    if header.layer != 3:
+        return 0
+    pos = 4 if data[1] & 1 else 6  # Skip the CRC, if any.
+    side = data[pos:pos + 2]
+    if len(side) < 2:
+        return 0
+    if header.mpeg1:
+        return (side[0] << 1) | (side[1] >> 7)
+    return side[0]
+
+
+def _as_le(values):
+    """Convert an array to little-endian bytes."""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class FrameIndex:
+    """The position of every frame of an MPEG audio stream.
+
+    Frames are numbered from the first frame of the stream, including a
+    Xing/Info/VBRI tag frame, so sample positions match the output of a
+    decoder that decodes every frame, such as MAD. ``offsets`` holds
+    the byte offset of each frame in the file, plus the end of the last
+    frame.
+    """
+    def __init__(self, header, offset, lengths, reservoir, overhead,
+                 tag_frame=False, encoder_delay=0, encoder_padding=0):
+        self.samplerate = header.samplerate
+        self.channels = header.channels
+        self.layer = header.layer
+        self.samples_per_frame = header.samples
+        self.tag_frame = tag_frame
+        self.encoder_delay = encoder_delay
+        self.encoder_padding = encoder_padding
+        self.offsets = array('Q', itertools.accumulate(lengths,
+                                                       initial=offset))
+        # Frame lengths, main_data_begin values, and the bytes of each
+        # frame that are not audio data, for working out which frames
+        # can be decoded after a seek.
+        self._lengths = lengths
+        self._reservoir = reservoir
+        self._overhead = overhead
+        # The (size, mtime_ns) of the file the index was built from.
+        self.source = None
+
+    @property
+    def frames(self):
+        """The number of frames, including a tag frame."""
+        return len(self._lengths)
+
+    @property
+    def raw_nframes(self):
+        """The number of samples per channel in all the frames."""
+        return self.frames * self.samples_per_frame
+
+    @property
+    def nframes(self):
+        """The number of samples per channel without the tag frame and
+        encoder delay and padding, as a gapless decoder produces.
+        """
+        return max(0, (self.frames - int(self.tag_frame)) *
+                   self.samples_per_frame - self.encoder_delay -
+                   self.encoder_padding)
+
+    @property
+    def duration(self):
+        return self.nframes / self.samplerate
+
+    def _payload(self, frame):
+        return max(self._lengths[frame] - self._overhead, 0)
+
+    def seek_point(self, sample):
+        """Find where to start decoding to get the audio from `sample`
+        (counted in the raw, ungapless timeline) on.
+
+        Return ``(frame, skip)``: start feeding the decoder at the byte
+        offset of `frame` and discard the first `skip` samples per
+        channel it produces. Layer III frames can borrow bytes from the
+        frames before them, so decoding starts early enough that the
+        target frame and the `PRIMING_FRAMES` before it decode fully.
+        Frames before that which lack their borrowed bytes are not
+        decoded at all, and are not counted in `skip`.
+        """
+        spf = self.samples_per_frame
+        sample = min(max(sample, 0), self.raw_nframes)
+        target = min(sample // spf, self.frames)
+        first = start = max(target - PRIMING_FRAMES, 0)
+        if first < self.frames:
+            need, have = self._reservoir[first], 0
+            while start > 0 and have < need:
+                start -= 1
+                have += self._payload(start)
+
+        # Count the frames before the target the decoder will output.
+        output = available = 0
+        for frame in range(start, target):
+            if self._reservoir[frame] <= available:
+                output += 1
+            available += self._payload(frame)
+        return start, output * spf + sample - target * spf
+
+    def split(self, parts):
+        """Divide the stream into about `parts` ranges of whole frames
+        for decoding in parallel. Return a list of ``(start, end)``
+        sample positions in the raw timeline.
+        """
+        step = max(-(-self.frames // max(parts, 1)), 1)
+        spf = self.samples_per_frame
+        return [(f * spf, min(f + step, self.frames) * spf)
+                for f in range(0, self.frames, step)]
+
+    # Sidecar files.
+
+    def dumps(self):
+        """Serialize the index as compact binary data: a header, then
+        each frame's length and ``main_data_begin`` as little-endian
+        16-bit integers.
+        """
+        size, mtime_ns = self.source or (0, 0)
+        header = INDEX_HEADER.pack(
+            INDEX_MAGIC, INDEX_VERSION, self.samplerate, self.channels,
+            self.layer, int(self.tag_frame), self._overhead,
+            self.samples_per_frame, self.encoder_delay,
+            self.encoder_padding, self.frames, self.offsets[0], size,
+            mtime_ns,
+        )
+        return header + _as_le(self._lengths) + _as_le(self._reservoir)
+
+    @classmethod
+    def loads(cls, data):
+        """Deserialize an index created by `dumps`."""
+        if len(data) < INDEX_HEADER.size:
+            raise IndexFormatError('truncated header')
+        (magic, version, samplerate, channels, layer, tag_frame, overhead,
+         spf, delay, padding, frames, offset, size, mtime_ns) = \
+            INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC:
+            raise IndexFormatError('not a frame index')
+        if version != INDEX_VERSION:
+            raise IndexFormatError('unsupported version {}'.format(version))
+        if len(data) != INDEX_HEADER.size + 4 * frames:
+            raise IndexFormatError('wrong size')
+
+        body = array('H')
+        body.frombytes(data[INDEX_HEADER.size:])
+        if sys.byteorder == 'big':
+            body.byteswap()
+        header = _IndexHeader(samplerate, channels, layer, spf)
+        index = cls(header, offset, body[:frames], body[frames:], overhead,
+                    bool(tag_frame), delay, padding)
+        if size or mtime_ns:
+            index.source = (size, mtime_ns)
+        return index
+
+    def save(self, path):
+        """Write the index to a sidecar file."""
+        with open(path, 'wb') as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path):
+        """Read an index from a sidecar file."""
+        with open(path, 'rb') as f:
+            return cls.loads(f.read())
+
+
+class _IndexHeader:
+    """The stream parameters a `FrameIndex` needs from a frame
+    header, when loading one from a sidecar.
+    """
+    def __init__(self, samplerate, channels, layer, samples):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.layer = layer
+        self.samples = samples
+
+
+def build_index(fh):
+    """Scan the frame headers of the MPEG audio stream in the seekable
+    binary file object `fh` and build a `FrameIndex`. The audio is not
+    decoded.
+    """
+    start = fh.tell()
+    info = read_info(fh)
+    first = parse_header(_read_at(fh, info.offset, 4))
+    # Layer III frames hold a header, an optional CRC, and side
+    # information before the audio data.
+    overhead = 0
+    if first.layer == 3:
+        crc = 0 if _read_at(fh, info.offset, 2)[1] & 1 else 2
+        overhead = 4 + crc + first.side_info_size()
+
+    lengths = array('H')
+    reservoir = array('H')
+    buf, buf_start = b'', info.offset
+    pos = info.offset
+    while True:
+        rel = pos - buf_start
+        if rel + 8 > len(buf):
+            buf = _read_at(fh, pos, SCAN_CHUNK)
+            buf_start, rel = pos, 0
+        header = parse_header(buf[rel:rel + 4])
+        if header is None or not first.compatible(header):
+            break
+        lengths.append(header.length)
+        reservoir.append(_main_data_begin(buf[rel:rel + 8], header))
+        pos += header.length
+
+    fh.seek(start)
+    return FrameIndex(first, info.offset, lengths, reservoir, overhead,
+                      info.tag_frame, info.encoder_delay,
+                      info.encoder_padding)
+
+
+def build_index_path(path):
+    """Like `build_index`, but for a file on the filesystem. The index
+    remembers the file's size and modification time.
+    """
+    with open(os.fspath(path), 'rb') as fh:
+        st = os.fstat(fh.fileno())
+        index = build_index(fh)
+    index.source = (st.st_size, st.st_mtime_ns)
+    return index
+
+
+def load_index(path, sidecar=None):
+    """Get a `FrameIndex` for the file at `path`, reading it from the
+    `sidecar` file (by default, `path` plus `INDEX_SUFFIX`) if that is
+    up to date, and otherwise building it and saving the sidecar.
+    """
+    path = os.fspath(path)
+    if sidecar is None:
+        sidecar = path + INDEX_SUFFIX
+    st = os.stat(path)
+    try:
+        index = FrameIndex.load(sidecar)
+    except (OSError, IndexFormatError):
+        pass
+    else:
+        if index.source == (st.st_size, st.st_mtime_ns):
+            return index
+
+    index = build_index_path(path)
+    try:
+        index.save(sidecar)
+    except OSError:
+        # The index still works without a sidecar.
+        pass
+    return index
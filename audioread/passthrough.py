@@ -0,0 +1,216 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Copy PCM out of WAV files that are already in audioread's output
+format, without decoding.
+
+A WAV file holding 16-bit little-endian PCM decodes to exactly the
+bytes of its data chunk. `copy_pcm` detects such files and copies the
+data chunk straight to the destination (as a new WAV file or as raw
+PCM) in the kernel with ``copy_file_range`` or ``sendfile`` where
+available, so the audio never passes through Python buffers:
+
+    >>> if copy_pcm('in.wav', 'out.wav') is None:
+    >>>     ...  # Not plain 16-bit PCM; decode it instead.
+"""
+import collections
+import errno
+import os
+import struct
+
+# The output sample width in bytes.
+SAMPLE_WIDTH = 2
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# The largest size a RIFF chunk header can hold.
+MAX_RIFF_SIZE = 0xFFFFFFFF
+
+# The largest single request to the kernel copy functions.
+COPY_CHUNK = 1 << 30
+
+PCMLayout = collections.namedtuple(
+    'PCMLayout', ['channels', 'samplerate', 'offset', 'size'],
+)
+PCMLayout.__doc__ = """The location of 16-bit little-endian PCM in a file:
+`size` bytes (a whole number of frames) starting at byte `offset`.
+"""
+
+
+def _chunks(fh, end):
+    """Generate the (id, offset of data, size) of each chunk in a RIFF
+    file, starting at the current position.
+    """
+    pos = fh.tell()
+    while pos + 8 <= end:
+        header = fh.read(8)
+        if len(header) < 8:
+            return
+        chunk_id, size = struct.unpack('<4sI', header)
+        yield chunk_id, pos + 8, size
+        # Chunks are padded to an even size.
+        pos += 8 + size + (size & 1)
+        fh.seek(pos)
+
+
+def find_pcm(path):
+    """Return the `PCMLayout` of a WAV file's audio if it is 16-bit
+    PCM, or None if the file is anything else.
+    """
+    try:
+        with open(path, 'rb') as fh:
+            end = os.fstat(fh.fileno()).st_size
+            riff = fh.read(12)
+            if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:] != b'WAVE':
+                return None
+
+            fmt = None
+            for chunk_id, offset, size in _chunks(fh, end):
+                if chunk_id == b'fmt ':
+                    fmt = fh.read(min(size, 40))
+                elif chunk_id == b'data':
+                    if fmt is None:
+                        return None
+                    return _layout(fmt, offset, min(size, end - offset))
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+def _layout(fmt, offset, size):
+    """Check a ``fmt `` chunk for 16-bit PCM and build the layout."""
+    if len(fmt) < 16:
+        return None
+    tag, channels, samplerate, _, align, bits = \
+        struct.unpack('<HHIIHH', fmt[:16])
+    if tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        # The real format is at the start of the subformat GUID.
+        tag, = struct.unpack('<H', fmt[24:26])
+    if tag != WAVE_FORMAT_PCM or bits != 8 * SAMPLE_WIDTH or not channels:
+        return None
+    if align != SAMPLE_WIDTH * channels:
+        return None
+    return PCMLayout(channels, samplerate, offset, size - size % align)
+
+
+def wav_header(channels, samplerate, size):
+    """Make a canonical 44-byte WAV header for `size` bytes of 16-bit
+    PCM. When the sizes don't fit in the header's 32-bit fields, an
+    80-byte RF64 header (EBU Tech 3306) is made instead.
+    """
+    align = SAMPLE_WIDTH * channels
+    fmt = struct.pack(
+        '<4sIHHIIHH',
+        b'fmt ', 16, WAVE_FORMAT_PCM, channels, samplerate,
+        samplerate * align, align, 8 * SAMPLE_WIDTH,
+    )
+    if 36 + size <= MAX_RIFF_SIZE:
+        return struct.pack('<4sI4s', b'RIFF', 36 + size, b'WAVE') + fmt + \
+            struct.pack('<4sI', b'data', size)
+
+    # The real sizes go in the ds64 chunk; the 32-bit fields are
+    # all ones.
+    return (
+        struct.pack('<4sI4s', b'RF64', MAX_RIFF_SIZE, b'WAVE') +
+        struct.pack('<4sIQQQI', b'ds64', 28, 72 + size, size,
+                    size // align, 0) +
+        fmt +
+        struct.pack('<4sI', b'data', MAX_RIFF_SIZE)
+    )
+
+
+def copy_range(src_fd, dest_fd, offset, size):
+    """Copy `size` bytes starting at `offset` in `src_fd` to the
+    current position of `dest_fd`, in the kernel if possible.
+    """
+    def done(count):
+        nonlocal offset, size
+        offset += count
+        size -= count
+
+    # copy_file_range (Linux), which can also share extents on
+    # filesystems that support it.
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while size > 0:
+                count = os.copy_file_range(src_fd, dest_fd,
+                                           min(size, COPY_CHUNK), offset)
+                if not count:
+                    break
+                done(count)
+        except OSError as exc:
+            if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                 errno.EOPNOTSUPP, errno.EPERM):
+                raise
+
+    # sendfile supports regular files as the destination on Linux.
+    if size > 0 and hasattr(os, 'sendfile'):
+        try:
+            while size > 0:
+                count = os.sendfile(dest_fd, src_fd, offset,
+                                    min(size, COPY_CHUNK))
+                if not count:
+                    break
+                done(count)
+        except OSError as exc:
+            if exc.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK,
+                                 errno.EOPNOTSUPP):
+                raise
+
+    # Plain reads and writes.
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    while size > 0:
+        data = os.read(src_fd, min(size, 1 << 20))
+        if not data:
+            break
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dest_fd, view):]
+        done(len(data))
+
+    if size > 0:
+        raise OSError(errno.EIO, 'source file ended early')
+
+
+def copy_pcm(src, dest, fmt='wav'):
+    """Copy the audio from the WAV file `src` to the file `dest`
+    without decoding it, if it holds 16-bit PCM.
+
+    `fmt` is ``'wav'`` for a WAV file with a new header or ``'raw'``
+    for headerless PCM. Return the source's `PCMLayout`, or None (and
+    write nothing) if the file needs to be decoded.
+    """
+    if fmt not in ('wav', 'raw'):
+        raise ValueError('unsupported output format {!r}'.format(fmt))
+    layout = find_pcm(src)
+    if layout is None:
+        return None
+
+    src_fd = os.open(src, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        dest_fd = os.open(dest,
+                          os.O_WRONLY | os.O_CREAT | os.O_TRUNC |
+                          getattr(os, 'O_BINARY', 0),
+                          0o666)
+        try:
+            if fmt == 'wav':
+                os.write(dest_fd, wav_header(layout.channels,
+                                             layout.samplerate, layout.size))
+            copy_range(src_fd, dest_fd, layout.offset, layout.size)
+        finally:
+            os.close(dest_fd)
+    finally:
+        os.close(src_fd)
+    return layout
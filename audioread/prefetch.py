@@ -0,0 +1,241 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Open and decode a sequence of audio files ahead of the consumer.
+
+When files are processed one after another, each `audio_open` pays its
+startup latency only once the previous file is finished. `open_sequence`
+opens the next few files in background threads and buffers their first
+blocks, so the next file is ready to read as soon as the current one is
+done:
+
+    >>> for f in open_sequence(playlist, prefetch=2):
+    >>>     with f:
+    >>>         for block in f:
+    >>>             do_something(block)
+"""
+import collections
+import concurrent.futures
+import threading
+
+from . import audio_open, available_backends
+from .base import AudioFile
+
+# The default total number of bytes of decoded audio that may be
+# buffered by a sequence.
+MAX_BUFFER = 16 * 1024 * 1024
+
+
+class _Prefetcher:
+    """The state shared between a `PrefetchedAudioFile` and its
+    background thread.
+
+    The thread holds only this object, never the `PrefetchedAudioFile`
+    itself, so a file that is dropped without being closed is still
+    freed (and its `__del__` stops the thread) even while the thread is
+    blocked on a full buffer.
+    """
+    def __init__(self, path, backends, buffer_size):
+        self.path = path
+        self.ready = concurrent.futures.Future()
+        self.backends = backends
+        self.buffer_size = buffer_size
+        self.file = None
+
+        # Decoded blocks and their total size, guarded by `cond`.
+        self.blocks = collections.deque()
+        self.buffered = 0
+        self.cond = threading.Condition()
+        self.done = False
+        self.closed = False
+        self.exc = None
+
+    def run(self):
+        """Open the file and fill the buffer until the file is exhausted
+        or closed.
+        """
+        try:
+            self.file = audio_open(self.path, self.backends)
+        except BaseException as exc:
+            self.ready.set_exception(exc)
+            with self.cond:
+                self.done = True
+                self.cond.notify_all()
+            return
+        self.ready.set_result(None)
+
+        try:
+            for block in self.file:
+                with self.cond:
+                    while (self.buffered >= self.buffer_size and
+                           not self.closed):
+                        self.cond.wait()
+                    if self.closed:
+                        break
+                    self.blocks.append(block)
+                    self.buffered += len(block)
+                    self.cond.notify_all()
+        except Exception as exc:
+            self.exc = exc
+        finally:
+            with self.cond:
+                self.done = True
+                self.cond.notify_all()
+                if self.closed:
+                    # The consumer is gone; clean up here.
+                    self.file.close()
+
+    def close(self):
+        with self.cond:
+            if self.closed:
+                return
+            self.closed = True
+            self.blocks.clear()
+            self.buffered = 0
+            self.cond.notify_all()
+            if self.done and self.file is not None:
+                self.file.close()
+
+
+class PrefetchedAudioFile(AudioFile):
+    """An audio file that is opened and decoded in a background thread.
+
+    Up to `buffer_size` bytes of decoded audio are read ahead of the
+    consumer (the last block may overshoot it). Errors from opening the
+    file are raised when its attributes are first used or when it is
+    iterated; the ``ready`` future resolves (to None) once it is open.
+    """
+    def __init__(self, path, backends=None, buffer_size=MAX_BUFFER):
+        self.path = path
+        self._state = _Prefetcher(path, backends, buffer_size)
+        self.ready = self._state.ready
+
+        self._thread = threading.Thread(target=self._state.run, daemon=True)
+        self._thread.start()
+
+    def _opened(self):
+        """Wait for the file to open and return the backend's file."""
+        self.ready.result()
+        return self._state.file
+
+    @property
+    def channels(self):
+        """Number of audio channels."""
+        return self._opened().channels
+
+    @property
+    def samplerate(self):
+        """Sample rate in Hz."""
+        return self._opened().samplerate
+
+    @property
+    def duration(self):
+        """Length of the audio in seconds (a float)."""
+        return self._opened().duration
+
+    @property
+    def nframes(self):
+        """Number of frames in the file."""
+        return self._opened().nframes
+
+    @property
+    def backend(self):
+        """The audio file object created by the backend."""
+        return self._opened()
+
+    def read_data(self):
+        """Generate the buffered blocks, waiting for the decoder when the
+        buffer runs dry. Errors from decoding are raised here.
+        """
+        self.ready.result()
+        state = self._state
+        while True:
+            with state.cond:
+                while not state.blocks and not state.done:
+                    state.cond.wait()
+                if state.blocks:
+                    block = state.blocks.popleft()
+                    state.buffered -= len(block)
+                    state.cond.notify_all()
+                elif state.exc is not None:
+                    raise state.exc
+                else:
+                    return
+            self._advance(len(block))
+            yield block
+
+    def close(self):
+        """Stop decoding, drop the buffered audio, and close the file."""
+        self._state.close()
+
+    def __del__(self):
+        self.close()
+
+    # Iteration.
+    def __iter__(self):
+        return self.read_data()
+
+    # Context manager.
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def open_sequence(paths, prefetch=2, backends=None, max_buffer=MAX_BUFFER):
+    """Generate audio files for each of `paths` in order, opening and
+    decoding up to `prefetch` files ahead of the current one in the
+    background.
+
+    The files are `PrefetchedAudioFile` objects. `max_buffer` is the
+    total number of bytes of decoded audio that may be held for the
+    current file and the files ahead of it, split evenly between them.
+    `backends` is passed to `audio_open` (by default, all available
+    backends are tried).
+
+    Each file is closed when the next one is requested, so it should
+    be consumed before advancing the iteration. A file that can't be
+    opened does not stop the sequence: its error is raised when the
+    file is used.
+    """
+    if prefetch < 0:
+        raise ValueError('prefetch must not be negative')
+    if backends is None:
+        backends = available_backends()
+    buffer_size = max(max_buffer // (prefetch + 1), 1)
+
+    paths = iter(paths)
+    window = collections.deque()
+    try:
+        while True:
+            # Keep the current file and `prefetch` more in flight.
+            for path in paths:
+                window.append(
+                    PrefetchedAudioFile(path, backends, buffer_size)
+                )
+                if len(window) > prefetch:
+                    break
+            if not window:
+                return
+
+            f = window.popleft()
+            try:
+                yield f
+            finally:
+                f.close()
+    finally:
+        for f in window:
+            f.close()
@@ -12,15 +12,17 @@
 # The above copyright notice and this permission notice shall be
 # included in all copies or substantial portions of the Software.
 
-"""Uses standard-library modules to read AIFF, AIFF-C, and WAV files."""
+"""Uses standard-library modules to read AIFF, AIFF-C, and WAV files,
+and `bigwav` for RF64, BW64, and Wave64 files."""
 import aifc
 import array
 import audioop
 import sunau
 import wave
 
+from . import bigwav
 from .exceptions import DecodeError
-from .base import AudioFile
+from .base import AudioFile, open_source
 
 # Produce two-byte (16-bit) output samples.
 TARGET_WIDTH = 2
@@ -30,7 +32,7 @@ SUPPORTED_WIDTHS = (1, 2, 3, 4)
 
 
 class UnsupportedError(DecodeError):
-    """File is not an AIFF, WAV, or Au file."""
+    """File is not an AIFF, WAV, RF64, Wave64, or Au file."""
 
 
 class BitWidthError(DecodeError):
@@ -50,16 +52,24 @@ def byteswap(s):
 
 class RawAudioFile(AudioFile):
     """An AIFF, WAV, or Au file that can be read by the Python standard
-    library modules ``wave``, ``aifc``, and ``sunau``.
+    library modules ``wave``, ``aifc``, and ``sunau``, or an RF64, BW64,
+    or Wave64 file (for audio larger than 4 GiB) read by `bigwav`.
+
+    `filename` may also be a seekable binary file object or a
+    bytes-like object holding the contents of the file.
     """
     def __init__(self, filename):
-        self._fh = open(filename, 'rb')
+        self._fh, self._owns_fh = open_source(filename)
+        if not self._owns_fh and not self._fh.seekable():
+            # We need to rewind between attempts with each reader.
+            raise UnsupportedError('file object is not seekable')
+        start = self._fh.tell()
 
         try:
             self._file = aifc.open(self._fh)
-        except aifc.Error:
+        except (aifc.Error, EOFError):
             # Return to the beginning of the file to try the next reader.
-            self._fh.seek(0)
+            self._fh.seek(start)
         else:
             self._needs_byteswap = True
             self._check()
@@ -67,18 +77,27 @@ class RawAudioFile(AudioFile):
 
         try:
             self._file = wave.open(self._fh)
-        except wave.Error:
-            self._fh.seek(0)
+        except (wave.Error, EOFError):
+            self._fh.seek(start)
             pass
         else:
             self._needs_byteswap = False
             self._check()
             return
 
+        try:
+            self._file = bigwav.open(self._fh)
+        except (bigwav.Error, EOFError):
+            self._fh.seek(start)
+        else:
+            self._needs_byteswap = False
+            self._check()
+            return
+
         try:
             self._file = sunau.open(self._fh)
-        except sunau.Error:
-            self._fh.seek(0)
+        except (sunau.Error, EOFError):
+            self._fh.seek(start)
             pass
         else:
             self._needs_byteswap = True
@@ -86,7 +105,8 @@ class RawAudioFile(AudioFile):
             return
 
         # None of the three libraries could open the file.
-        self._fh.close()
+        if self._owns_fh:
+            self._fh.close()
         raise UnsupportedError()
 
     def _check(self):
@@ -98,9 +118,12 @@ class RawAudioFile(AudioFile):
             raise BitWidthError()
 
     def close(self):
-        """Close the underlying file."""
+        """Close the underlying file. File objects passed in by the
+        caller are left open.
+        """
         self._file.close()
-        self._fh.close()
+        if self._owns_fh:
+            self._fh.close()
 
     @property
     def channels(self):
@@ -115,7 +138,12 @@ class RawAudioFile(AudioFile):
     @property
     def duration(self):
         """Length of the audio in seconds (a float)."""
-        return float(self._file.getnframes()) / self.samplerate
+        return float(self.nframes) / self.samplerate
+
+    @property
+    def nframes(self):
+        """The exact number of frames, from the file header."""
+        return self._file.getnframes()
 
     def read_data(self, block_samples=1024):
         """Generates blocks of PCM data found in the file."""
@@ -136,6 +164,7 @@ class RawAudioFile(AudioFile):
             if needs_byteswap:
                 # Big-endian data. Swap endianness.
                 data = byteswap(data)
+            self._advance(len(data))
             yield data
 
     # Context manager.
@@ -0,0 +1,153 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Regroup the variably sized blocks produced by a backend into
+fixed-size, optionally overlapping windows of frames.
+
+    >>> with audioread.audio_open('something.mp3') as f:
+    >>>     for window in reblock(f, 2048, hop=512):
+    >>>         analyze(window)
+"""
+
+# The size of one 16-bit sample in bytes.
+SAMPLE_WIDTH = 2
+
+
+class RingBuffer:
+    """A FIFO queue of bytes stored in a circular `bytearray`.
+
+    Data is copied in and out through memoryviews, so no intermediate
+    `bytes` objects are created. The buffer grows (by reallocating) if
+    a write does not fit.
+    """
+    def __init__(self, capacity=64 * 1024):
+        self._buf = bytearray(max(capacity, 1))
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def capacity(self):
+        return len(self._buf)
+
+    def _grow(self, needed):
+        buf = bytearray(max(needed, 2 * len(self._buf)))
+        self.peek_into(memoryview(buf)[:self._len])
+        self._buf = buf
+        self._view = memoryview(buf)
+        self._start = 0
+
+    def write(self, data):
+        """Append the bytes-like object `data` to the queue."""
+        data = memoryview(data).cast('B')
+        size = len(data)
+        if self._len + size > len(self._buf):
+            self._grow(self._len + size)
+
+        capacity = len(self._buf)
+        end = (self._start + self._len) % capacity
+        first = min(size, capacity - end)
+        self._view[end:end + first] = data[:first]
+        if first < size:
+            # Wrap around to the beginning.
+            self._view[:size - first] = data[first:]
+        self._len += size
+
+    def peek_into(self, out):
+        """Copy the first ``len(out)`` queued bytes into the writable
+        buffer `out` without consuming them.
+        """
+        out = memoryview(out).cast('B')
+        size = len(out)
+        if size > self._len:
+            raise ValueError('not enough data in buffer')
+
+        capacity = len(self._buf)
+        first = min(size, capacity - self._start)
+        out[:first] = self._view[self._start:self._start + first]
+        if first < size:
+            out[first:] = self._view[:size - first]
+
+    def discard(self, size):
+        """Drop up to `size` bytes from the front of the queue and
+        return the number of bytes dropped.
+        """
+        size = min(size, self._len)
+        self._len -= size
+        if self._len:
+            self._start = (self._start + size) % len(self._buf)
+        else:
+            self._start = 0
+        return size
+
+
+def reblock(audiofile, size, hop=None, pad=False):
+    """Generate windows of exactly `size` frames from an audio file
+    (or any object with a ``channels`` attribute that iterates over
+    blocks of 16-bit interleaved PCM).
+
+    Consecutive windows start `hop` frames apart (by default, `size`,
+    so windows don't overlap). A `hop` larger than `size` skips the
+    frames in between. Windows never split a frame, even when the
+    backend's blocks do.
+
+    Each window is a new `bytearray`, so it can be kept after the
+    iteration moves on. If `pad` is true, the audio at the end that
+    has not been covered by a full window is yielded in windows padded
+    with silence; otherwise it is dropped.
+    """
+    hop = size if hop is None else hop
+    if size <= 0 or hop <= 0:
+        raise ValueError('window size and hop must be positive')
+
+    frame_size = SAMPLE_WIDTH * audiofile.channels
+    window_bytes = size * frame_size
+    hop_bytes = hop * frame_size
+
+    ring = RingBuffer(2 * max(window_bytes, hop_bytes))
+    # Bytes at the front of the ring that were already part of an
+    # emitted window, and bytes still to be dropped when hop > size.
+    covered = 0
+    skip = 0
+
+    def advance():
+        nonlocal covered, skip
+        skip = hop_bytes - ring.discard(hop_bytes)
+        covered = max(window_bytes - hop_bytes, 0)
+
+    for block in audiofile:
+        block = memoryview(block).cast('B')
+        if skip:
+            dropped = min(skip, len(block))
+            block = block[dropped:]
+            skip -= dropped
+        ring.write(block)
+        while len(ring) >= window_bytes:
+            window = bytearray(window_bytes)
+            ring.peek_into(window)
+            yield window
+            advance()
+
+    if pad:
+        # Only whole frames are emitted.
+        ring_len = len(ring) - len(ring) % frame_size
+        while ring_len > covered:
+            window = bytearray(window_bytes)
+            ring.peek_into(memoryview(window)[:ring_len])
+            yield window
+            advance()
+            ring_len = len(ring) - len(ring) % frame_size
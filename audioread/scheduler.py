@@ -0,0 +1,210 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Limit the number of decoders that are open at once.
+
+Each open FFmpeg or GStreamer file holds a process or a pipeline, and
+opening too many at once overcommits the machine. A `Scheduler` caps the
+number of concurrently open files per backend and queues the rest by
+priority. It is opt-in: once installed with `set_scheduler`, every
+`audio_open` call waits for a slot before constructing a backend's file,
+and the slot is released when the file is closed (or garbage
+collected):
+
+    >>> scheduler = Scheduler({ffdec.FFmpegAudioFile: 8})
+    >>> set_scheduler(scheduler)
+    >>> f = audio_open(path, priority=INTERACTIVE)
+    >>> scheduler.stats()[ffdec.FFmpegAudioFile].queued
+"""
+import collections
+import heapq
+import itertools
+import threading
+import time
+import weakref
+
+# Priorities. Lower values are served first.
+INTERACTIVE = 0
+BATCH = 10
+
+PoolStats = collections.namedtuple(
+    'PoolStats',
+    ['limit', 'active', 'queued', 'acquired', 'total_wait', 'max_wait'],
+)
+PoolStats.__doc__ = """Counters for one backend. `limit` is None when the
+backend is not limited; `total_wait` and `max_wait` are the seconds that
+`acquired` requests spent queued.
+"""
+
+
+class _Pool:
+    """The slots and queue for one backend."""
+    def __init__(self, limit):
+        self.limit = limit
+        self.active = 0
+        # A heap of [priority, sequence number] entries.
+        self.waiting = []
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def has_room(self):
+        return self.limit is None or self.active < self.limit
+
+
+class Slot:
+    """A permission to keep one decoder open. Release it exactly once;
+    extra calls to `release` have no effect.
+    """
+    def __init__(self, scheduler, backend):
+        self._scheduler = scheduler
+        self._backend = backend
+        self._released = False
+
+    def release(self):
+        self._scheduler._release(self)
+
+    def attach(self, audio_file):
+        """Hold the slot until `audio_file` is closed or collected.
+
+        The slot is kept on the file, and `AudioFile` releases it after
+        the backend's own `close` has run, so the decoder is always shut
+        down, even when the file is closed by the garbage collector.
+        """
+        audio_file._slot = self
+        weakref.finalize(audio_file, self.release)
+
+
+class Scheduler:
+    """Limit the number of concurrently open decoders per backend.
+
+    `limits` maps backend classes to the number of files of that class
+    that may be open at once; `default` applies to other backends (by
+    default, they are not limited). Requests beyond the limit wait, and
+    are granted in order of priority and then of arrival. Limits can be
+    changed at any time with `set_limit`.
+    """
+    def __init__(self, limits=None, default=None):
+        self._cond = threading.Condition()
+        self._default = default
+        self._pools = {}
+        self._counter = itertools.count()
+        for backend, limit in (limits or {}).items():
+            self.set_limit(backend, limit)
+
+    def _pool(self, backend):
+        pool = self._pools.get(backend)
+        if pool is None:
+            pool = self._pools[backend] = _Pool(self._default)
+        return pool
+
+    def set_limit(self, backend, limit):
+        """Set the maximum number of open files for a backend class (or
+        None for no limit). Lowering a limit does not close any files;
+        new requests wait until enough have been closed.
+        """
+        with self._cond:
+            self._pool(backend).limit = limit
+            self._cond.notify_all()
+
+    def acquire(self, backend, priority=BATCH, timeout=None):
+        """Wait for a slot for a file of the `backend` class and return
+        it as a `Slot`. Raise `TimeoutError` if no slot is free within
+        `timeout` seconds.
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._cond:
+            pool = self._pool(backend)
+            entry = [priority, next(self._counter)]
+            heapq.heappush(pool.waiting, entry)
+            try:
+                while not (pool.waiting[0] is entry and pool.has_room()):
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise TimeoutError(
+                                'no decoder slot free for {}'.format(
+                                    backend.__name__
+                                )
+                            )
+                    self._cond.wait(remaining)
+            except BaseException:
+                pool.waiting.remove(entry)
+                heapq.heapify(pool.waiting)
+                self._cond.notify_all()
+                raise
+
+            heapq.heappop(pool.waiting)
+            pool.active += 1
+            waited = time.monotonic() - start
+            pool.acquired += 1
+            pool.total_wait += waited
+            pool.max_wait = max(pool.max_wait, waited)
+            # The next request in line may fit as well.
+            self._cond.notify_all()
+        return Slot(self, backend)
+
+    def _release(self, slot):
+        with self._cond:
+            if slot._released:
+                return
+            slot._released = True
+            self._pools[slot._backend].active -= 1
+            self._cond.notify_all()
+
+    def open(self, backend, path, priority=BATCH):
+        """Open `path` with the `backend` class once a slot is free. The
+        slot is released when the file is closed, or right away if the
+        backend fails to open it.
+        """
+        slot = self.acquire(backend, priority)
+        try:
+            audio_file = backend(path)
+        except BaseException:
+            slot.release()
+            raise
+        slot.attach(audio_file)
+        return audio_file
+
+    def stats(self):
+        """Get a dictionary mapping each backend class that has been
+        used or configured to its `PoolStats`.
+        """
+        with self._cond:
+            return {
+                backend: PoolStats(pool.limit, pool.active,
+                                   len(pool.waiting), pool.acquired,
+                                   pool.total_wait, pool.max_wait)
+                for backend, pool in self._pools.items()
+            }
+
+
+# The scheduler used by `audio_open`, if any.
+_scheduler = None
+
+
+def set_scheduler(scheduler):
+    """Install a `Scheduler` for `audio_open` to use, or remove it by
+    passing None. Return the previous one.
+    """
+    global _scheduler
+    previous, _scheduler = _scheduler, scheduler
+    return previous
+
+
+def get_scheduler():
+    """Get the installed `Scheduler`, or None."""
+    return _scheduler
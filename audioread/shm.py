@@ -0,0 +1,242 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Decode audio into shared memory for multi-process pipelines.
+
+Instead of pickling blocks of PCM to send them between processes, the
+decoder writes them into `multiprocessing.shared_memory` segments and
+passes around small `SharedPCM` handles. A consumer in another process
+opens a handle to get a zero-copy memoryview of the data:
+
+    >>> # In a decoding worker:
+    >>> handles = list(iter_shared(audio_file))
+    >>> # In an analysis worker, after receiving `handles`:
+    >>> for handle in handles:
+    >>>     with handle.open() as pcm:
+    >>>         analyze(pcm, handle.channels, handle.samplerate)
+    >>>     handle.unlink()
+
+Every segment must be unlinked exactly once, normally by the last
+consumer, or it stays allocated until the system reclaims it.
+
+Windows is not supported: there, a named segment is destroyed as soon
+as its last handle is closed, which the decoder does before any
+consumer attaches.
+"""
+import contextlib
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from . import audio_open
+from .exceptions import DecodeError
+
+# The size of one 16-bit sample in bytes.
+SAMPLE_WIDTH = 2
+
+# The default number of frames in each segment made by `iter_shared`.
+SEGMENT_FRAMES = 64 * 1024
+
+
+# Segments are owned by their handles rather than by the process that
+# created them, so they are kept away from the multiprocessing resource
+# tracker (which would unlink them when that process exits). Python
+# 3.13 can opt out directly; older versions register every segment.
+if sys.version_info >= (3, 13):
+    _NO_TRACK = {'track': False}
+else:
+    _NO_TRACK = {}
+_UNREGISTER = not _NO_TRACK and os.name == 'posix'
+
+# Segments only outlive their creator's handle on POSIX systems.
+SUPPORTED = os.name == 'posix'
+
+
+class UnsupportedError(DecodeError):
+    """Shared memory segments can't be handed between processes on this
+    platform.
+    """
+
+
+def _check_supported():
+    if not SUPPORTED:
+        raise UnsupportedError(
+            'shared memory segments do not outlive their creator here'
+        )
+
+
+def _tracker_name(shm):
+    # The resource tracker knows POSIX segments by their name with the
+    # leading slash that `SharedMemory.name` leaves out.
+    return '/' + shm.name
+
+
+def _segment(name=None, size=0):
+    """Create a new shared memory segment of `size` bytes or, if `name`
+    is given, attach to an existing one.
+    """
+    if name is None:
+        shm = shared_memory.SharedMemory(
+            create=True, size=size, **_NO_TRACK
+        )
+    else:
+        shm = shared_memory.SharedMemory(name, **_NO_TRACK)
+    if _UNREGISTER:
+        resource_tracker.unregister(_tracker_name(shm), 'shared_memory')
+    return shm
+
+
+def _unlink(shm):
+    """Close and free a segment."""
+    shm.close()
+    if _UNREGISTER:
+        # `unlink` unregisters the segment, so it has to be known to
+        # the tracker first.
+        resource_tracker.register(_tracker_name(shm), 'shared_memory')
+    shm.unlink()
+
+
+class SharedPCM:
+    """A picklable handle to 16-bit interleaved PCM data stored in a
+    shared memory segment, along with the stream's parameters.
+    """
+    def __init__(self, name, size, channels, samplerate, offset=0):
+        self.name = name
+        self.size = size
+        self.channels = channels
+        self.samplerate = samplerate
+        self.offset = offset
+
+    def __repr__(self):
+        return '{}({!r}, {}, {}, {}, {})'.format(
+            type(self).__name__, self.name, self.size, self.channels,
+            self.samplerate, self.offset,
+        )
+
+    @property
+    def nframes(self):
+        """The number of frames in the segment."""
+        return self.size // (SAMPLE_WIDTH * self.channels)
+
+    @contextlib.contextmanager
+    def open(self):
+        """Attach to the segment and provide a memoryview of the PCM
+        data. The view is only valid inside the ``with`` block; copy
+        anything that needs to outlive it.
+        """
+        shm = _segment(self.name)
+        view = shm.buf[self.offset:self.offset + self.size]
+        try:
+            yield view
+        finally:
+            view.release()
+            shm.close()
+
+    def read(self):
+        """Copy the PCM data out of shared memory as `bytes`."""
+        with self.open() as view:
+            return bytes(view)
+
+    def unlink(self):
+        """Free the shared memory segment."""
+        _unlink(_segment(self.name))
+
+
+def _handle(shm, size, channels, samplerate):
+    return SharedPCM(shm.name, size, channels, samplerate)
+
+
+def iter_shared(audio_file, segment_frames=SEGMENT_FRAMES):
+    """Decode an audio file into a sequence of shared memory segments
+    of `segment_frames` frames each (the last may be shorter),
+    yielding a `SharedPCM` handle for each one as soon as it is full.
+
+    The backend's blocks are copied straight into the segments, which
+    never split a frame. Raises `UnsupportedError` on platforms (like
+    Windows) where a segment can't outlive the decoder's handle.
+    """
+    _check_supported()
+    channels = audio_file.channels
+    samplerate = audio_file.samplerate
+    segment_bytes = segment_frames * SAMPLE_WIDTH * channels
+
+    shm = None
+    fill = 0
+    try:
+        for block in audio_file:
+            view = memoryview(block).cast('B')
+            while view:
+                if shm is None:
+                    shm = _segment(size=segment_bytes)
+                    fill = 0
+                size = min(len(view), segment_bytes - fill)
+                shm.buf[fill:fill + size] = view[:size]
+                fill += size
+                view = view[size:]
+
+                if fill == segment_bytes:
+                    handle = _handle(shm, fill, channels, samplerate)
+                    shm.close()
+                    shm = None
+                    yield handle
+
+        if shm is not None:
+            # The final, partial segment (dropping any partial frame).
+            fill -= fill % (SAMPLE_WIDTH * channels)
+            handle = _handle(shm, fill, channels, samplerate)
+            shm.close()
+            shm = None
+            yield handle
+    finally:
+        if shm is not None:
+            # The consumer stopped early or decoding failed; nobody else
+            # knows about this segment.
+            _unlink(shm)
+
+
+def decode_shared(path, backends=None):
+    """Decode an entire audio file into a single shared memory segment
+    and return its `SharedPCM` handle.
+
+    `path` and `backends` are passed to `audio_open`. The segment is
+    sized from the file's ``nframes`` (when it is known); if the decoder
+    produces more audio than that, the data is moved into a larger
+    segment. Raises `UnsupportedError` where `iter_shared` does.
+    """
+    _check_supported()
+    with audio_open(path, backends) as f:
+        frame_size = SAMPLE_WIDTH * f.channels
+        capacity = max((f.nframes or 0) * frame_size, frame_size)
+        shm = _segment(size=capacity)
+        fill = 0
+        try:
+            for block in f:
+                view = memoryview(block).cast('B')
+                if fill + len(view) > capacity:
+                    # Grow by at least half.
+                    capacity = max(fill + len(view), capacity * 3 // 2)
+                    bigger = _segment(size=capacity)
+                    bigger.buf[:fill] = shm.buf[:fill]
+                    _unlink(shm)
+                    shm = bigger
+                shm.buf[fill:fill + len(view)] = view
+                fill += len(view)
+        except BaseException:
+            _unlink(shm)
+            raise
+
+        fill -= fill % frame_size
+        handle = _handle(shm, fill, f.channels, f.samplerate)
+        shm.close()
+        return handle
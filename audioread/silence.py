@@ -0,0 +1,169 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Drop silence from decoded audio while keeping track of where each
+remaining piece came from.
+
+`trim_silence` wraps an audio file and yields ``(offset, block)``
+pairs, where `offset` is the position of the block's first frame in
+the original audio, so positions can still be mapped back to the
+source:
+
+    >>> with audioread.audio_open('speech.wav') as f:
+    >>>     for offset, block in trim_silence(f, threshold=-50):
+    >>>         transcribe(block, start=offset / f.samplerate)
+
+The audio is examined in short windows. A window is silent when no
+sample in it exceeds the threshold; each window is checked with a
+single pass of built-in reductions over an array of samples.
+"""
+import math
+import sys
+import tempfile
+from array import array
+
+# The size of one 16-bit sample in bytes.
+SAMPLE_WIDTH = 2
+
+# Silence held back until it is known whether it will be kept is moved
+# from memory to a temporary file once it grows past this many bytes.
+SPOOL_SIZE = 1 << 20
+
+# The size of the blocks that held-back silence is released in.
+RELEASE_SIZE = 1 << 16
+
+
+def _is_silent(data, level):
+    samples = array('h')
+    samples.frombytes(data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return max(samples) <= level and min(samples) >= -level
+
+
+def trim_silence(audio_file, threshold=-60.0, min_silence=0.5,
+                 window=0.01, leading=True, trailing=True, internal=True):
+    """Generate ``(offset, block)`` pairs for the non-silent parts of an
+    audio file (or any object with ``channels`` and ``samplerate``
+    attributes that iterates over blocks of 16-bit interleaved PCM).
+
+    `threshold` is the level, in dBFS, at or below which audio counts
+    as silence, and `window` is the length of the analysis windows in
+    seconds. `leading` and `trailing` silence is dropped in full, while
+    `internal` silences are dropped only when they last at least
+    `min_silence` seconds; shorter pauses are kept. Whether a silence
+    at the end is dropped depends only on `trailing`.
+
+    A silence that may yet be kept is held back until the audio after
+    it (or the end of the file) decides its fate; beyond `SPOOL_SIZE`
+    bytes, it is held in a temporary file rather than in memory.
+
+    `offset` counts frames from the start of the original audio. Each
+    block is a `bytes` object holding whole frames; consecutive kept
+    windows are joined into one block.
+    """
+    frame_size = SAMPLE_WIDTH * audio_file.channels
+    level = int(32768 * 10 ** (threshold / 20.0))
+    window_frames = max(int(window * audio_file.samplerate), 1)
+    window_bytes = window_frames * frame_size
+    min_windows = max(math.ceil(min_silence / window), 1)
+    release_bytes = max(RELEASE_SIZE // frame_size, 1) * frame_size
+
+    offset = 0          # Frame offset of the next window.
+    started = not leading
+    silent_offset = 0   # The current run of silent windows.
+    silent_windows = 0
+    run_offset = 0      # The block being assembled for output.
+    run = bytearray()
+
+    def keep(window_offset, data):
+        nonlocal run_offset, run
+        if run and run_offset + len(run) // frame_size != window_offset:
+            yield run_offset, bytes(run)
+            run = bytearray()
+        if not run:
+            run_offset = window_offset
+        run += data
+
+    def flush():
+        nonlocal run
+        if run:
+            yield run_offset, bytes(run)
+            run = bytearray()
+
+    def release(spool):
+        # Keep the held-back silence, in bounded pieces.
+        spool.seek(0)
+        position = silent_offset
+        while True:
+            data = spool.read(release_bytes)
+            if not data:
+                break
+            yield from keep(position, data)
+            position += len(data) // frame_size
+            if len(run) >= release_bytes:
+                yield from flush()
+
+    def process(data, spool):
+        nonlocal offset, started, silent_offset, silent_windows
+        window_offset = offset
+        offset += len(data) // frame_size
+
+        if not _is_silent(data, level):
+            started = True
+            if silent_windows:
+                if not internal or silent_windows < min_windows:
+                    yield from release(spool)
+                silent_windows = 0
+                spool.seek(0)
+                spool.truncate()
+            yield from keep(window_offset, data)
+        elif not started:
+            pass
+        elif internal or trailing:
+            # Wait to see how long the silence lasts and whether any
+            # audio follows it.
+            if not silent_windows:
+                silent_offset = window_offset
+            silent_windows += 1
+            if internal and trailing and silent_windows >= min_windows:
+                # Dropped whether or not audio follows, so only the
+                # length needs tracking.
+                if silent_windows == min_windows:
+                    spool.seek(0)
+                    spool.truncate()
+            else:
+                spool.write(data)
+        else:
+            yield from keep(window_offset, data)
+
+    with tempfile.SpooledTemporaryFile(SPOOL_SIZE) as spool:
+        buf = bytearray()
+        for block in audio_file:
+            buf += block
+            usable = len(buf) - len(buf) % window_bytes
+            for start in range(0, usable, window_bytes):
+                yield from process(bytes(buf[start:start + window_bytes]),
+                                   spool)
+            del buf[:usable]
+            # Stream what has been kept so far.
+            yield from flush()
+
+        # The final, partial window (whole frames only).
+        tail = len(buf) - len(buf) % frame_size
+        if tail:
+            yield from process(bytes(buf[:tail]), spool)
+        if silent_windows and not trailing:
+            yield from release(spool)
+        yield from flush()
@@ -0,0 +1,252 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Compute level statistics and a waveform overview while decoding.
+
+A `Summary` is fed the blocks of an audio file as they pass through to
+the consumer, and computes each channel's peak and RMS level and a
+min/max overview at a fixed resolution (suitable for drawing a waveform
+thumbnail) without a second pass over the audio:
+
+    >>> with audioread.audio_open('something.mp3') as f:
+    >>>     summary = Summary.for_file(f, bins=1000)
+    >>>     for block in summary.tap(f):
+    >>>         do_something(block)
+    >>> print(summary.peak, summary.rms)
+    >>> summary.save('something.mp3.peaks')
+
+Each block is converted to an array of samples once; the statistics are
+then computed per channel with array slicing and built-in reductions,
+so no Python code runs per sample.
+"""
+import math
+import operator
+import struct
+import sys
+from array import array
+
+from .exceptions import DecodeError
+
+# The size of one 16-bit sample in bytes.
+SAMPLE_WIDTH = 2
+
+# The sidecar file header: magic, version, channels, sample rate,
+# samples per bin, number of bins, and number of frames.
+MAGIC = b'ARPK'
+VERSION = 1
+HEADER = struct.Struct('<4sBHIIIQ')
+
+
+class SummaryFormatError(DecodeError):
+    """A sidecar file could not be parsed."""
+
+
+def _samples(data):
+    """Convert little-endian 16-bit PCM to an array of ints."""
+    samples = array('h')
+    samples.frombytes(data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples
+
+
+class Summary:
+    """Streaming signal statistics for 16-bit interleaved PCM.
+
+    `samples_per_bin` sets the resolution of the overview: each bin
+    holds the smallest and largest sample of that many frames, per
+    channel.
+    """
+    def __init__(self, channels, samplerate, samples_per_bin=1024):
+        if samples_per_bin <= 0:
+            raise ValueError('samples_per_bin must be positive')
+        self.channels = channels
+        self.samplerate = samplerate
+        self.samples_per_bin = samples_per_bin
+        self.frames = 0
+
+        self._peaks = [0] * channels
+        self._squares = [0] * channels
+        self._mins = [array('h') for _ in range(channels)]
+        self._maxs = [array('h') for _ in range(channels)]
+        # The bin in progress.
+        self._bin_frames = 0
+        self._bin_min = [0] * channels
+        self._bin_max = [0] * channels
+        # A partial frame left over from the last block.
+        self._leftover = b''
+
+    @classmethod
+    def for_file(cls, audio_file, bins=1000):
+        """Make a summary for `audio_file` whose overview has about
+        `bins` bins, based on the file's ``nframes``. If the length is
+        unknown, the default bin size is used.
+        """
+        nframes = audio_file.nframes
+        if nframes is None:
+            return cls(audio_file.channels, audio_file.samplerate)
+        return cls(audio_file.channels, audio_file.samplerate,
+                   max(math.ceil(nframes / bins), 1))
+
+    def update(self, block):
+        """Add a block of PCM data to the summary."""
+        frame_size = SAMPLE_WIDTH * self.channels
+        data = self._leftover + bytes(block) if self._leftover else block
+        usable = len(data) - len(data) % frame_size
+        self._leftover = bytes(data[usable:])
+        if not usable:
+            return
+
+        samples = _samples(memoryview(data)[:usable])
+        nframes = usable // frame_size
+        self.frames += nframes
+
+        for c in range(self.channels):
+            channel = samples[c::self.channels]
+            self._peaks[c] = max(self._peaks[c],
+                                 max(channel), -min(channel))
+            self._squares[c] += sum(map(operator.mul, channel, channel))
+
+        # Fill the overview bins.
+        pos = 0
+        while pos < nframes:
+            count = min(self.samples_per_bin - self._bin_frames,
+                        nframes - pos)
+            start = pos * self.channels
+            stop = (pos + count) * self.channels
+            for c in range(self.channels):
+                piece = samples[start + c:stop:self.channels]
+                lo, hi = min(piece), max(piece)
+                if self._bin_frames:
+                    lo = min(lo, self._bin_min[c])
+                    hi = max(hi, self._bin_max[c])
+                self._bin_min[c] = lo
+                self._bin_max[c] = hi
+            self._bin_frames += count
+            pos += count
+
+            if self._bin_frames == self.samples_per_bin:
+                self._close_bin()
+
+    def _close_bin(self):
+        for c in range(self.channels):
+            self._mins[c].append(self._bin_min[c])
+            self._maxs[c].append(self._bin_max[c])
+        self._bin_frames = 0
+
+    def tap(self, blocks):
+        """Pass the blocks from an iterable (such as an audio file)
+        through unchanged, adding each to the summary on the way.
+        """
+        for block in blocks:
+            self.update(block)
+            yield block
+
+    @property
+    def peak(self):
+        """The largest absolute sample value of each channel, relative
+        to full scale.
+        """
+        return [p / 32768.0 for p in self._peaks]
+
+    @property
+    def rms(self):
+        """The RMS level of each channel, relative to full scale."""
+        if not self.frames:
+            return [0.0] * self.channels
+        return [math.sqrt(s / self.frames) / 32768.0 for s in self._squares]
+
+    def overview(self):
+        """Get a ``(mins, maxs)`` pair of sample arrays for each channel,
+        with one entry per bin. A final, partial bin is included.
+        """
+        out = []
+        for c in range(self.channels):
+            mins, maxs = array('h', self._mins[c]), array('h', self._maxs[c])
+            if self._bin_frames:
+                mins.append(self._bin_min[c])
+                maxs.append(self._bin_max[c])
+            out.append((mins, maxs))
+        return out
+
+    # Sidecar files.
+
+    def dumps(self):
+        """Serialize the summary as compact binary data.
+
+        The format is a header followed by each channel's peak (as an
+        unsigned 16-bit sample), its sum of squares (as a double), and
+        the overview's min/max pairs, interleaved by channel within
+        each bin. All values are little-endian.
+        """
+        overview = self.overview()
+        nbins = len(overview[0][0]) if overview else 0
+        parts = [HEADER.pack(MAGIC, VERSION, self.channels, self.samplerate,
+                             self.samples_per_bin, nbins, self.frames)]
+        parts.append(struct.pack('<{}H'.format(self.channels), *self._peaks))
+        parts.append(struct.pack('<{}d'.format(self.channels),
+                                 *self._squares))
+
+        pairs = array('h', bytes(nbins * self.channels * 2 * SAMPLE_WIDTH))
+        for c, (mins, maxs) in enumerate(overview):
+            pairs[2 * c::2 * self.channels] = mins
+            pairs[2 * c + 1::2 * self.channels] = maxs
+        if sys.byteorder == 'big':
+            pairs.byteswap()
+        parts.append(pairs.tobytes())
+        return b''.join(parts)
+
+    @classmethod
+    def loads(cls, data):
+        """Load a summary written by `dumps`."""
+        try:
+            (magic, version, channels, samplerate, samples_per_bin, nbins,
+             frames) = HEADER.unpack_from(data)
+        except struct.error:
+            raise SummaryFormatError('truncated summary header')
+        if magic != MAGIC or version != VERSION:
+            raise SummaryFormatError('not a summary file')
+
+        pos = HEADER.size
+        size = channels * (2 + 8) + nbins * channels * 2 * SAMPLE_WIDTH
+        if len(data) - pos != size:
+            raise SummaryFormatError('summary has the wrong size')
+
+        summary = cls(channels, samplerate, samples_per_bin)
+        summary.frames = frames
+        summary._peaks = list(struct.unpack_from(
+            '<{}H'.format(channels), data, pos
+        ))
+        pos += 2 * channels
+        summary._squares = list(struct.unpack_from(
+            '<{}d'.format(channels), data, pos
+        ))
+        pos += 8 * channels
+
+        pairs = _samples(memoryview(data)[pos:])
+        for c in range(channels):
+            summary._mins[c] = pairs[2 * c::2 * channels]
+            summary._maxs[c] = pairs[2 * c + 1::2 * channels]
+        return summary
+
+    def save(self, path):
+        """Write the summary to a sidecar file."""
+        with open(path, 'wb') as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path):
+        """Read a summary from a sidecar file."""
+        with open(path, 'rb') as f:
+            return cls.loads(f.read())
@@ -0,0 +1,220 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""A synthetic backend that generates deterministic PCM in-process.
+
+It costs next to nothing per block, so it can be used to measure the
+overhead of audioread itself (backend selection, generators, buffering,
+and wrappers like `reblock` or the scheduler) apart from any decoder,
+and to test that machinery without FFmpeg or GStreamer installed.
+
+It is never picked automatically. Pass it to `audio_open` explicitly
+with a ``synth:`` URL naming the signal and its parameters:
+
+    >>> url = 'synth:tone?duration=60&frequency=440&channels=1'
+    >>> with audioread.audio_open(url, [SynthAudioFile]) as f:
+    >>>     for block in f:
+    >>>         do_something(block)
+"""
+import math
+import random
+import sys
+import time
+import urllib.parse
+from array import array
+
+from .base import AudioFile
+from .exceptions import DecodeError
+
+SCHEME = 'synth'
+
+SIGNALS = ('tone', 'noise', 'silence')
+
+# The generated signal is a loop of this many seconds of audio.
+LOOP_SECONDS = 1
+
+# Parameters accepted in ``synth:`` URLs and how to parse them.
+_PARAMS = {
+    'duration': float,
+    'samplerate': int,
+    'channels': int,
+    'block_frames': int,
+    'frequency': float,
+    'amplitude': float,
+    'seed': int,
+    'speed': float,
+}
+
+
+class UnsupportedError(DecodeError):
+    """The path is not a ``synth:`` URL."""
+
+
+def parse_url(url):
+    """Parse a ``synth:<signal>?<param>=<value>&...`` URL into keyword
+    arguments for `SynthAudioFile`.
+    """
+    if not isinstance(url, str):
+        raise UnsupportedError()
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme != SCHEME:
+        raise UnsupportedError()
+
+    kwargs = {}
+    if parts.path:
+        kwargs['signal'] = parts.path
+    for key, value in urllib.parse.parse_qsl(parts.query):
+        if key not in _PARAMS:
+            raise ValueError('unknown parameter {!r}'.format(key))
+        kwargs[key] = _PARAMS[key](value)
+    return kwargs
+
+
+def _generate(signal, samplerate, channels, frequency, amplitude, seed):
+    """Generate `LOOP_SECONDS` of interleaved, little-endian 16-bit
+    PCM.
+    """
+    nframes = LOOP_SECONDS * samplerate
+    peak = max(min(int(amplitude * 32767), 32767), 0)
+    if signal == 'tone':
+        step = 2 * math.pi * frequency / samplerate
+        mono = array('h', (int(peak * math.sin(step * i))
+                           for i in range(nframes)))
+        samples = array('h', bytes(nframes * channels * 2))
+        for c in range(channels):
+            samples[c::channels] = mono
+    elif signal == 'noise':
+        rng = random.Random(seed)
+        samples = array('h', (rng.randint(-peak, peak)
+                              for _ in range(nframes * channels)))
+    elif signal == 'silence':
+        samples = array('h', bytes(nframes * channels * 2))
+    else:
+        raise ValueError('unknown signal {!r}'.format(signal))
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+class SynthAudioFile(AudioFile):
+    """Generated audio: a sine `tone`, white `noise` (from a seeded
+    generator), or `silence`.
+
+    `path` is a ``synth:`` URL (see `parse_url`) whose parameters
+    override the keyword arguments, or None to use the keyword arguments
+    alone. Blocks hold `block_frames` frames (the last may be shorter).
+    The signal repeats every `LOOP_SECONDS`, so a tone's frequency
+    should be a whole number of Hz for a seamless loop.
+
+    By default, blocks are produced as fast as they are read. Set
+    `speed` to deliver them at that multiple of realtime instead, like
+    a live source.
+    """
+    def __init__(self, path=None, signal='tone', duration=10.0,
+                 samplerate=44100, channels=2, block_frames=1024,
+                 frequency=440.0, amplitude=0.5, seed=0, speed=None):
+        if path is not None:
+            kwargs = parse_url(path)
+            signal = kwargs.get('signal', signal)
+            duration = kwargs.get('duration', duration)
+            samplerate = kwargs.get('samplerate', samplerate)
+            channels = kwargs.get('channels', channels)
+            block_frames = kwargs.get('block_frames', block_frames)
+            frequency = kwargs.get('frequency', frequency)
+            amplitude = kwargs.get('amplitude', amplitude)
+            seed = kwargs.get('seed', seed)
+            speed = kwargs.get('speed', speed)
+        if samplerate <= 0 or channels <= 0 or block_frames <= 0:
+            raise ValueError('samplerate, channels, and block_frames must '
+                             'be positive')
+        if duration < 0:
+            raise ValueError('duration must not be negative')
+
+        self.signal = signal
+        self.block_frames = block_frames
+        self.speed = speed
+        self._samplerate = samplerate
+        self._channels = channels
+        self._nframes = round(duration * samplerate)
+        self._closed = False
+
+        loop = _generate(signal, samplerate, channels, frequency,
+                         amplitude, seed)
+        self._loop_bytes = len(loop)
+        # Enough of the loop repeated that any block is a single slice.
+        block_bytes = block_frames * channels * 2
+        self._data = loop * (block_bytes // len(loop) + 2)
+
+    @property
+    def channels(self):
+        """Number of audio channels."""
+        return self._channels
+
+    @property
+    def samplerate(self):
+        """Sample rate in Hz."""
+        return self._samplerate
+
+    @property
+    def duration(self):
+        """Length of the audio in seconds (a float)."""
+        return float(self._nframes) / self._samplerate
+
+    @property
+    def nframes(self):
+        """The exact number of frames."""
+        return self._nframes
+
+    def read_data(self):
+        """Generate blocks of PCM data."""
+        frame_size = self._channels * 2
+        data = self._data
+        pos = 0  # Byte offset into the loop.
+        remaining = self._nframes
+        start = time.monotonic()
+        delivered = 0
+
+        while remaining > 0 and not self._closed:
+            count = min(self.block_frames, remaining)
+            size = count * frame_size
+            block = data[pos:pos + size]
+            pos = (pos + size) % self._loop_bytes
+            remaining -= count
+
+            if self.speed:
+                # Wait until this block is due.
+                delay = (start + delivered / self._samplerate / self.speed
+                         - time.monotonic())
+                if delay > 0:
+                    time.sleep(delay)
+            delivered += count
+
+            self._advance(size)
+            yield block
+
+    def close(self):
+        """Stop generating audio."""
+        self._closed = True
+
+    # Context manager.
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    # Iteration.
+    def __iter__(self):
+        return self.read_data()
@@ -0,0 +1,205 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Benchmark each decoding backend over a set of generated fixtures.
+
+For every (backend, fixture) pair this measures:
+
+- ``open``: seconds spent in the backend's constructor;
+- ``first_block``: seconds from the start of the open until the first
+  block of PCM is available;
+- ``throughput``: seconds of audio decoded per wall-clock second, and
+  the PCM byte rate;
+- ``peak_python_bytes``: the peak of Python-level allocations during a
+  full decode (measured in a separate pass with ``tracemalloc``).
+
+Results are written as JSON so that runs from different commits can be
+compared with ``compare.py``.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audioread  # noqa: E402
+import fixtures  # noqa: E402
+
+# The backends to measure, as (name, module, class) triples. They are
+# imported lazily because most are optional.
+BACKENDS = [
+    ('raw', 'audioread.rawread', 'RawAudioFile'),
+    ('ffmpeg', 'audioread.ffdec', 'FFmpegAudioFile'),
+    ('gstreamer', 'audioread.gstdec', 'GstAudioFile'),
+    ('mad', 'audioread.maddec', 'MadAudioFile'),
+]
+
+
+def load_backends(names=None):
+    """Return a list of (name, class or None, reason) for the backends
+    that were requested, noting why unavailable backends are skipped.
+    """
+    available = audioread.available_backends()
+    out = []
+    for name, module, clsname in BACKENDS:
+        if names and name not in names:
+            continue
+        cls = next(
+            (b for b in available
+             if b.__module__ == module and b.__name__ == clsname),
+            None,
+        )
+        out.append((name, cls, None if cls else 'not available'))
+    return out
+
+
+def decode_once(cls, path):
+    """Open and fully decode `path`, returning a timing dictionary."""
+    start = time.perf_counter()
+    f = cls(path)
+    opened = time.perf_counter()
+    first = None
+    nbytes = 0
+    blocks = 0
+    try:
+        for block in f:
+            if first is None:
+                first = time.perf_counter()
+            nbytes += len(block)
+            blocks += 1
+        end = time.perf_counter()
+        audio_seconds = nbytes / (2.0 * f.channels * f.samplerate)
+    finally:
+        f.close()
+    return {
+        'open': opened - start,
+        'first_block': (first or end) - start,
+        'decode': end - start,
+        'bytes': nbytes,
+        'blocks': blocks,
+        'audio_seconds': audio_seconds,
+    }
+
+
+def peak_memory(cls, path):
+    """Return the peak traced allocation size for a full decode."""
+    tracemalloc.start()
+    try:
+        with cls(path) as f:
+            for _ in f:
+                pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench(cls, fixture, repeat):
+    runs = [decode_once(cls, fixture.path) for _ in range(repeat)]
+    decode = statistics.median(r['decode'] for r in runs)
+    audio_seconds = runs[0]['audio_seconds']
+    return {
+        'open': statistics.median(r['open'] for r in runs),
+        'first_block': statistics.median(r['first_block'] for r in runs),
+        'decode': decode,
+        'realtime_factor': audio_seconds / decode if decode else None,
+        'bytes_per_second': runs[0]['bytes'] / decode if decode else None,
+        'blocks': runs[0]['blocks'],
+        'audio_seconds': audio_seconds,
+        'peak_python_bytes': peak_memory(cls, fixture.path),
+    }
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, check=True, text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--output', default='bench-results.json',
+                        help='where to write the JSON results')
+    parser.add_argument('--fixtures', default='bench-fixtures',
+                        help='directory for generated fixtures')
+    parser.add_argument('--duration', type=float, default=10.0,
+                        help='length of each fixture in seconds')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs per measurement (the median is kept)')
+    parser.add_argument('--backend', action='append', dest='backends',
+                        choices=[b[0] for b in BACKENDS],
+                        help='only measure this backend (repeatable)')
+    args = parser.parse_args(argv)
+
+    fixture_list = fixtures.generate(args.fixtures, args.duration)
+    results = []
+    for name, cls, reason in load_backends(args.backends):
+        for fixture in fixture_list:
+            entry = {'backend': name, 'fixture': fixture.name}
+            if cls is None:
+                entry['skipped'] = reason
+            else:
+                try:
+                    entry.update(bench(cls, fixture, args.repeat))
+                except audioread.DecodeError as exc:
+                    entry['skipped'] = 'unsupported: {!r}'.format(exc)
+            results.append(entry)
+            print(format_entry(entry), file=sys.stderr)
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': sys.version,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+        },
+        'fixtures': [f.as_dict() for f in fixture_list],
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print('Wrote', args.output, file=sys.stderr)
+
+
+def format_entry(entry):
+    label = '{backend:>10} {fixture:<16}'.format(**entry)
+    if 'skipped' in entry:
+        return '{} skipped ({})'.format(label, entry['skipped'])
+    return (
+        '{} open {:7.2f} ms  first block {:7.2f} ms  '
+        '{:8.1f}x realtime  peak {:8.1f} KiB'.format(
+            label,
+            entry['open'] * 1000,
+            entry['first_block'] * 1000,
+            entry['realtime_factor'] or 0,
+            entry['peak_python_bytes'] / 1024,
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Measure the time it takes to ``import audioread``.
+
+Each measurement runs in a fresh interpreter. The median and minimum
+import times are reported, along with the slowest modules according to
+``python -X importtime``. With ``--budget``, the exit status is nonzero
+if the fastest import exceeds the budget (in milliseconds).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEASURE = (
+    'import time; start = time.perf_counter(); import audioread; '
+    'print(time.perf_counter() - start)'
+)
+
+
+def import_time():
+    """Time one import of the package in a new interpreter, in
+    seconds.
+    """
+    out = subprocess.run(
+        [sys.executable, '-c', MEASURE],
+        cwd=ROOT, capture_output=True, check=True, text=True,
+    )
+    return float(out.stdout)
+
+
+def slowest_modules(count):
+    """Return the (cumulative microseconds, module) pairs for the
+    modules that take the longest to import.
+    """
+    out = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import audioread'],
+        cwd=ROOT, capture_output=True, check=True, text=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='number of interpreters to start')
+    parser.add_argument('--top', type=int, default=10,
+                        help='number of slow modules to list')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='fail if the import takes longer (ms)')
+    args = parser.parse_args(argv)
+
+    times = [import_time() for _ in range(args.repeat)]
+    best = min(times) * 1000
+    print('import audioread: median {:.2f} ms, min {:.2f} ms'.format(
+        statistics.median(times) * 1000, best,
+    ))
+    for usec, module in slowest_modules(args.top):
+        print('{:10.2f} ms  {}'.format(usec / 1000, module))
+
+    if args.budget is not None and best > args.budget:
+        print('over budget ({:.2f} ms)'.format(args.budget))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
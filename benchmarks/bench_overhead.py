@@ -0,0 +1,141 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Measure the overhead of audioread's own layers, without a decoder.
+
+Each case reads audio generated by the synthetic backend, which costs
+next to nothing per block, through one layer (`audio_open`, the
+scheduler, prefetching, reblocking, and the streaming taps). The time
+each layer adds per block, over iterating the synthetic file directly,
+is reported.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audioread  # noqa: E402
+from audioread import scheduler  # noqa: E402
+from audioread.hashing import Hasher  # noqa: E402
+from audioread.prefetch import PrefetchedAudioFile  # noqa: E402
+from audioread.reblock import reblock  # noqa: E402
+from audioread.silence import trim_silence  # noqa: E402
+from audioread.summary import Summary  # noqa: E402
+from audioread.synth import SynthAudioFile  # noqa: E402
+
+BACKENDS = [SynthAudioFile]
+
+
+def direct(url):
+    with SynthAudioFile(url) as f:
+        yield from f
+
+
+def via_audio_open(url):
+    with audioread.audio_open(url, BACKENDS) as f:
+        yield from f
+
+
+def via_scheduler(url):
+    previous = scheduler.set_scheduler(scheduler.Scheduler(default=4))
+    try:
+        yield from via_audio_open(url)
+    finally:
+        scheduler.set_scheduler(previous)
+
+
+def via_prefetch(url):
+    with PrefetchedAudioFile(url, BACKENDS) as f:
+        yield from f
+
+
+def via_reblock(url):
+    with SynthAudioFile(url) as f:
+        yield from reblock(f, 1024, hop=512)
+
+
+def via_summary(url):
+    with SynthAudioFile(url) as f:
+        yield from Summary.for_file(f).tap(f)
+
+
+def via_hasher(url):
+    with SynthAudioFile(url) as f:
+        yield from Hasher.for_file(f).tap(f)
+
+
+def via_silence(url):
+    with SynthAudioFile(url) as f:
+        for _, block in trim_silence(f):
+            yield block
+
+
+CASES = {
+    'direct': direct,
+    'audio_open': via_audio_open,
+    'scheduler': via_scheduler,
+    'prefetch': via_prefetch,
+    'reblock': via_reblock,
+    'summary': via_summary,
+    'hasher': via_hasher,
+    'silence': via_silence,
+}
+
+
+def run(case, url, repeat):
+    """Return the best time to exhaust `case` over `repeat` runs and
+    the number of blocks it produced.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        blocks = 0
+        for _ in case(url):
+            blocks += 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, blocks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--duration', type=float, default=60.0,
+                        help='seconds of audio per run')
+    parser.add_argument('--block-frames', type=int, default=1024,
+                        help='frames per synthetic block')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs per case (the best is reported)')
+    parser.add_argument('--case', action='append', dest='cases',
+                        choices=list(CASES),
+                        help='only measure this case (repeatable)')
+    args = parser.parse_args(argv)
+
+    url = 'synth:tone?duration={}&block_frames={}'.format(
+        args.duration, args.block_frames,
+    )
+    base_time, base_blocks = run(direct, url, args.repeat)
+    for name in args.cases or list(CASES):
+        elapsed, blocks = run(CASES[name], url, args.repeat)
+        extra = (elapsed - base_time) / base_blocks * 1e6
+        print('{:>12}: {:8.2f} ms {:8d} blocks {:8.0f}x realtime '
+              '{:+8.2f} us/block'.format(
+                  name, elapsed * 1e3, blocks, args.duration / elapsed,
+                  extra,
+              ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Measure the latency of launching a decoder subprocess.
+
+Each strategy launches a command many times and reports the median
+time spent in ``Popen`` (the spawn itself) and until the process has
+exited:
+
+- ``search``: the command name is looked up on the PATH on every
+  launch and descriptors are closed in the child, like audioread's
+  original launch path;
+- ``absolute``: the cached absolute path with ``close_fds=True``;
+- ``fast``: ``ffdec.popen_multiple`` (the cached absolute path with
+  ``ffdec.SPAWN_ARGS``).
+
+The cost of forking grows with the parent's memory, so ``--ballast``
+allocates that many MiB in the parent first to model a busy worker.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audioread import ffdec  # noqa: E402
+
+
+def launch_search(commands, args):
+    return subprocess.Popen([commands[0]] + args, close_fds=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
+
+
+def launch_absolute(commands, args):
+    return subprocess.Popen([ffdec.find_command(commands)] + args,
+                            close_fds=True, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
+
+
+def launch_fast(commands, args):
+    return ffdec.popen_multiple(commands, args, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+
+
+STRATEGIES = [
+    ('search', launch_search),
+    ('absolute', launch_absolute),
+    ('fast', launch_fast),
+]
+
+
+def bench(launch, commands, args, repeat):
+    spawn, total = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = launch(commands, args)
+        spawned = time.perf_counter()
+        proc.wait()
+        end = time.perf_counter()
+        spawn.append(spawned - start)
+        total.append(end - start)
+    return statistics.median(spawn), statistics.median(total)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='launches per strategy (the median is kept)')
+    parser.add_argument('--ballast', type=int, default=0, metavar='MIB',
+                        help='memory to allocate in the parent first')
+    parser.add_argument('--command', default=None,
+                        help='command to launch (default: ffmpeg -version '
+                        'if installed, otherwise true)')
+    args = parser.parse_args(argv)
+
+    if args.command:
+        commands, cmd_args = (args.command,), []
+    elif ffdec.find_command(ffdec.COMMANDS):
+        commands, cmd_args = ffdec.COMMANDS, ['-version']
+    else:
+        commands, cmd_args = ('true',), []
+    if not ffdec.find_command(commands):
+        parser.error('{} not found'.format(commands[0]))
+
+    # Touch every page so the memory is really mapped.
+    ballast = bytearray(b'\x01' * (args.ballast * 1024 * 1024))  # noqa
+
+    print('{} ({} launches, {} MiB ballast)'.format(
+        ' '.join(commands[:1] + tuple(cmd_args)), args.repeat, args.ballast,
+    ))
+    for name, launch in STRATEGIES:
+        spawn, total = bench(launch, commands, cmd_args, args.repeat)
+        print('{:>10}  spawn {:8.3f} ms  spawn+exit {:8.3f} ms'.format(
+            name, spawn * 1000, total * 1000,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Measure how decoding throughput scales with the number of threads.
+
+For each backend and thread count, every thread repeatedly opens and
+fully decodes the same WAV fixture through `audio_open` for a fixed
+time, and the total blocks and bytes per second are reported. On a
+free-threaded build of Python (3.13t and later, with the GIL disabled),
+the raw backend's throughput should grow with the number of threads;
+with the GIL, only backends that decode outside the interpreter (like
+FFmpeg) can scale.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audioread  # noqa: E402
+import fixtures  # noqa: E402
+from audioread import ffdec, rawread  # noqa: E402
+
+BACKENDS = {
+    'raw': rawread.RawAudioFile,
+    'ffmpeg': ffdec.FFmpegAudioFile,
+}
+
+
+def gil_enabled():
+    """Report whether the GIL is active in this interpreter."""
+    check = getattr(sys, '_is_gil_enabled', None)
+    return True if check is None else check()
+
+
+def run(cls, path, threads, seconds):
+    """Decode `path` in `threads` threads for about `seconds` seconds.
+    Return the total number of blocks and bytes decoded and the
+    elapsed time.
+    """
+    totals = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads + 1)
+    deadline = None
+
+    def work():
+        blocks = nbytes = 0
+        barrier.wait()
+        while time.perf_counter() < deadline:
+            with audioread.audio_open(path, [cls]) as f:
+                for block in f:
+                    blocks += 1
+                    nbytes += len(block)
+        with lock:
+            totals.append((blocks, nbytes))
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    start = time.perf_counter()
+    deadline = start + seconds
+    barrier.wait()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return (sum(t[0] for t in totals), sum(t[1] for t in totals), elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', default='1,2,4,8',
+                        help='comma-separated thread counts')
+    parser.add_argument('--seconds', type=float, default=3.0,
+                        help='time to run each measurement')
+    parser.add_argument('--fixtures', default='bench-fixtures',
+                        help='directory for generated fixtures')
+    parser.add_argument('--backend', action='append', dest='backends',
+                        choices=sorted(BACKENDS),
+                        help='only measure this backend (repeatable)')
+    args = parser.parse_args(argv)
+
+    fixture = fixtures.generate(args.fixtures, 5.0, compressed=False)[0]
+    counts = [int(n) for n in args.threads.split(',')]
+    available = audioread.available_backends()
+    print('Python {} (GIL {})'.format(
+        sys.version.split()[0], 'enabled' if gil_enabled() else 'disabled',
+    ))
+
+    for name in args.backends or sorted(BACKENDS):
+        cls = BACKENDS[name]
+        if cls not in available:
+            print('{:>8}: not available'.format(name))
+            continue
+        base = None
+        for threads in counts:
+            blocks, nbytes, elapsed = run(cls, fixture.path, threads,
+                                          args.seconds)
+            rate = blocks / elapsed
+            base = base or rate
+            print('{:>8} {:3d} threads: {:10.0f} blocks/s {:8.1f} MB/s '
+                  '({:.2f}x)'.format(name, threads, rate,
+                                     nbytes / elapsed / 1e6, rate / base))
+
+
+if __name__ == '__main__':
+    main()
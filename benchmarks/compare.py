@@ -0,0 +1,74 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Compare two benchmark result files and report regressions.
+
+Exits with status 1 if any metric got worse by more than the
+threshold.
+"""
+import argparse
+import json
+import sys
+
+# Metrics where a smaller value is better, and those where a larger
+# value is better.
+LOWER_IS_BETTER = ('open', 'first_block', 'decode', 'peak_python_bytes')
+HIGHER_IS_BETTER = ('realtime_factor', 'bytes_per_second')
+
+
+def load(path):
+    with open(path) as f:
+        report = json.load(f)
+    return {
+        (r['backend'], r['fixture']): r
+        for r in report['results'] if 'skipped' not in r
+    }
+
+
+def compare(base, new, threshold):
+    """Yield (key, metric, old, new, change) tuples for every metric
+    whose relative change is worse than `threshold`.
+    """
+    for key in sorted(set(base) & set(new)):
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            old_val, new_val = base[key].get(metric), new[key].get(metric)
+            if not old_val or new_val is None:
+                continue
+            change = (new_val - old_val) / old_val
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                yield key, metric, old_val, new_val, change
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('base', help='results from the reference commit')
+    parser.add_argument('new', help='results from the commit under test')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='tolerated relative slowdown (default 0.10)')
+    args = parser.parse_args(argv)
+
+    regressions = list(compare(load(args.base), load(args.new),
+                               args.threshold))
+    for (backend, fixture), metric, old, new, change in regressions:
+        print('{} {} {}: {:.4g} -> {:.4g} ({:+.1%} worse)'.format(
+            backend, fixture, metric, old, new, change))
+    if not regressions:
+        print('No regressions.')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
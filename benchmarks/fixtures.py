@@ -0,0 +1,178 @@
+# This file is part of audioread.
+# Copyright 2026, Adrian Sampson.
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+
+"""Generate audio fixtures for the benchmark suite.
+
+Uncompressed fixtures (WAV, AIFF, 24-bit and multichannel WAV) are
+written with the standard library. Compressed fixtures are encoded
+from the 16-bit WAV when an ffmpeg binary is on the PATH.
+
+File names include the duration (and, for compressed fixtures, a
+digest of the encoder arguments), so a fixture is only reused when it
+was made with the same parameters.
+"""
+import aifc
+import array
+import hashlib
+import math
+import os
+import shutil
+import subprocess
+import sys
+import wave
+
+
+# Compressed formats to encode with ffmpeg: name, extension, and the
+# codec arguments.
+COMPRESSED = [
+    ('mp3', 'mp3', ['-c:a', 'libmp3lame', '-b:a', '192k']),
+    ('flac', 'flac', ['-c:a', 'flac']),
+    ('vorbis', 'ogg', ['-c:a', 'libvorbis', '-q:a', '5']),
+    ('aac', 'm4a', ['-c:a', 'aac', '-b:a', '192k']),
+]
+
+
+class Fixture:
+    """A generated audio file and the parameters it was written with."""
+    def __init__(self, name, path, channels, samplerate, duration):
+        self.name = name
+        self.path = path
+        self.channels = channels
+        self.samplerate = samplerate
+        self.duration = duration
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'path': self.path,
+            'channels': self.channels,
+            'samplerate': self.samplerate,
+            'duration': self.duration,
+            'size': os.path.getsize(self.path),
+        }
+
+
+def tone(channels, samplerate, duration, width=2):
+    """Generate interleaved little-endian PCM for a chord of sine
+    tones, one frequency per channel. `width` is the sample size in
+    bytes (2 or 3).
+    """
+    # Build one second of audio and repeat it: integer frequencies
+    # make the table loop seamlessly and keep generation cheap.
+    scale = (1 << (8 * width - 1)) - 1
+    samples = array.array('i')
+    for i in range(samplerate):
+        for ch in range(channels):
+            freq = 220 * (ch + 1)
+            value = math.sin(2 * math.pi * freq * i / samplerate)
+            samples.append(int(value * scale * 0.5))
+    if sys.byteorder == 'big':
+        samples.byteswap()
+
+    if width == 4:
+        second = samples.tobytes()
+    else:
+        # Truncate each 32-bit little-endian integer to its low bytes.
+        raw = samples.tobytes()
+        second = b''.join(raw[i:i + width] for i in range(0, len(raw), 4))
+
+    whole, frac = divmod(duration, 1)
+    tail = int(frac * samplerate) * channels * width
+    return second * int(whole) + second[:tail]
+
+
+def write_wav(path, channels, samplerate, duration, width=2):
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(width)
+        f.setframerate(samplerate)
+        f.writeframes(tone(channels, samplerate, duration, width))
+
+
+def write_aiff(path, channels, samplerate, duration):
+    data = array.array('h', tone(channels, samplerate, duration))
+    if sys.byteorder == 'little':
+        # AIFF stores big-endian samples.
+        data.byteswap()
+    with aifc.open(path, 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(samplerate)
+        f.writeframes(data.tobytes())
+
+
+def ffmpeg_path():
+    """Return the path of an ffmpeg binary or None."""
+    return shutil.which('ffmpeg')
+
+
+def generate(directory, duration=10.0, compressed=True):
+    """Write the fixture set into `directory` and return a list of
+    `Fixture` objects. Existing files made with the same parameters are
+    reused.
+    """
+    os.makedirs(directory, exist_ok=True)
+    fixtures = []
+
+    def add(name, ext, channels, samplerate, writer, params=()):
+        stem = '{}-{:g}s'.format(name, duration)
+        if params:
+            stem += '-' + hashlib.sha1(
+                ' '.join(params).encode('utf8')
+            ).hexdigest()[:8]
+        path = os.path.join(directory, '{}.{}'.format(stem, ext))
+        if not os.path.exists(path):
+            # Write under a temporary name (keeping the extension, which
+            # tells ffmpeg the format) so a failed or interrupted write
+            # never leaves a file that looks like a finished fixture.
+            tmp = os.path.join(directory, '.{}.part.{}'.format(stem, ext))
+            try:
+                writer(tmp)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        fixtures.append(Fixture(name, path, channels, samplerate, duration))
+        return path
+
+    base = add('wav16-stereo', 'wav', 2, 44100,
+               lambda p: write_wav(p, 2, 44100, duration))
+    add('aiff16-stereo', 'aiff', 2, 44100,
+        lambda p: write_aiff(p, 2, 44100, duration))
+    add('wav24-stereo', 'wav', 2, 48000,
+        lambda p: write_wav(p, 2, 48000, duration, width=3))
+    add('wav16-5.1', 'wav', 6, 48000,
+        lambda p: write_wav(p, 6, 48000, duration))
+
+    ffmpeg = ffmpeg_path()
+    if compressed and ffmpeg:
+        for name, ext, codec in COMPRESSED:
+            def encode(path, codec=codec):
+                subprocess.run(
+                    [ffmpeg, '-nostdin', '-loglevel', 'error', '-y',
+                     '-i', base] + codec + [path],
+                    check=True,
+                )
+            try:
+                add(name + '-stereo', ext, 2, 44100, encode, codec)
+            except subprocess.CalledProcessError:
+                # This ffmpeg build lacks the encoder.
+                continue
+
+    return fixtures
+
+
+if __name__ == '__main__':
+    for fixture in generate(sys.argv[1] if len(sys.argv) > 1 else 'fixtures'):
+        print(fixture.name, fixture.path)
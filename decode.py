@@ -12,40 +12,286 @@
 # The above copyright notice and this permission notice shall be
 # included in all copies or substantial portions of the Software.
 
-"""Command-line tool to decode audio files to WAV files."""
+"""Command-line tool to decode audio files to WAV files.
+
+Inputs may be files, directories (searched recursively for audio
+files), or glob patterns. Many files can be decoded concurrently in a
+single process, which avoids paying the interpreter and backend
+detection start-up cost for each file.
+
+WAV files that already hold 16-bit PCM are copied rather than decoded
+when the output is WAV or raw PCM (unless ``--no-passthrough`` is
+given).
+"""
+import argparse
+import array
 import audioread
-import sys
+import audioread.passthrough
+import concurrent.futures
+import glob
 import os
+import sys
+import time
 import wave
-import contextlib
+
+# Extensions picked up when searching a directory.
+AUDIO_EXTENSIONS = {
+    '.aac', '.aif', '.aifc', '.aiff', '.alac', '.ape', '.au', '.flac',
+    '.m4a', '.mka', '.mp2', '.mp3', '.mp4', '.mpc', '.oga', '.ogg',
+    '.opus', '.ra', '.snd', '.wav', '.wma', '.wv',
+}
+
+# Output formats and their file extensions.
+FORMATS = {
+    'wav': '.wav',    # 16-bit signed integer WAV.
+    'raw': '.pcm',    # Headerless 16-bit signed little-endian PCM.
+    'float': '.f32',  # Headerless 32-bit float little-endian PCM.
+}
+
+
+def glob_root(pattern):
+    """Get the leading directories of a glob pattern that contain no
+    wildcards.
+    """
+    while glob.has_magic(pattern):
+        pattern = os.path.dirname(pattern)
+    return pattern
 
 
-def decode(filename):
-    filename = os.path.abspath(os.path.expanduser(filename))
-    if not os.path.exists(filename):
-        print("File not found.", file=sys.stderr)
-        sys.exit(1)
+def find_inputs(args, extensions=AUDIO_EXTENSIONS):
+    """Expand the command-line inputs into (path, root) pairs, where
+    `root` is the directory that relative output paths are computed
+    from: the directory itself for directories, and the part of a glob
+    pattern before the first wildcard for globs.
+    """
+    for arg in args:
+        arg = os.path.expanduser(arg)
+        if os.path.isdir(arg):
+            for dirpath, dirnames, filenames in os.walk(arg):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    if os.path.splitext(name)[1].lower() in extensions:
+                        yield os.path.join(dirpath, name), arg
+        elif glob.has_magic(arg):
+            root = glob_root(arg)
+            for path in sorted(glob.glob(arg, recursive=True)):
+                if os.path.isfile(path):
+                    yield path, root
+        else:
+            yield arg, os.path.dirname(arg)
 
+
+def output_path(path, root, fmt, outdir=None):
+    """Map an input path to the path of its decoded output."""
+    ext = FORMATS[fmt]
+    if outdir is None:
+        return path + ext
+    rel = os.path.relpath(path, root or os.curdir)
+    return os.path.join(outdir, rel + ext)
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def exclude_outputs(inputs, outdir=None):
+    """Filter (path, root) input pairs, dropping files this tool may
+    have written itself: anything inside `outdir`, and any file that is
+    the output path (in any format) of another input. Without this, a
+    second run over the same directory would decode the first run's
+    outputs.
+    """
+    inputs = list(inputs)
+    outputs = {
+        _key(output_path(path, root, fmt, outdir))
+        for path, root in inputs
+        for fmt in FORMATS
+    }
+    if outdir is not None:
+        outdir = os.path.join(_key(outdir), '')
+    for path, root in inputs:
+        key = _key(path)
+        if key in outputs:
+            continue
+        if outdir is not None and key.startswith(outdir):
+            continue
+        yield path, root
+
+
+def up_to_date(src, dest):
+    """Check whether `dest` exists and is newer than `src`."""
     try:
-        with audioread.audio_open(filename) as f:
-            print('Input file: %i channels at %i Hz; %.1f seconds.' %
-                  (f.channels, f.samplerate, f.duration),
-                  file=sys.stderr)
-            print('Backend:', str(type(f).__module__).split('.')[1],
-                  file=sys.stderr)
+        return os.path.getmtime(dest) >= os.path.getmtime(src)
+    except OSError:
+        return False
+
+
+def to_float(buf):
+    """Convert 16-bit integer PCM to 32-bit float PCM."""
+    samples = array.array('h', buf)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    # Scale without running Python code for each sample.
+    out = array.array('f', map((1 / 32768.0).__mul__, samples))
+    if sys.byteorder == 'big':
+        out.byteswap()
+    return out.tobytes()
+
+
+def decode(filename, dest=None, fmt='wav', backends=None, passthrough=True):
+    """Decode `filename` into `dest` and return a tuple of the opened
+    file's type, its duration in seconds, and the number of PCM bytes
+    written. If `passthrough` is set and the file could be copied
+    without decoding, the type is None.
+
+    The output is written to a temporary name and renamed into place,
+    so an interrupted run never leaves a partial file that looks up to
+    date.
+    """
+    if dest is None:
+        dest = filename + FORMATS[fmt]
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+    tmp = '{}.{}.part'.format(dest, os.getpid())
+
+    nbytes = 0
+    try:
+        if passthrough and fmt in ('wav', 'raw'):
+            layout = audioread.passthrough.copy_pcm(filename, tmp, fmt)
+            if layout is not None:
+                os.replace(tmp, dest)
+                seconds = layout.size / (2.0 * layout.channels *
+                                         layout.samplerate)
+                return None, seconds, layout.size
+
+        with audioread.audio_open(filename, backends) as f, \
+                open(tmp, 'wb') as fh:
+            if fmt == 'wav':
+                out = wave.open(fh, 'wb')
+                out.setnchannels(f.channels)
+                out.setframerate(f.samplerate)
+                out.setsampwidth(2)
+                write = out.writeframes
+            elif fmt == 'float':
+                def write(buf):
+                    fh.write(to_float(buf))
+            else:
+                write = fh.write
+
+            for buf in f:
+                nbytes += len(buf)
+                write(buf)
+            if fmt == 'wav':
+                # Patch the header with the final length.
+                out.close()
+
+        os.replace(tmp, dest)
+        return type(f), nbytes / (2.0 * f.channels * f.samplerate), nbytes
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def backend_name(cls):
+    if cls is None:
+        return 'passthrough'
+    return cls.__module__.split('.')[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Decode audio files to WAV or raw PCM.',
+    )
+    parser.add_argument('inputs', nargs='+', metavar='INPUT',
+                        help='files, directories, or glob patterns')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of files to decode concurrently')
+    parser.add_argument('-o', '--output-dir',
+                        help='write outputs here, mirroring the input '
+                             'directory layout (default: next to each input)')
+    parser.add_argument('-f', '--format', choices=sorted(FORMATS),
+                        default='wav', help='output format (default: wav)')
+    parser.add_argument('--force', action='store_true',
+                        help='decode even if the output is up to date')
+    parser.add_argument('--no-passthrough', dest='passthrough',
+                        action='store_false',
+                        help='decode 16-bit WAV inputs instead of copying '
+                             'their audio')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='only print the summary')
+    args = parser.parse_args(argv)
+
+    # Detect the backends once and share them between all jobs.
+    backends = audioread.available_backends()
+
+    def log(*parts):
+        if not args.quiet:
+            print(*parts, file=sys.stderr)
 
-            with contextlib.closing(wave.open(filename + '.wav', 'w')) as of:
-                of.setnchannels(f.channels)
-                of.setframerate(f.samplerate)
-                of.setsampwidth(2)
+    jobs = []
+    skipped = failed = 0
+    sources = {}  # Maps each destination to the input written there.
+    inputs = exclude_outputs(find_inputs(args.inputs), args.output_dir)
+    for path, root in inputs:
+        dest = output_path(path, root, args.format, args.output_dir)
+        key = _key(dest)
+        if key in sources:
+            if _key(path) != _key(sources[key]):
+                failed += 1
+                log('{}: output {} is already written for {}'.format(
+                    path, dest, sources[key],
+                ))
+            # Otherwise, the same input was given twice.
+            continue
+        sources[key] = path
+        if not args.force and up_to_date(path, dest):
+            skipped += 1
+        else:
+            jobs.append((path, dest))
 
-                for buf in f:
-                    of.writeframes(buf)
+    start = time.perf_counter()
+    done = finished = 0
+    total_seconds = total_bytes = 0.0
+    with concurrent.futures.ThreadPoolExecutor(max(args.jobs, 1)) as pool:
+        futures = {
+            pool.submit(decode, path, dest, args.format, backends,
+                        args.passthrough): path
+            for path, dest in jobs
+        }
+        for future in concurrent.futures.as_completed(futures):
+            path = futures[future]
+            finished += 1
+            try:
+                cls, seconds, nbytes = future.result()
+            except FileNotFoundError:
+                failed += 1
+                log('{}: file not found'.format(path))
+            except (audioread.DecodeError, OSError) as exc:
+                failed += 1
+                log('{}: could not be decoded'.format(path),
+                    '({})'.format(exc) if str(exc) else '')
+            else:
+                done += 1
+                total_seconds += seconds
+                total_bytes += nbytes
+                log('[{}/{}] {}: {:.1f} seconds ({})'.format(
+                    finished, len(jobs), path, seconds,
+                    backend_name(cls),
+                ))
+    elapsed = time.perf_counter() - start
 
-    except audioread.DecodeError:
-        print("File could not be decoded.", file=sys.stderr)
-        sys.exit(1)
+    print(
+        'Decoded {} files ({:.1f} seconds of audio) in {:.2f} s: '
+        '{:.1f}x realtime, {:.1f} MB/s. Skipped {} up to date, '
+        '{} failed.'.format(
+            done, total_seconds, elapsed,
+            total_seconds / elapsed if elapsed else 0,
+            total_bytes / elapsed / 1e6 if elapsed else 0,
+            skipped, failed,
+        ),
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
 
 
 if __name__ == '__main__':
-    decode(sys.argv[1])
+    sys.exit(main())
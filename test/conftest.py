@@ -49,3 +49,30 @@ def pytest_generate_tests(metafunc):
     """Parametrize the audiofile() fixture using TEST_AUDIOFILES."""
     if 'audiofile' in metafunc.fixturenames:
         metafunc.parametrize("audiofile", TEST_AUDIOFILES, indirect=True)
+
+
+def write_wav(path, channels=2, samplerate=44100, nframes=44100, width=2):
+    """Write a WAV file containing a deterministic ramp and return the
+    PCM data that was written.
+    """
+    import wave
+    frame = bytes(range(channels * width))
+    data = b''.join(
+        bytes((b + i) % 256 for b in frame) for i in range(nframes)
+    )
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(width)
+        f.setframerate(samplerate)
+        f.writeframes(data)
+    return data
+
+
+@pytest.fixture()
+def wav(tmp_path):
+    """Fixture that provides the path of a small 16-bit stereo WAV file
+    along with its PCM data.
+    """
+    path = tmp_path / 'test.wav'
+    data = write_wav(path, nframes=4410)
+    return str(path), data
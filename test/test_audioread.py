@@ -13,6 +13,10 @@
 # included in all copies or substantial portions of the Software.
 
 
+import threading
+
+import pytest
+
 import audioread
 
 
@@ -43,3 +47,64 @@ def test_audioread_full(audiofile):
         # Now read all the data and assert that it's the correct type.
         for block in a:
             assert type(block) == bytes
+
+
+def _fake_backend(fails, opened, wait=None, done=None):
+    """A backend that first calls `wait` (if given), then fails or
+    opens, and finally calls `done`.
+    """
+    class Backend(audioread.AudioFile):
+        def __init__(self, path):
+            if wait is not None:
+                wait()
+            if fails:
+                raise audioread.DecodeError('cannot read')
+            self.closed = False
+            opened.append(self)
+            if done is not None:
+                done()
+
+        def close(self):
+            self.closed = True
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.close()
+    return Backend
+
+
+def test_race_skips_slow_failures():
+    # The barrier only opens if all three backends are being tried at
+    # the same time; tried in order, the first would time out.
+    barrier = threading.Barrier(3, timeout=10)
+    opened = []
+    backends = [_fake_backend(True, opened, barrier.wait),
+                _fake_backend(True, opened, barrier.wait),
+                _fake_backend(False, opened, barrier.wait)]
+    with audioread.audio_open('x', backends, race=True) as f:
+        assert isinstance(f, backends[2])
+
+
+def test_race_prefers_backend_order():
+    # The second backend finishes opening before the first does.
+    second_opened = threading.Event()
+    opened = []
+    backends = [
+        _fake_backend(False, opened,
+                      wait=lambda: second_opened.wait(timeout=10)),
+        _fake_backend(False, opened, done=second_opened.set),
+    ]
+    with audioread.audio_open('x', backends, race=True) as f:
+        assert second_opened.is_set()
+        assert isinstance(f, backends[0])
+        assert not f.closed
+        loser, = [o for o in opened if o is not f]
+        assert loser.closed
+
+
+def test_race_all_fail():
+    backends = [_fake_backend(True, []) for _ in range(3)]
+    with pytest.raises(audioread.NoBackendError):
+        audioread.audio_open('x', backends, race=True)
@@ -0,0 +1,83 @@
+import io
+import struct
+
+import pytest
+
+from audioread import bigwav, rawread
+
+
+def pcm(nframes, channels=2, width=2):
+    return bytes(i % 251 for i in range(nframes * channels * width))
+
+
+def fmt_chunk(channels, samplerate, width, extensible=False):
+    align = channels * width
+    fmt = struct.pack('<HHIIHH', 0xFFFE if extensible else 1, channels,
+                      samplerate, samplerate * align, align, 8 * width)
+    if extensible:
+        fmt += struct.pack('<HHI', 22, 8 * width, 0) + \
+            b'\x01\x00\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+    return fmt
+
+
+def rf64(data, channels=2, samplerate=44100, width=2, magic=b'RF64',
+         extensible=False):
+    fmt = fmt_chunk(channels, samplerate, width, extensible)
+    ds64 = struct.pack('<QQQI', 0, len(data), len(data) // width, 0)
+    return b''.join([
+        magic, struct.pack('<I', 0xFFFFFFFF), b'WAVE',
+        b'ds64', struct.pack('<I', len(ds64)), ds64,
+        b'JUNK', struct.pack('<I', 3), b'abc\0',
+        b'fmt ', struct.pack('<I', len(fmt)), fmt,
+        b'data', struct.pack('<I', 0xFFFFFFFF), data,
+    ])
+
+
+def w64_chunk(guid, body):
+    chunk = guid + struct.pack('<Q', 24 + len(body)) + body
+    return chunk + b'\0' * (-len(chunk) % 8)
+
+
+def w64(data, channels=2, samplerate=44100, width=2):
+    chunks = (w64_chunk(b'junk' + bytes(12), b'12345') +
+              w64_chunk(bigwav.W64_FMT, fmt_chunk(channels, samplerate,
+                                                  width)) +
+              w64_chunk(bigwav.W64_DATA, data))
+    return (bigwav.W64_RIFF + struct.pack('<Q', 40 + len(chunks)) +
+            bigwav.W64_WAVE + chunks)
+
+
+@pytest.mark.parametrize('make', [
+    rf64,
+    lambda data: rf64(data, magic=b'BW64'),
+    lambda data: rf64(data, extensible=True),
+    w64,
+])
+def test_read_16_bit(make):
+    data = pcm(3000)
+    with rawread.RawAudioFile(make(data)) as f:
+        assert (f.channels, f.samplerate, f.nframes) == (2, 44100, 3000)
+        assert b''.join(f) == data
+
+
+def test_24_bit_converted():
+    data = pcm(100, channels=1, width=3)
+    with rawread.RawAudioFile(rf64(data, channels=1, width=3)) as f:
+        out = b''.join(f)
+    # The two most significant bytes of each sample are kept.
+    assert out == b''.join(data[i + 1:i + 3] for i in range(0, len(data), 3))
+
+
+def test_truncated_data():
+    data = pcm(1000)
+    f = rawread.RawAudioFile(w64(data)[:-101])
+    assert len(b''.join(f)) == len(data) - 104
+    f.close()
+
+
+def test_not_big_wav():
+    with pytest.raises(bigwav.Error):
+        bigwav.open(io.BytesIO(b'RIFF\0\0\0\0WAVEfmt '))
+    with pytest.raises(bigwav.Error):
+        bigwav.open(io.BytesIO(rf64(b'', extensible=False)
+                               .replace(b'ds64', b'xxxx')))
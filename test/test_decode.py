@@ -0,0 +1,149 @@
+import array
+import os
+import sys
+import wave
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import decode  # noqa: E402
+
+from conftest import write_wav  # noqa: E402
+
+
+@pytest.fixture
+def music(tmp_path):
+    """A small library with the same file name in two directories."""
+    for sub in ('a', 'b'):
+        (tmp_path / 'm' / sub).mkdir(parents=True)
+        write_wav(tmp_path / 'm' / sub / '01.wav', channels=1,
+                  samplerate=8000, nframes=800 if sub == 'a' else 400)
+    (tmp_path / 'm' / 'a' / 'notes.txt').write_text('not audio')
+    return tmp_path / 'm'
+
+
+def test_find_inputs(music):
+    root = str(music)
+    assert list(decode.find_inputs([root])) == [
+        (os.path.join(root, 'a', '01.wav'), root),
+        (os.path.join(root, 'b', '01.wav'), root),
+    ]
+    pattern = os.path.join(root, '*', '01.wav')
+    assert [r for _, r in decode.find_inputs([pattern])] == [root, root]
+    path = os.path.join(root, 'a', '01.wav')
+    assert list(decode.find_inputs([path])) == \
+        [(path, os.path.join(root, 'a'))]
+
+
+def test_glob_root():
+    assert decode.glob_root(os.path.join('m', '*', '01.mp3')) == 'm'
+    assert decode.glob_root(os.path.join('p', '**', '*.mp3')) == 'p'
+    assert decode.glob_root('*.mp3') == ''
+
+
+def test_output_path():
+    assert decode.output_path('x/a.mp3', 'x', 'wav') == 'x/a.mp3.wav'
+    assert decode.output_path(os.path.join('x', 'y', 'a.mp3'), 'x', 'raw',
+                              'out') == os.path.join('out', 'y', 'a.mp3.pcm')
+
+
+def test_up_to_date(tmp_path):
+    src, dest = tmp_path / 'a', tmp_path / 'b'
+    src.write_bytes(b'')
+    assert not decode.up_to_date(str(src), str(dest))
+    dest.write_bytes(b'')
+    os.utime(str(src), (1, 1))
+    assert decode.up_to_date(str(src), str(dest))
+
+
+def test_glob_keeps_directories_apart(music, tmp_path, capsys):
+    out = tmp_path / 'out'
+    pattern = os.path.join(str(music), '*', '01.wav')
+    assert decode.main(['-q', '-o', str(out), pattern]) == 0
+    for sub, nframes in (('a', 800), ('b', 400)):
+        with wave.open(str(out / sub / '01.wav.wav')) as f:
+            assert f.getnframes() == nframes
+    assert 'Decoded 2 files' in capsys.readouterr().err
+
+
+def test_duplicate_destinations_fail(music, tmp_path, capsys):
+    out = tmp_path / 'out'
+    paths = [str(music / 'a' / '01.wav'), str(music / 'b' / '01.wav')]
+    assert decode.main(['-o', str(out)] + paths) == 1
+    err = capsys.readouterr().err
+    assert 'already written' in err
+    assert 'Decoded 1 files' in err and '1 failed' in err
+    assert os.listdir(str(out)) == ['01.wav.wav']
+
+
+def test_skip_up_to_date(music, tmp_path, capsys):
+    out = str(tmp_path / 'out')
+    assert decode.main(['-q', '-o', out, str(music)]) == 0
+    capsys.readouterr()
+    assert decode.main(['-q', '-o', out, str(music)]) == 0
+    assert 'Skipped 2 up to date' in capsys.readouterr().err
+    assert decode.main(['-q', '--force', '-o', out, str(music)]) == 0
+    assert 'Decoded 2 files' in capsys.readouterr().err
+
+
+def test_float_output(tmp_path):
+    path = str(tmp_path / 'a.wav')
+    data = write_wav(path, channels=1, nframes=100)
+    assert decode.main(['-q', '-f', 'float', path]) == 0
+    out = array.array('f')
+    with open(path + '.f32', 'rb') as f:
+        out.frombytes(f.read())
+    if sys.byteorder == 'big':
+        out.byteswap()
+    samples = array.array('h', data)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    assert list(out) == [s / 32768.0 for s in samples]
+
+
+def _tree(root):
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, _, names in os.walk(root) for name in names
+    )
+
+
+def test_rerun_next_to_inputs(music, capsys):
+    root = str(music)
+    assert decode.main(['-q', root]) == 0
+    assert decode.main(['-q', '-f', 'float', root]) == 0
+    first = _tree(root)
+    capsys.readouterr()
+
+    assert decode.main(['-q', root]) == 0
+    assert decode.main(['-q', '-f', 'float', root]) == 0
+    assert _tree(root) == first
+    assert 'Skipped 2 up to date' in capsys.readouterr().err
+    assert sorted(p for p in first if p.startswith('a')) == [
+        os.path.join('a', n)
+        for n in ('01.wav', '01.wav.f32', '01.wav.wav', 'notes.txt')
+    ]
+
+
+def test_rerun_with_output_inside_inputs(music, capsys):
+    root = str(music)
+    out = os.path.join(root, 'out')
+    assert decode.main(['-q', '-o', out, root]) == 0
+    first = _tree(root)
+    capsys.readouterr()
+    assert decode.main(['-q', '-o', out, root]) == 0
+    assert _tree(root) == first
+    assert 'Skipped 2 up to date' in capsys.readouterr().err
+    assert sorted(_tree(out)) == [os.path.join('a', '01.wav.wav'),
+                                  os.path.join('b', '01.wav.wav')]
+
+
+def test_exclude_outputs():
+    inputs = [('m/a.mp3', 'm'), ('m/a.mp3.wav', 'm'), ('m/b.wav', 'm'),
+              ('m/out/b.wav.wav', 'm')]
+    assert list(decode.exclude_outputs(inputs)) == \
+        [('m/a.mp3', 'm'), ('m/b.wav', 'm'), ('m/out/b.wav.wav', 'm')]
+    # With an output directory, only the files inside it are outputs.
+    assert list(decode.exclude_outputs(inputs, 'm/out')) == \
+        [('m/a.mp3', 'm'), ('m/a.mp3.wav', 'm'), ('m/b.wav', 'm')]
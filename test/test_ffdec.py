@@ -0,0 +1,232 @@
+import gc
+import io
+import os
+import sys
+import weakref
+
+import pytest
+
+from audioread import ffdec, mpeg
+
+from conftest import DATADIR, write_wav
+
+
+requires_ffmpeg = pytest.mark.skipif(not ffdec.available(),
+                                     reason='ffmpeg is not installed')
+posix_only = pytest.mark.skipif(sys.platform == 'win32',
+                                reason='uses a shell script as a command')
+
+
+@requires_ffmpeg
+def test_segmented_matches_single_process(tmp_path):
+    path = str(tmp_path / 'long.wav')
+    data = write_wav(path, channels=2, samplerate=8000, nframes=8000 * 3)
+
+    with ffdec.SegmentedFFmpegAudioFile(path, jobs=3,
+                                        segment_duration=0.37) as f:
+        assert len(f._segments) > 3
+        stitched = b''.join(f)
+    assert stitched == data
+
+
+def _decode(path):
+    with ffdec.FFmpegAudioFile(path) as f:
+        return b''.join(f)
+
+
+@requires_ffmpeg
+@pytest.mark.parametrize('name', ['test-1.mp3', 'test-2.mp3'])
+def test_segmented_mp3_matches_single_process(name):
+    path = os.path.join(DATADIR, name)
+    with ffdec.SegmentedFFmpegAudioFile(path, jobs=3,
+                                        segment_duration=1.0) as f:
+        stitched = b''.join(f)
+        assert f._fallback is None
+    assert stitched == _decode(path)
+
+
+@requires_ffmpeg
+def test_segmented_falls_back_on_inexact_seek(monkeypatch):
+    # Too short a pre-roll leaves the MP3 decoder out of step.
+    monkeypatch.setattr(ffdec, 'SEGMENT_PREROLL', 0.02)
+    path = os.path.join(DATADIR, 'test-1.mp3')
+    with ffdec.SegmentedFFmpegAudioFile(path, jobs=2,
+                                        segment_duration=1.0) as f:
+        stitched = b''.join(f)
+        assert f._fallback is not None
+    assert stitched == _decode(path)
+
+
+@requires_ffmpeg
+def test_segment_process_stops_after_its_range(tmp_path):
+    path = str(tmp_path / 'long.wav')
+    write_wav(path, channels=1, samplerate=8000, nframes=8000 * 20)
+
+    with ffdec.SegmentedFFmpegAudioFile(path, jobs=3,
+                                        segment_duration=2.0) as f:
+        next(iter(f))
+        ahead = f._segments[1][2]
+        assert ahead.proc.wait(timeout=10) == 0
+        queued = sum(len(b) for b in ahead.stdout_reader.queue.queue)
+    # The pre-roll, the segment, and the margin, but not the rest of
+    # the file.
+    limit = (ffdec.SEGMENT_PREROLL + 2.0 + ffdec.SEGMENT_MARGIN) * 8000 * 2
+    assert 2.0 * 8000 * 2 <= queued <= limit + ahead.stdout_reader.blocksize
+
+
+@requires_ffmpeg
+def test_segmented_falls_back_when_a_segment_stops_short(tmp_path,
+                                                         monkeypatch):
+    path = str(tmp_path / 'long.wav')
+    data = write_wav(path, channels=1, samplerate=8000, nframes=8000 * 3)
+    monkeypatch.setattr(ffdec, 'SEGMENT_MARGIN', -0.2)
+
+    with ffdec.SegmentedFFmpegAudioFile(path, jobs=2,
+                                        segment_duration=1.0) as f:
+        assert b''.join(f) == data
+        assert f._fallback is not None
+
+
+@requires_ffmpeg
+def test_segmented_unknown_length_is_not_split(tmp_path, monkeypatch):
+    path = str(tmp_path / 'long.wav')
+    data = write_wav(path, channels=1, samplerate=8000, nframes=8000 * 3)
+    monkeypatch.setattr(ffdec.FFmpegAudioFile, 'nframes',
+                        property(lambda self: None))
+
+    with ffdec.SegmentedFFmpegAudioFile(path, jobs=3,
+                                        segment_duration=0.5) as f:
+        assert len(f._segments) == 1
+        assert b''.join(f) == data
+
+
+@requires_ffmpeg
+def test_lazy_open_defers_probe(tmp_path):
+    path = str(tmp_path / 'short.wav')
+    data = write_wav(path, channels=1, samplerate=8000, nframes=8000)
+
+    with ffdec.FFmpegAudioFile(path, lazy=True) as f:
+        assert f.ready.result(timeout=10) is None
+        assert (f.channels, f.samplerate) == (1, 8000)
+        assert b''.join(f) == data
+
+
+def _process_gone(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    return False
+
+
+@requires_ffmpeg
+@posix_only
+@pytest.mark.parametrize('lazy', [False, True])
+def test_abandoned_file_is_closed_without_gc(tmp_path, lazy):
+    path = str(tmp_path / 'short.wav')
+    write_wav(path, channels=1, samplerate=8000, nframes=80000)
+
+    gc.disable()
+    try:
+        f = ffdec.FFmpegAudioFile(path, block_size=1024, lazy=lazy)
+        f.ready.result(timeout=10)
+        next(iter(f))
+        pid = f.proc.pid
+        ref = weakref.ref(f)
+        del f
+        # Reference counting alone closes the file and reaps ffmpeg.
+        assert ref() is None
+        assert _process_gone(pid)
+    finally:
+        gc.enable()
+
+
+@requires_ffmpeg
+def test_lazy_nframes_waits_for_probe():
+    path = os.path.join(DATADIR, 'test-1.mp3')
+    with ffdec.FFmpegAudioFile(path, lazy=True) as f:
+        nframes = f.nframes
+    assert nframes == mpeg.read_info_path(path).nframes
+
+
+@requires_ffmpeg
+@pytest.mark.parametrize('name', ['test-1', 'test-2'])
+@pytest.mark.parametrize('kind', ['buffer', 'fileobj'])
+def test_piped_mp3_nframes(name, kind):
+    with open(os.path.join(DATADIR, name + '.mp3'), 'rb') as fh:
+        data = fh.read()
+    source = data if kind == 'buffer' else io.BytesIO(b'junk' + data)
+    if kind == 'fileobj':
+        source.seek(4)
+    with ffdec.FFmpegAudioFile(source) as f:
+        nframes = f.nframes
+        decoded = sum(len(block) for block in f)
+    assert nframes == decoded // (2 * f.channels)
+    assert nframes >= mpeg.read_info(io.BytesIO(data)).nframes
+
+
+class Unseekable(io.RawIOBase):
+    """A readable stream over `data` that can't seek."""
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        count = min(len(b), len(self.data) - self.pos)
+        b[:count] = self.data[self.pos:self.pos + count]
+        self.pos += count
+        return count
+
+
+@requires_ffmpeg
+def test_piped_nframes_unknown():
+    with open(os.path.join(DATADIR, 'test-2.mp3'), 'rb') as fh:
+        source = Unseekable(fh.read())
+    with ffdec.FFmpegAudioFile(source) as f:
+        assert f.nframes is None
+        assert sum(len(block) for block in f) > 0
+
+
+@requires_ffmpeg
+def test_lazy_open_reports_errors(tmp_path):
+    path = tmp_path / 'bogus.wav'
+    path.write_bytes(b'not audio at all' * 64)
+
+    f = ffdec.FFmpegAudioFile(str(path), lazy=True)
+    try:
+        with pytest.raises(ffdec.FFmpegError):
+            f.channels
+    finally:
+        f.close()
+
+
+@posix_only
+def test_find_command_caches_absolute_path(tmp_path, monkeypatch):
+    tool = tmp_path / 'fake-decoder'
+    tool.write_text('#!/bin/sh\nexit 3\n')
+    tool.chmod(0o755)
+    monkeypatch.setenv('PATH', str(tmp_path))
+
+    commands = ('missing-decoder', 'fake-decoder')
+    assert ffdec.find_command(commands, flush=True) == str(tool)
+    monkeypatch.setenv('PATH', '')
+    assert ffdec.find_command(commands) == str(tool)
+    assert ffdec.popen_multiple(commands, []).wait() == 3
+
+
+@posix_only
+def test_popen_multiple_recovers_from_stale_path(tmp_path, monkeypatch):
+    tool = tmp_path / 'fake-decoder'
+    tool.write_text('#!/bin/sh\nexit 0\n')
+    tool.chmod(0o755)
+    monkeypatch.setenv('PATH', str(tmp_path))
+    commands = ('fake-decoder',)
+    ffdec.find_command(commands, flush=True)
+
+    tool.unlink()
+    with pytest.raises(OSError):
+        ffdec.popen_multiple(commands, [])
+    assert ffdec.find_command(commands) is None
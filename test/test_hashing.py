@@ -0,0 +1,112 @@
+import hashlib
+import os
+
+import pytest
+
+import audioread
+from audioread import ffdec, hashing, rawread
+from audioread.hashing import Hasher, hash_file
+
+from conftest import DATADIR, write_wav
+
+
+def test_whole_stream_matches_hashlib():
+    data = bytes(range(256)) * 40
+    hasher = Hasher(2, 8000, 'sha256')
+    for i in range(0, len(data), 333):
+        hasher.update(data[i:i + 333])
+    assert hasher.hexdigest() == hashlib.sha256(data).hexdigest()
+    assert hasher.digest() == hashlib.sha256(data).digest()
+    assert hasher.frames == len(data) // 4
+
+
+def test_segments():
+    # One-second segments of 100 stereo frames.
+    data = bytes(range(200)) * 13
+    hasher = Hasher(2, 100, 'md5', segment=1.0)
+    for i in range(0, len(data), 170):
+        hasher.update(data[i:i + 170])
+
+    expected = [hashlib.md5(data[i:i + 400]).hexdigest()
+                for i in range(0, len(data), 400)]
+    assert hasher.segment_digests() == expected
+    assert len(expected) == 7  # The last segment is partial.
+
+
+def test_tap_passes_blocks_through(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    data = write_wav(path, nframes=5000)
+    with rawread.RawAudioFile(path) as f:
+        hasher = Hasher.for_file(f)
+        assert b''.join(hasher.tap(f)) == data
+    assert hasher.hexdigest() == hashlib.blake2b(data).hexdigest()
+
+
+def test_hash_file_wav(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    data = write_wav(path, nframes=3000)
+    assert hash_file(path) == hashlib.blake2b(data).hexdigest()
+    assert hash_file(path, 'sha1') == hashlib.sha1(data).hexdigest()
+
+
+def test_hash_file_decodes_other_formats(tmpdir):
+    # 8-bit WAV can't be hashed from the file, so it is decoded.
+    path = str(tmpdir.join('a.wav'))
+    write_wav(path, nframes=1000, width=1)
+    with rawread.RawAudioFile(path) as f:
+        data = b''.join(f)
+    assert hash_file(path, 'sha256', backends=[rawread.RawAudioFile]) == \
+        hashlib.sha256(data).hexdigest()
+
+
+requires_ffmpeg = pytest.mark.skipif(not ffdec.available(),
+                                     reason='ffmpeg is not installed')
+
+
+def _ffmpeg_decode(path):
+    with ffdec.FFmpegAudioFile(path) as f:
+        return b''.join(f)
+
+
+@requires_ffmpeg
+def test_ffmpeg_hash_matches_ffmpeg_decoding():
+    path = os.path.join(DATADIR, 'test-1.mp3')
+    expected = hashlib.sha256(_ffmpeg_decode(path)).hexdigest()
+    assert hashing._ffmpeg_hash(path, 'sha256') == expected
+    assert hash_file(path, 'sha256', [rawread.RawAudioFile,
+                                      ffdec.FFmpegAudioFile]) == expected
+
+
+def test_hash_file_follows_backend_order(tmpdir):
+    # The raw backend reads 8-bit WAV before FFmpeg gets a chance, so
+    # its output is what gets hashed.
+    path = str(tmpdir.join('a.wav'))
+    write_wav(path, nframes=1000, width=1)
+    with rawread.RawAudioFile(path) as f:
+        data = b''.join(f)
+    assert hash_file(path, 'sha256', [rawread.RawAudioFile,
+                                      ffdec.FFmpegAudioFile]) == \
+        hashlib.sha256(data).hexdigest()
+
+
+@requires_ffmpeg
+def test_hash_file_falls_back_on_hash_error(monkeypatch):
+    def fail(path, algorithm):
+        raise hashing.HashError('no hash muxer')
+    monkeypatch.setattr(hashing, '_ffmpeg_hash', fail)
+
+    path = os.path.join(DATADIR, 'test-1.mp3')
+    assert hash_file(path, 'md5', [ffdec.FFmpegAudioFile]) == \
+        hashlib.md5(_ffmpeg_decode(path)).hexdigest()
+
+
+def test_hash_file_no_backend(tmpdir):
+    path = tmpdir.join('a.bin')
+    path.write_binary(b'not audio' * 100)
+    with pytest.raises(audioread.NoBackendError):
+        hash_file(str(path), backends=[rawread.RawAudioFile])
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        Hasher(1, 44100, 'nonsense')
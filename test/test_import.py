@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import audioread
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The most time `import audioread` may take, in seconds. It is typically
+# a few milliseconds; the budget leaves room for slow machines while
+# still catching an eager import of a backend. Use
+# benchmarks/bench_import.py to investigate.
+IMPORT_BUDGET = 0.05
+
+# Modules that importing the package must not load.
+HEAVY_MODULES = [
+    'audioread.ffdec', 'audioread.gstdec', 'audioread.maddec',
+    'audioread.macca', 'audioread.prefetch', 'concurrent.futures',
+    'subprocess', 'gi',
+]
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, check=True,
+        capture_output=True, text=True,
+    ).stdout
+
+
+def test_import_is_lazy():
+    out = run('import sys, audioread; '
+              'print(" ".join(m for m in {!r} if m in sys.modules))'
+              .format(HEAVY_MODULES))
+    assert out.split() == []
+
+
+def test_import_time_budget():
+    code = ('import time; start = time.perf_counter(); import audioread; '
+            'print(time.perf_counter() - start)')
+    best = min(float(run(code)) for _ in range(3))
+    assert best < IMPORT_BUDGET
+
+
+def test_lazy_attributes():
+    from audioread import ffdec, open_sequence
+    assert audioread.ffdec is ffdec
+    assert callable(open_sequence)
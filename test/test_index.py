@@ -0,0 +1,123 @@
+import os
+import sqlite3
+
+import audioread
+from audioread.index import MetadataIndex, backend_name
+from audioread.rawread import RawAudioFile
+
+from conftest import write_wav
+
+
+class FailingBackend:
+    def __init__(self, path):
+        raise audioread.DecodeError()
+
+
+class UnknownLength(RawAudioFile):
+    """A backend that can't tell how long the audio is."""
+    duration = None
+    nframes = None
+
+
+class BadChannels(RawAudioFile):
+    """A backend that reports no channel count for files named bad."""
+    @property
+    def channels(self):
+        if os.path.basename(self._fh.name).startswith('bad'):
+            return None
+        return super().channels
+
+
+def test_refresh_and_lookup(wav, tmp_path):
+    path, data = wav
+    db = str(tmp_path / 'index.db')
+    with MetadataIndex(db) as index:
+        assert index.lookup(path) is None
+        info = index.refresh(path, [RawAudioFile])
+        assert info.channels == 2
+        assert info.samplerate == 44100
+        assert info.nframes == len(data) // 4
+        assert info.backend == backend_name(RawAudioFile)
+
+    # The index persists and answers without a decoder.
+    with MetadataIndex(db) as index:
+        assert index.lookup(path) == info
+        assert index.info(path, backends=[]) == info
+
+
+def test_changed_file_is_stale(wav):
+    path, _ = wav
+    index = MetadataIndex()
+    index.refresh(path, [RawAudioFile])
+    write_wav(path, nframes=100)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    assert index.lookup(path) is None
+    assert index.info(path, [RawAudioFile]).nframes == 100
+
+
+def test_refresh_many(tmp_path):
+    paths = []
+    for i in range(5):
+        path = str(tmp_path / '{}.wav'.format(i))
+        write_wav(path, nframes=10 * (i + 1))
+        paths.append(path)
+    bad = str(tmp_path / 'bad.wav')
+    with open(bad, 'wb') as f:
+        f.write(b'not audio')
+
+    index = MetadataIndex()
+    results = index.refresh_many(paths + [bad], jobs=3,
+                                 backends=[RawAudioFile])
+    assert [results[p].nframes for p in paths] == [10, 20, 30, 40, 50]
+    assert isinstance(results[bad], audioread.DecodeError)
+    found = index.lookup_many(paths + [bad])
+    assert found[bad] is None
+    assert all(found[p] == results[p] for p in paths)
+
+
+def test_backends_for(wav):
+    path, _ = wav
+    index = MetadataIndex()
+    index.refresh(path, [FailingBackend, RawAudioFile])
+    order = index.backends_for(path, [FailingBackend, RawAudioFile])
+    assert order == [RawAudioFile, FailingBackend]
+    with index.open(path, [FailingBackend, RawAudioFile]) as f:
+        assert isinstance(f, RawAudioFile)
+
+
+def test_unknown_length_is_stored(wav):
+    path, _ = wav
+    index = MetadataIndex()
+    info = index.refresh(path, [UnknownLength])
+    assert (info.duration, info.nframes) == (None, None)
+    assert index.lookup(path) == info
+
+
+def test_rejected_entry_does_not_fail_batch(tmp_path):
+    good = str(tmp_path / 'good.wav')
+    write_wav(good, nframes=10)
+    bad = str(tmp_path / 'bad.wav')
+    write_wav(bad, nframes=20)
+
+    index = MetadataIndex()
+    results = index.refresh_many([good, bad], backends=[BadChannels])
+    assert isinstance(results[bad], sqlite3.IntegrityError)
+    assert results[good].nframes == 10
+    assert index.lookup(good) == results[good]
+    assert index.lookup(bad) is None
+
+
+def test_old_schema_is_rebuilt(wav, tmp_path):
+    path, _ = wav
+    db = str(tmp_path / 'index.db')
+    conn = sqlite3.connect(db)
+    conn.execute('CREATE TABLE files (path TEXT PRIMARY KEY, '
+                 'nframes INTEGER NOT NULL)')
+    conn.commit()
+    conn.close()
+
+    with MetadataIndex(db) as index:
+        info = index.refresh(path, [UnknownLength])
+    with MetadataIndex(db) as index:
+        assert index.lookup(path) == info
@@ -0,0 +1,107 @@
+import io
+import os
+
+import pytest
+
+from audioread import mpeg
+
+from conftest import DATADIR
+
+
+def test_info_tag():
+    # test-2.mp3 has an Info tag with LAME delay and padding fields.
+    info = mpeg.read_info_path(os.path.join(DATADIR, 'test-2.mp3'))
+    assert info.samplerate == 44100
+    assert info.channels == 2
+    assert info.tag_frame
+    assert (info.encoder_delay, info.encoder_padding) == (576, 1080)
+    assert info.nframes == 2 * 44100
+    assert info.raw_nframes == (info.frames + 1) * 1152
+
+
+def test_frame_scan():
+    # test-1.mp3 has no tag, so its frames are counted.
+    info = mpeg.read_info_path(os.path.join(DATADIR, 'test-1.mp3'))
+    assert info.samplerate == 22050
+    assert info.channels == 1
+    assert not info.tag_frame
+    assert info.nframes == info.frames * 576
+    assert int(info.duration) == 15
+
+
+def test_not_mpeg():
+    with pytest.raises(mpeg.UnsupportedError):
+        mpeg.read_info(io.BytesIO(b'RIFF' + bytes(4096)))
+
+
+def test_frame_index():
+    path = os.path.join(DATADIR, 'test-2.mp3')
+    index = mpeg.build_index_path(path)
+    info = mpeg.read_info_path(path)
+    assert index.frames == info.frames + 1  # Including the tag frame.
+    assert index.raw_nframes == info.raw_nframes
+    assert index.nframes == info.nframes
+    assert index.offsets[0] == info.offset
+
+    # Every offset holds a frame header.
+    with open(path, 'rb') as fh:
+        for offset in index.offsets[:-1]:
+            fh.seek(offset)
+            assert mpeg.parse_header(fh.read(4)) is not None
+
+
+def test_seek_point():
+    index = mpeg.build_index_path(os.path.join(DATADIR, 'test-1.mp3'))
+    assert index.seek_point(0) == (0, 0)
+    for sample in (100, 5000, 50000, index.raw_nframes - 1):
+        frame, skip = index.seek_point(sample)
+        # Decoding starts before the target frame, with priming frames.
+        target = sample // index.samples_per_frame
+        assert frame <= max(target - mpeg.PRIMING_FRAMES, 0)
+        assert sample % index.samples_per_frame <= skip
+        assert skip <= sample - frame * index.samples_per_frame
+
+
+def test_split():
+    index = mpeg.build_index_path(os.path.join(DATADIR, 'test-1.mp3'))
+    ranges = index.split(4)
+    assert len(ranges) == 4
+    assert ranges[0][0] == 0 and ranges[-1][1] == index.raw_nframes
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert start % index.samples_per_frame == 0
+
+
+def test_index_sidecar(tmp_path):
+    path = tmp_path / 'a.mp3'
+    with open(os.path.join(DATADIR, 'test-1.mp3'), 'rb') as f:
+        path.write_bytes(f.read())
+
+    index = mpeg.load_index(path)
+    sidecar = str(path) + mpeg.INDEX_SUFFIX
+    loaded = mpeg.FrameIndex.load(sidecar)
+    assert list(loaded.offsets) == list(index.offsets)
+    assert loaded.seek_point(12345) == index.seek_point(12345)
+    assert mpeg.load_index(path).source == index.source
+
+    # A changed file makes the sidecar stale.
+    with open(path, 'ab') as f:
+        f.write(b'TAG' + bytes(125))
+    assert mpeg.load_index(path).source[0] == index.source[0] + 128
+
+    with pytest.raises(mpeg.IndexFormatError):
+        mpeg.FrameIndex.loads(b'ARMI' + bytes(10))
+
+
+def test_mad_ranges_join_up():
+    mad = pytest.importorskip('mad')  # noqa: F841
+    from audioread import maddec
+    path = os.path.join(DATADIR, 'test-1.mp3')
+    with maddec.MadAudioFile(path) as f:
+        whole = b''.join(f)
+    index = mpeg.build_index_path(path)
+    parts = []
+    for start, end in index.split(3):
+        with maddec.MadAudioFile(path, index, start, end) as f:
+            parts.append(b''.join(f))
+    assert b''.join(parts) == whole
@@ -0,0 +1,84 @@
+import errno
+import io
+import os
+import wave
+
+import pytest
+
+from audioread import bigwav, passthrough, rawread
+
+from conftest import write_wav
+
+
+def test_find_pcm(wav, tmp_path):
+    path, data = wav
+    layout = passthrough.find_pcm(path)
+    assert (layout.channels, layout.samplerate) == (2, 44100)
+    assert layout.size == len(data)
+
+    eight_bit = str(tmp_path / 'eight.wav')
+    write_wav(eight_bit, width=1)
+    assert passthrough.find_pcm(eight_bit) is None
+
+    other = tmp_path / 'other.wav'
+    other.write_bytes(b'FORM' + bytes(100))
+    assert passthrough.find_pcm(str(other)) is None
+
+
+def test_copy_wav_matches_decode(wav, tmp_path):
+    path, data = wav
+    dest = str(tmp_path / 'out.wav')
+    assert passthrough.copy_pcm(path, dest) is not None
+
+    with wave.open(dest) as w:
+        assert (w.getnchannels(), w.getframerate(), w.getsampwidth()) == \
+            (2, 44100, 2)
+    with rawread.RawAudioFile(dest) as f:
+        assert b''.join(f) == data
+
+
+def test_copy_raw(wav, tmp_path):
+    path, data = wav
+    dest = tmp_path / 'out.pcm'
+    passthrough.copy_pcm(path, str(dest), 'raw')
+    assert dest.read_bytes() == data
+
+
+def test_not_copied(tmp_path):
+    src = str(tmp_path / 'eight.wav')
+    write_wav(src, width=1)
+    dest = tmp_path / 'out.wav'
+    assert passthrough.copy_pcm(src, str(dest)) is None
+    assert not dest.exists()
+
+
+def test_copy_fallbacks(wav, tmp_path, monkeypatch):
+    path, data = wav
+
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, 'cross-device')
+    monkeypatch.setattr(os, 'copy_file_range', unsupported, raising=False)
+    monkeypatch.delattr(os, 'sendfile', raising=False)
+
+    dest = tmp_path / 'out.pcm'
+    passthrough.copy_pcm(path, str(dest), 'raw')
+    assert dest.read_bytes() == data
+
+
+def test_bad_format(wav, tmp_path):
+    with pytest.raises(ValueError):
+        passthrough.copy_pcm(wav[0], str(tmp_path / 'x'), 'float')
+
+
+def test_rf64_header_for_large_data():
+    size = 6 * 1024 ** 3
+    header = passthrough.wav_header(2, 44100, size)
+    assert header[:4] == b'RF64'
+    reader = bigwav.open(io.BytesIO(header))
+    assert reader.getnchannels() == 2
+    assert reader.getframerate() == 44100
+    assert reader.getnframes() == size // 4
+    assert len(header) == 80
+
+    small = passthrough.wav_header(2, 44100, 4410 * 4)
+    assert small[:4] == b'RIFF' and len(small) == 44
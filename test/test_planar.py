@@ -0,0 +1,50 @@
+import struct
+
+from audioread import rawread
+from audioread.base import AudioFile
+from audioread.synth import SynthAudioFile
+
+
+class Blocks(AudioFile):
+    """An audio file that yields the given blocks."""
+    def __init__(self, channels, *blocks):
+        self.channels = channels
+        self.blocks = blocks
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+
+def pack(samples):
+    return struct.pack('<{}h'.format(len(samples)), *samples)
+
+
+def test_deinterleave(wav):
+    path, data = wav
+    with rawread.RawAudioFile(path) as f:
+        blocks = list(f.read_planar())
+    left = b''.join(b[0] for b in blocks)
+    right = b''.join(b[1] for b in blocks)
+    samples = struct.unpack('<{}h'.format(len(data) // 2), data)
+    assert left == pack(samples[0::2])
+    assert right == pack(samples[1::2])
+
+
+def test_frames_split_between_blocks():
+    samples = list(range(-300, 300))  # 200 frames of 3 channels.
+    data = pack(samples)
+    f = Blocks(3, data[:7], data[7:8], data[8:500], data[500:])
+    blocks = list(f.read_planar())
+    for c in range(3):
+        assert b''.join(b[c] for b in blocks) == pack(samples[c::3])
+    assert all(len(set(map(len, b))) == 1 for b in blocks)
+
+
+def test_any_backend():
+    f = SynthAudioFile(duration=0.1, samplerate=8000, channels=4,
+                       block_frames=100)
+    blocks = list(f.read_planar())
+    assert len(blocks) == 8
+    assert all(len(b) == 4 and len(b[0]) == 200 for b in blocks)
+    # The synthetic tone is the same on every channel.
+    assert all(len(set(b)) == 1 for b in blocks)
@@ -0,0 +1,95 @@
+import gc
+import threading
+import time
+
+import pytest
+
+from audioread import NoBackendError, open_sequence, rawread
+from audioread.prefetch import PrefetchedAudioFile
+
+from conftest import write_wav
+
+
+@pytest.fixture
+def playlist(tmp_path):
+    paths, datas = [], []
+    for i in range(5):
+        path = str(tmp_path / 'track{}.wav'.format(i))
+        datas.append(write_wav(path, channels=1, nframes=1000 * (i + 1)))
+        paths.append(path)
+    return paths, datas
+
+
+def test_sequence_in_order(playlist):
+    paths, datas = playlist
+    out = []
+    for f in open_sequence(paths, prefetch=2,
+                           backends=[rawread.RawAudioFile]):
+        with f:
+            assert f.channels == 1
+            out.append(b''.join(f))
+    assert out == datas
+
+
+def test_small_buffer(playlist):
+    paths, datas = playlist
+    seq = open_sequence(paths, prefetch=3, backends=[rawread.RawAudioFile],
+                        max_buffer=1)
+    assert [b''.join(f) for f in seq] == datas
+
+
+def test_error_raised_on_use(playlist, tmp_path):
+    paths, datas = playlist
+    bad = tmp_path / 'bad.wav'
+    bad.write_bytes(b'nope' * 100)
+    paths.insert(1, str(bad))
+
+    files = open_sequence(paths, backends=[rawread.RawAudioFile])
+    assert b''.join(next(files)) == datas[0]
+    f = next(files)
+    with pytest.raises(NoBackendError):
+        f.channels
+    assert b''.join(next(files)) == datas[1]
+    files.close()
+
+
+def test_abandoned_sequence_stops_threads(playlist):
+    paths, _ = playlist
+    before = threading.active_count()
+    files = open_sequence(paths, prefetch=3, backends=[rawread.RawAudioFile],
+                          max_buffer=1)
+    next(files)
+    files.close()
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread():
+            thread.join(timeout=5)
+    assert threading.active_count() <= before
+
+
+def test_prefetched_file_attributes(playlist):
+    paths, _ = playlist
+    with PrefetchedAudioFile(paths[0], [rawread.RawAudioFile]) as f:
+        assert f.ready.result(timeout=5) is None
+        assert (f.samplerate, f.nframes) == (44100, 1000)
+        assert isinstance(f.backend, rawread.RawAudioFile)
+
+
+def test_abandoned_file_with_full_buffer_is_closed(playlist):
+    paths, _ = playlist
+    f = PrefetchedAudioFile(paths[4], [rawread.RawAudioFile], buffer_size=1)
+    f.ready.result(timeout=5)
+    state, thread = f._state, f._thread
+    # Wait for the worker to fill the buffer and block.
+    deadline = time.monotonic() + 5
+    while not state.blocks and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert state.blocks
+
+    gc.disable()
+    try:
+        del f
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    finally:
+        gc.enable()
+    assert state.file._fh.closed
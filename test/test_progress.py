@@ -0,0 +1,51 @@
+import pytest
+
+from audioread import base, rawread
+
+
+def test_progress_counts_frames(wav):
+    path, data = wav
+    with rawread.RawAudioFile(path) as f:
+        progress = f.progress
+        assert progress.frames == 0
+        assert progress.fraction == 0.0
+
+        blocks = f.read_data(441)
+        next(blocks)
+        progress = f.progress
+        assert progress.frames == 441
+        assert progress.seconds == pytest.approx(0.01)
+        assert progress.fraction == pytest.approx(0.1)
+
+        for _ in blocks:
+            pass
+        progress = f.progress
+        assert progress.frames == 4410
+        assert progress.fraction == 1.0
+        assert progress.eta == 0.0
+        assert progress.average_speed > 0
+
+
+def test_speed_window(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(base.time, 'monotonic', lambda: clock[0])
+
+    class Fake(base.AudioFile):
+        channels = 1
+        samplerate = 1000
+        duration = 100.0
+
+    f = Fake()
+    # One second of audio per second, then twice as fast.
+    for _ in range(10):
+        clock[0] += 1.0
+        f._advance(2000)
+    for _ in range(10):
+        clock[0] += 1.0
+        f._advance(4000)
+
+    progress = f.progress
+    assert progress.seconds == 30.0
+    assert progress.average_speed == pytest.approx(1.5)
+    assert progress.speed == pytest.approx(2.0)
+    assert progress.eta == pytest.approx(70.0 / 1.5)
@@ -1,6 +1,10 @@
+import io
 import os
 
-from audioread.rawread import byteswap
+import pytest
+
+import audioread
+from audioread.rawread import RawAudioFile, UnsupportedError, byteswap
 
 
 def test_byteswap_known_values():
@@ -13,3 +17,55 @@ def test_byteswap_roundtrip():
     if len(data) % 2:
         data = data[:-1]
     assert byteswap(byteswap(data)) == data
+
+
+def test_open_buffer(wav):
+    path, data = wav
+    with open(path, 'rb') as f:
+        contents = f.read()
+    with RawAudioFile(contents) as a:
+        assert a.channels == 2
+        assert a.samplerate == 44100
+        assert b''.join(a) == data
+
+
+def test_open_fileobj(wav):
+    path, data = wav
+    with open(path, 'rb') as f:
+        with RawAudioFile(f) as a:
+            assert b''.join(a) == data
+        # The caller's file object is left open.
+        assert not f.closed
+
+
+def test_audio_open_rewinds_fileobj(wav):
+    path, data = wav
+
+    class GreedyBackend:
+        """A backend that consumes its input before failing."""
+        def __init__(self, f):
+            f.read()
+            raise audioread.DecodeError()
+
+    with open(path, 'rb') as f:
+        backends = [GreedyBackend, RawAudioFile]
+        with audioread.audio_open(f, backends=backends) as a:
+            assert b''.join(a) == data
+
+
+def test_unseekable_fileobj_rejected(wav):
+    path, _ = wav
+
+    class Stream(io.RawIOBase):
+        def seekable(self):
+            return False
+
+    with pytest.raises(UnsupportedError):
+        RawAudioFile(Stream())
+
+
+def test_nframes(wav):
+    path, data = wav
+    with RawAudioFile(path) as a:
+        assert a.nframes == len(data) // 4
+        assert a.duration == a.nframes / a.samplerate
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from audioread.reblock import RingBuffer, reblock
+
+
+class FakeAudioFile:
+    """Yields the given data in blocks of varying (odd) sizes."""
+    def __init__(self, data, channels, sizes=(7, 1, 13, 4096, 3)):
+        self.data = data
+        self.channels = channels
+        self.sizes = sizes
+
+    def __iter__(self):
+        pos = 0
+        i = 0
+        while pos < len(self.data):
+            size = self.sizes[i % len(self.sizes)]
+            yield self.data[pos:pos + size]
+            pos += size
+            i += 1
+
+
+def reference(data, frame_size, size, hop, pad):
+    """A straightforward implementation of reblock over joined data."""
+    window = size * frame_size
+    end = len(data) - len(data) % frame_size
+    out = []
+    pos = 0
+    while pos + window <= end:
+        out.append(data[pos:pos + window])
+        pos += hop * frame_size
+    if pad:
+        covered = pos + window - hop * frame_size if out else 0
+        while pos < end and end > covered:
+            out.append(data[pos:end].ljust(window, b'\0'))
+            covered = pos + window
+            pos += hop * frame_size
+    return out
+
+
+@pytest.mark.parametrize('channels', [1, 2, 6])
+@pytest.mark.parametrize('size,hop', [(64, 64), (64, 16), (100, 33), (16, 50)])
+@pytest.mark.parametrize('pad', [False, True])
+def test_matches_reference(channels, size, hop, pad):
+    data = os.urandom(2 * channels * 1000 + 3)
+    f = FakeAudioFile(data, channels)
+    got = [bytes(w) for w in reblock(f, size, hop, pad)]
+    assert got == reference(data, 2 * channels, size, hop, pad)
+
+
+def test_ring_buffer_wraps_and_grows():
+    ring = RingBuffer(8)
+    ring.write(b'abcdef')
+    ring.discard(4)
+    ring.write(b'ghijkl')  # Wraps around.
+    out = bytearray(8)
+    ring.peek_into(out)
+    assert out == b'efghijkl'
+    ring.write(b'0123456789')  # Grows.
+    assert ring.capacity >= 18
+    out = bytearray(len(ring))
+    ring.peek_into(out)
+    assert out == b'efghijkl0123456789'
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        list(reblock(FakeAudioFile(b'', 1), 0))
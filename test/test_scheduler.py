@@ -0,0 +1,142 @@
+import gc
+import threading
+
+import pytest
+
+import audioread
+from audioread import DecodeError, ffdec, scheduler
+from audioread.base import AudioFile
+
+from conftest import write_wav
+
+
+class FakeFile(AudioFile):
+    channels = 1
+    samplerate = 8000
+    duration = 0.0
+
+    def __init__(self, path):
+        if path == 'bad':
+            raise DecodeError('bad file')
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def __iter__(self):
+        return iter([])
+
+
+@pytest.fixture
+def sched():
+    s = scheduler.Scheduler({FakeFile: 1})
+    previous = scheduler.set_scheduler(s)
+    yield s
+    scheduler.set_scheduler(previous)
+
+
+def test_limit_and_release_on_close(sched):
+    f = audioread.audio_open('a', [FakeFile])
+    assert sched.stats()[FakeFile].active == 1
+    with pytest.raises(TimeoutError):
+        sched.acquire(FakeFile, timeout=0.05)
+    assert sched.stats()[FakeFile].queued == 0
+
+    f.close()
+    assert f.closed
+    assert sched.stats()[FakeFile].active == 0
+    f.close()
+    assert sched.stats()[FakeFile].active == 0
+
+
+def test_release_on_failure_and_collection(sched):
+    with pytest.raises(audioread.NoBackendError):
+        audioread.audio_open('bad', [FakeFile])
+    f = audioread.audio_open('a', [FakeFile])
+    del f
+    gc.collect()
+    assert sched.stats()[FakeFile].active == 0
+
+
+def test_priority_order(sched):
+    first = sched.acquire(FakeFile)
+    order = []
+
+    def request(name, priority):
+        slot = sched.acquire(FakeFile, priority)
+        order.append(name)
+        slot.release()
+
+    threads = [
+        threading.Thread(target=request, args=('batch', scheduler.BATCH)),
+        threading.Thread(target=request,
+                         args=('interactive', scheduler.INTERACTIVE)),
+    ]
+    for thread in threads:
+        thread.start()
+        while sched.stats()[FakeFile].queued < threads.index(thread) + 1:
+            pass
+    first.release()
+    for thread in threads:
+        thread.join()
+    assert order == ['interactive', 'batch']
+
+    stats = sched.stats()[FakeFile]
+    assert stats.acquired == 3
+    assert stats.max_wait > 0
+
+
+def test_raising_limit_wakes_waiters(sched):
+    held = sched.acquire(FakeFile)
+    got = threading.Event()
+
+    def request():
+        sched.acquire(FakeFile)
+        got.set()
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    assert not got.wait(0.05)
+    sched.set_limit(FakeFile, 2)
+    assert got.wait(5)
+    thread.join()
+    held.release()
+
+
+def test_cyclic_garbage_is_closed(sched):
+    closed = []
+
+    class CyclicFile(FakeFile):
+        def __init__(self, path):
+            super().__init__(path)
+            self.me = self
+
+        def close(self):
+            closed.append(True)
+
+        def __del__(self):
+            self.close()
+
+    sched.set_limit(CyclicFile, 1)
+    f = audioread.audio_open('a', [CyclicFile])
+    del f
+    gc.collect()
+    # The backend's own close ran, not just the slot release.
+    assert closed
+    assert sched.stats()[CyclicFile].active == 0
+
+
+@pytest.mark.skipif(not ffdec.available(), reason='ffmpeg is not installed')
+def test_abandoned_ffmpeg_files_are_closed(sched, tmp_path):
+    path = str(tmp_path / 'a.wav')
+    write_wav(path, nframes=44100)
+    sched.set_limit(ffdec.FFmpegAudioFile, 4)
+    procs = []
+    for _ in range(10):
+        f = audioread.audio_open(path, [ffdec.FFmpegAudioFile])
+        procs.append(f.proc)
+        del f
+    gc.collect()
+    assert all(p.returncode is not None for p in procs)
+    assert all(p.stdout.closed for p in procs)
+    assert sched.stats()[ffdec.FFmpegAudioFile].active == 0
@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+
+from audioread import shm
+from audioread.rawread import RawAudioFile
+
+
+def test_iter_shared(wav):
+    path, data = wav
+    with RawAudioFile(path) as f:
+        handles = list(shm.iter_shared(f, segment_frames=1000))
+    try:
+        assert [h.nframes for h in handles] == [1000] * 4 + [410]
+        # Handles are small and picklable.
+        handles = pickle.loads(pickle.dumps(handles))
+        assert handles[0].channels == 2
+        assert handles[0].samplerate == 44100
+        assert b''.join(h.read() for h in handles) == data
+    finally:
+        for h in handles:
+            h.unlink()
+
+
+def test_decode_shared(wav):
+    path, data = wav
+    handle = shm.decode_shared(path, backends=[RawAudioFile])
+    try:
+        assert handle.nframes == len(data) // 4
+        with handle.open() as view:
+            assert view == data
+    finally:
+        handle.unlink()
+
+
+def test_unsupported_platform(wav, monkeypatch):
+    path, _ = wav
+    monkeypatch.setattr(shm, 'SUPPORTED', False)
+    with pytest.raises(shm.UnsupportedError):
+        shm.decode_shared(path, [RawAudioFile])
+    with RawAudioFile(path) as f:
+        with pytest.raises(shm.UnsupportedError):
+            next(shm.iter_shared(f))
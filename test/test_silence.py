@@ -0,0 +1,103 @@
+import struct
+
+from audioread.silence import trim_silence
+
+
+class Blocks:
+    """A mono stream made of the given blocks."""
+    channels = 1
+    samplerate = 1000
+
+    def __init__(self, *blocks):
+        self.blocks = blocks
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+
+def tone(frames, value=10000):
+    return struct.pack('<{}h'.format(frames), *([value, -value] *
+                                                 frames)[:frames])
+
+
+def quiet(frames):
+    return bytes(2 * frames)
+
+
+def trim(data, block=70, **kwargs):
+    stream = Blocks(*[data[i:i + block] for i in range(0, len(data), block)])
+    return list(trim_silence(stream, window=0.01, **kwargs))
+
+
+def joined(pieces):
+    """Merge adjacent pieces into (offset, frames) runs."""
+    runs = []
+    for offset, data in pieces:
+        frames = len(data) // 2
+        if runs and runs[-1][0] + runs[-1][1] == offset:
+            runs[-1][1] += frames
+        else:
+            runs.append([offset, frames])
+    return [tuple(r) for r in runs]
+
+
+def test_leading_trailing_and_long_internal():
+    data = quiet(300) + tone(200) + quiet(600) + tone(100) + quiet(400)
+    pieces = trim(data, min_silence=0.5)
+    assert joined(pieces) == [(300, 200), (1100, 100)]
+    for offset, block in pieces:
+        assert block == data[2 * offset:2 * offset + len(block)]
+
+
+def test_short_pauses_kept():
+    data = tone(100) + quiet(200) + tone(100)
+    assert joined(trim(data, min_silence=0.5)) == [(0, 400)]
+
+
+def test_options_off():
+    data = quiet(100) + tone(100) + quiet(100)
+    assert joined(trim(data, leading=False, internal=False)) == [(0, 200)]
+    assert joined(trim(data, trailing=False, internal=False)) == \
+        [(100, 200)]
+    assert joined(trim(data, leading=False, trailing=False,
+                       internal=False)) == [(0, 300)]
+
+
+def test_threshold():
+    data = tone(100, value=20) + tone(100)
+    # -60 dBFS is a level of about 32.
+    assert joined(trim(data, threshold=-60)) == [(100, 100)]
+    assert joined(trim(data, threshold=-70)) == [(0, 200)]
+
+
+def test_partial_final_window():
+    data = tone(105)
+    assert joined(trim(data)) == [(0, 105)]
+
+
+def test_trailing_governs_final_silence():
+    data = tone(100) + quiet(800)
+    assert joined(trim(data, trailing=False)) == [(0, 900)]
+    assert joined(trim(data, trailing=True)) == [(0, 100)]
+    # A long internal silence is still dropped.
+    data = tone(100) + quiet(800) + tone(100) + quiet(800)
+    assert joined(trim(data, trailing=False)) == [(0, 100), (900, 900)]
+
+
+def test_internal_silence_kept_without_internal():
+    data = tone(100) + quiet(800) + tone(100) + quiet(800)
+    pieces = trim(data, internal=False)
+    assert joined(pieces) == [(0, 1000)]
+    for offset, block in pieces:
+        assert block == data[2 * offset:2 * offset + len(block)]
+
+
+def test_long_silence_is_spooled(monkeypatch):
+    from audioread import silence
+    monkeypatch.setattr(silence, 'SPOOL_SIZE', 64)
+    monkeypatch.setattr(silence, 'RELEASE_SIZE', 100)
+    data = tone(100) + quiet(3000) + tone(100)
+    pieces = trim(data, internal=False)
+    assert joined(pieces) == [(0, 3200)]
+    assert b''.join(block for _, block in pieces) == data
+    assert max(len(block) for _, block in pieces) <= 2 * 100 + 2 * 70
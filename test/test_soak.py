@@ -0,0 +1,167 @@
+"""Soak tests: open, partly read, abandon, and close many files with
+each backend and check that no resources leak.
+
+A short run on the raw backend is always done. Set the AUDIOREAD_SOAK
+environment variable to a number of files (for example, 100000) to run
+the full suite with every available backend:
+
+    AUDIOREAD_SOAK=100000 python -m pytest test/test_soak.py
+"""
+import gc
+import os
+import sys
+import time
+
+import pytest
+
+import audioread
+from audioread import rawread
+
+from conftest import TEST_AUDIOFILES, DATADIR, write_wav
+
+ITERATIONS = int(os.environ.get('AUDIOREAD_SOAK') or 0)
+
+# The number of files in the short run.
+SHORT_ITERATIONS = 400
+
+# Allowed RSS growth between checkpoints, for allocator noise.
+RSS_SLACK = 4 * 1024 * 1024
+
+# How long to wait for threads and processes to wind down.
+SETTLE_TIME = 5.0
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith('linux'),
+                                reason='reads /proc')
+
+
+def _children():
+    """Count the processes (including zombies) whose parent is us."""
+    pid = str(os.getpid())
+    count = 0
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open('/proc/{}/stat'.format(entry)) as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; the fields after it don't.
+        if stat.rsplit(')', 1)[1].split()[1] == pid:
+            count += 1
+    return count
+
+
+def _rss():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def _counts():
+    """The open fds, native threads, and child processes.
+
+    No garbage collection is forced first: files that are dropped must
+    be cleaned up by reference counting alone, not only once the
+    cyclic collector happens to run.
+    """
+    return {
+        'fds': len(os.listdir('/proc/self/fd')),
+        'threads': len(os.listdir('/proc/self/task')),
+        'children': _children(),
+    }
+
+
+def _settle(baseline):
+    """Wait for the resource counts to drop back to `baseline` and
+    return the final counts.
+    """
+    deadline = time.monotonic() + SETTLE_TIME
+    while True:
+        counts = _counts()
+        if all(counts[k] <= baseline[k] for k in baseline):
+            return counts
+        if time.monotonic() > deadline:
+            return counts
+        time.sleep(0.05)
+
+
+def _use(backend, path, i):
+    """Open a file and use it in one of several ways."""
+    mode = i % 5
+    if mode == 0:
+        # Read everything.
+        with backend(path) as f:
+            for _ in f:
+                pass
+    elif mode == 1:
+        # Read one block and close.
+        with backend(path) as f:
+            next(iter(f), None)
+    elif mode == 2:
+        # Read one block and drop the file without closing it.
+        f = backend(path)
+        it = iter(f)
+        next(it, None)
+        del it, f
+    elif mode == 3:
+        # Open and close without reading.
+        backend(path).close()
+    else:
+        # Abandon the file without ever touching it.
+        backend(path)
+
+
+def _soak(backend, path, iterations):
+    warmup = max(iterations // 10, 50)
+    for i in range(warmup):
+        _use(backend, path, i)
+    gc.collect()
+    baseline = _settle(_counts())
+    rss = [_rss()]
+
+    checkpoints = 4
+    per_checkpoint = max((iterations - warmup) // checkpoints, 1)
+    for c in range(checkpoints):
+        for i in range(per_checkpoint):
+            _use(backend, path, i)
+        counts = _settle(baseline)
+        rss.append(_rss())
+        for key in baseline:
+            assert counts[key] <= baseline[key], \
+                '{} grew from {} to {} after {} files'.format(
+                    key, baseline[key], counts[key],
+                    warmup + (c + 1) * per_checkpoint,
+                )
+        # Nothing should be left for the collector either.
+        gc.collect()
+        counts = _settle(baseline)
+        for key in baseline:
+            assert counts[key] <= baseline[key], \
+                '{} grew from {} to {} after a collection'.format(
+                    key, baseline[key], counts[key],
+                )
+
+    growth = rss[-1] - min(rss)
+    assert growth <= RSS_SLACK, \
+        'RSS grew by {} KiB: {}'.format(growth // 1024,
+                                        [r // 1024 for r in rss])
+
+
+def _soak_params():
+    if not ITERATIONS:
+        return []
+    return [pytest.param(b, id=b.__module__.split('.')[-1])
+            for b in audioread.available_backends()
+            if b is not rawread.RawAudioFile]
+
+
+def test_soak_raw(tmp_path):
+    path = str(tmp_path / 'soak.wav')
+    write_wav(path, nframes=44100)
+    _soak(rawread.RawAudioFile, path, ITERATIONS or SHORT_ITERATIONS)
+
+
+@pytest.mark.parametrize('backend', _soak_params())
+def test_soak_backend(backend):
+    path = os.path.join(DATADIR, TEST_AUDIOFILES[0] + '.mp3')
+    _soak(backend, path, ITERATIONS)
@@ -0,0 +1,83 @@
+import math
+import struct
+
+import pytest
+
+from audioread import rawread
+from audioread.summary import Summary, SummaryFormatError
+
+from conftest import write_wav
+
+
+def pcm(frames):
+    """Pack a list of per-frame sample tuples as 16-bit PCM."""
+    return b''.join(struct.pack('<{}h'.format(len(f)), *f) for f in frames)
+
+
+def test_levels_and_overview():
+    frames = [(100, -5), (-300, 5), (200, 0), (0, 0), (32767, -32768)]
+    summary = Summary(2, 44100, samples_per_bin=2)
+    summary.update(pcm(frames))
+
+    assert summary.frames == 5
+    assert summary.peak == [32767 / 32768.0, 1.0]
+    left = [f[0] for f in frames]
+    expected = math.sqrt(sum(x * x for x in left) / 5) / 32768.0
+    assert summary.rms[0] == pytest.approx(expected)
+
+    (lmin, lmax), (rmin, rmax) = summary.overview()
+    assert list(lmin) == [-300, 0, 32767]
+    assert list(lmax) == [100, 200, 32767]
+    assert list(rmin) == [-5, 0, -32768]
+    assert list(rmax) == [5, 0, -32768]
+
+
+def test_blocks_split_anywhere():
+    frames = [(i * 7 % 200 - 100, -i) for i in range(50)]
+    data = pcm(frames)
+
+    whole = Summary(2, 8000, samples_per_bin=8)
+    whole.update(data)
+    split = Summary(2, 8000, samples_per_bin=8)
+    for i in range(0, len(data), 3):
+        split.update(data[i:i + 3])
+
+    assert split.frames == whole.frames
+    assert split.peak == whole.peak
+    assert split.rms == whole.rms
+    assert split.overview() == whole.overview()
+
+
+def test_tap_passes_blocks_through(wav):
+    path, data = wav
+    with rawread.RawAudioFile(path) as f:
+        summary = Summary.for_file(f, bins=10)
+        assert b''.join(summary.tap(f)) == data
+    assert summary.frames == 4410
+    assert len(summary.overview()[0][0]) == 10
+
+
+def test_sidecar_round_trip(tmp_path):
+    path = str(tmp_path / 'tone.wav')
+    write_wav(path, channels=2, nframes=5000)
+    with rawread.RawAudioFile(path) as f:
+        summary = Summary.for_file(f, bins=7)
+        for _ in summary.tap(f):
+            pass
+
+    sidecar = str(tmp_path / 'tone.peaks')
+    summary.save(sidecar)
+    loaded = Summary.load(sidecar)
+    assert (loaded.channels, loaded.samplerate, loaded.frames) == \
+        (2, 44100, 5000)
+    assert loaded.peak == summary.peak
+    assert loaded.rms == summary.rms
+    assert loaded.overview() == summary.overview()
+
+
+def test_bad_sidecar():
+    with pytest.raises(SummaryFormatError):
+        Summary.loads(b'nope')
+    data = Summary(1, 8000).dumps()
+    with pytest.raises(SummaryFormatError):
+        Summary.loads(data + b'\0')
@@ -0,0 +1,81 @@
+import struct
+import time
+
+import pytest
+
+import audioread
+from audioread import rawread
+from audioread.reblock import reblock
+from audioread.synth import SynthAudioFile, UnsupportedError, parse_url
+
+
+def test_open_through_audio_open():
+    url = 'synth:tone?duration=0.5&samplerate=8000&channels=1'
+    with audioread.audio_open(url, [SynthAudioFile,
+                                    rawread.RawAudioFile]) as f:
+        assert isinstance(f, SynthAudioFile)
+        assert (f.channels, f.samplerate, f.nframes) == (1, 8000, 4000)
+        data = b''.join(f)
+    assert len(data) == 4000 * 2
+    assert f.progress.frames == 4000
+
+
+def test_other_paths_are_rejected():
+    with pytest.raises(UnsupportedError):
+        SynthAudioFile('/some/file.wav')
+    with pytest.raises(audioread.NoBackendError):
+        audioread.audio_open('/some/file.wav', [SynthAudioFile])
+
+
+def test_parse_url():
+    assert parse_url('synth:noise?seed=3&speed=2') == \
+        {'signal': 'noise', 'seed': 3, 'speed': 2.0}
+    with pytest.raises(ValueError):
+        parse_url('synth:tone?bogus=1')
+
+
+def test_block_size_and_looping():
+    f = SynthAudioFile(duration=2.5, samplerate=1000, channels=2,
+                       block_frames=300, frequency=50)
+    blocks = list(f)
+    assert [len(b) for b in blocks[:-1]] == [1200] * (len(blocks) - 1)
+    data = b''.join(blocks)
+    assert len(data) == 2500 * 4
+    # The tone repeats every second, and both channels are the same.
+    assert data[:4000] == data[4000:8000]
+    samples = struct.unpack('<5000h', data)
+    assert samples[0::2] == samples[1::2]
+    assert max(samples) == pytest.approx(0.5 * 32767, abs=2)
+
+
+def test_deterministic_noise():
+    def noise(seed):
+        return b''.join(SynthAudioFile(signal='noise', seed=seed,
+                                       duration=0.1))
+    assert noise(1) == noise(1)
+    assert noise(1) != noise(2)
+    silence = b''.join(SynthAudioFile(signal='silence', duration=0.1))
+    assert not any(silence)
+
+
+def test_works_with_wrappers():
+    with SynthAudioFile(duration=1.0, samplerate=1000, channels=1) as f:
+        windows = list(reblock(f, 256))
+    assert len(windows) == 3
+
+
+def test_speed():
+    f = SynthAudioFile(duration=0.2, samplerate=1000, block_frames=50,
+                       speed=2.0)
+    start = time.monotonic()
+    list(f)
+    # The last block is due after 0.15 seconds of audio at twice realtime.
+    assert time.monotonic() - start >= 0.07
+
+
+def test_close_stops_generation():
+    f = SynthAudioFile(duration=10.0)
+    it = iter(f)
+    next(it)
+    f.close()
+    assert list(it) == []
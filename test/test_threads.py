@@ -0,0 +1,45 @@
+import concurrent.futures
+import threading
+
+import audioread
+from audioread import rawread
+
+
+def test_concurrent_backend_detection(monkeypatch):
+    calls = []
+    detect = audioread._detect_backends
+
+    def counting_detect():
+        calls.append(threading.get_ident())
+        return detect()
+
+    monkeypatch.setattr(audioread, '_detect_backends', counting_detect)
+    monkeypatch.setattr(audioread, 'BACKENDS', [])
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: list(audioread.available_backends()),
+                                range(32)))
+    assert len(calls) == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_concurrent_decoding(wav):
+    path, data = wav
+
+    def decode(i):
+        if i % 4 == 0:
+            audioread.available_backends(flush_cache=True)
+        with audioread.audio_open(path, [rawread.RawAudioFile]) as f:
+            return b''.join(f)
+
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        assert all(out == data for out in pool.map(decode, range(64)))
+
+
+def test_flush_does_not_change_earlier_results(monkeypatch):
+    monkeypatch.setattr(audioread, 'BACKENDS', [])
+    first = audioread.available_backends()
+    snapshot = list(first)
+    second = audioread.available_backends(flush_cache=True)
+    assert second is not first
+    assert first == snapshot
+    assert audioread.available_backends() is second